@@ -13,6 +13,9 @@ except PackageNotFoundError:  # pragma: no cover
     except ImportError:
         __version__ = "0.0.0"
 
+# Bundled SHACL profile used if no --profile is given (see voc4cat/profile).
+DEFAULT_PROFILE = "vp4cat-5.2"
+
 # Note that nothing is passed to getLogger to set the "root" logger
 logger = logging.getLogger()
 
@@ -15,10 +15,14 @@ from enum import Enum
 from pathlib import Path
 
 import click
-from Levenshtein import ratio
+import numpy as np
+from rapidfuzz.distance import Indel
+from rapidfuzz.process import cdist
 from rdflib import RDF, SKOS, Graph
 from sentence_transformers import SentenceTransformer
-from torch import Tensor
+
+from voc4cat.embedding_cache import EmbeddingCache
+from voc4cat.label_index import LabelIndex, normalise_label
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -30,6 +34,16 @@ base_url = "http://127.0.0.1:5500/voc4cat-outbox_2025-04-16T0925_run14489333337/
 # In-development base URL for voc4cat
 base_url = "https://nfdi4cat.github.io/voc4cat/dev/voc4cat/index.html#"
 
+# Number of query labels scored at once; bounds the memory of a score block.
+LEVENSHTEIN_BLOCK_SIZE = 1000
+# Number of definitions encoded per forward pass of the model.
+ENCODE_BATCH_SIZE = 64
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+# Number of most similar labels reported per label (sbert)
+DEFAULT_TOP_K = 10
+# Rows/columns of one block of the cosine matrix (tile_size**2 floats in memory)
+DEFAULT_TILE_SIZE = 2048
+
 
 class Problem(Enum):
     """Enumeration for concept issues."""
@@ -103,11 +117,109 @@ def load_vocab(ttl_file: Path) -> dict:
     return concepts
 
 
+def levenshtein_pairs(
+    queries: list[str],
+    choices: list[str] | None,
+    threshold: float,
+    block_size: int = LEVENSHTEIN_BLOCK_SIZE,
+):
+    """
+    Yield (query index, choice index, ratio) for pairs with ratio > threshold.
+
+    The ratio is that of ``Levenshtein.ratio`` of the labels normalised with
+    ``normalise_label``. If choices is None, the queries are compared with each
+    other and each pair is yielded once (query index < choice index).
+
+    Candidates for each block of queries are looked up in a ``LabelIndex`` of
+    the choices. Only these are scored, with rapidfuzz's ``cdist`` on all CPU
+    cores; pairs below the threshold are cut off early.
+    """
+    within = choices is None
+    index = LabelIndex()
+    for choice in queries if within else choices:
+        index.add("", choice)
+    # The index holds the normalised labels.
+    queries, choices = [normalise_label(query) for query in queries], index.texts
+    for start in range(0, len(queries), block_size):
+        block = queries[start : start + block_size]
+        candidates = sorted(
+            {cj for query in block for cj in index.candidates(query, threshold)}
+        )
+        if within:
+            # Within the queries only the upper triangle is scored.
+            candidates = [cj for cj in candidates if cj > start]
+        if not candidates:
+            continue
+        scores = cdist(
+            block,
+            [choices[cj] for cj in candidates],
+            scorer=Indel.normalized_similarity,
+            score_cutoff=threshold,
+            workers=-1,
+        )
+        for qi, ci in zip(*np.nonzero(scores > threshold)):
+            cj = candidates[ci]
+            if not within or start + qi < cj:
+                yield start + int(qi), cj, float(scores[qi, ci])
+
+
+def top_k_similar(  # noqa: PLR0913
+    queries: np.ndarray,
+    choices: np.ndarray,
+    *,
+    query_groups: np.ndarray,
+    choice_groups: np.ndarray,
+    k: int = DEFAULT_TOP_K,
+    threshold: float = 0.0,
+    tile_size: int = DEFAULT_TILE_SIZE,
+):
+    """
+    Yield (query index, choice index, score) for the k best matches per query.
+
+    queries and choices are normalised embeddings, so the score is the cosine
+    similarity. Only scores above threshold are kept, and a query is never
+    matched with a choice of the same group (e.g. labels of the same concept).
+    The cosine matrix is computed in tiles of tile_size x tile_size.
+
+    Raises:
+        ValueError: If k or tile_size is less than 1.
+    """
+    if k < 1 or tile_size < 1:
+        msg = f"k and tile_size must be at least 1, got {k} and {tile_size}."
+        raise ValueError(msg)
+    for start in range(0, len(queries), tile_size):
+        block = queries[start : start + tile_size]
+        groups = query_groups[start : start + tile_size, None]
+        best_scores = np.full((len(block), 0), -np.inf, dtype=np.float32)
+        best_idx = np.empty((len(block), 0), dtype=np.intp)
+        for col in range(0, len(choices), tile_size):
+            scores = block @ choices[col : col + tile_size].T
+            scores[groups == choice_groups[None, col : col + tile_size]] = -np.inf
+            scores[scores <= threshold] = -np.inf
+            cols = np.broadcast_to(np.arange(col, col + scores.shape[1]), scores.shape)
+            best_scores = np.hstack((best_scores, scores))
+            best_idx = np.hstack((best_idx, cols))
+            if best_scores.shape[1] > k:
+                keep = np.argpartition(-best_scores, k - 1, axis=1)[:, :k]
+                best_scores = np.take_along_axis(best_scores, keep, axis=1)
+                best_idx = np.take_along_axis(best_idx, keep, axis=1)
+        for qi, cj in zip(*np.nonzero(best_scores > -np.inf)):
+            yield start + int(qi), int(best_idx[qi, cj]), float(best_scores[qi, cj])
+
+
 class CompareVocabularies:
     """Compare vocabularies using Sentence Transformers and Levenshtein ratio."""
 
-    def __init__(self, vocab_new: Path, vocab_base: Path | None = None) -> None:
-        """Initialize the CompareVocabularies class."""
+    def __init__(
+        self,
+        vocab_new: Path,
+        vocab_base: Path | None = None,
+        cache_dir: Path | None = None,
+    ) -> None:
+        """Initialize the CompareVocabularies class.
+
+        If cache_dir is given, embeddings are cached on disk in this directory.
+        """
         self.vocab_new_src = vocab_new
         self.vocab_new = load_vocab(vocab_new)
         self.vocab_base_src = vocab_base
@@ -122,122 +234,212 @@ class CompareVocabularies:
             i for i, uri in enumerate(self.vocab_new) if uri in self.added_concepts
         ]
         self.model = None
+        self.cache_dir = cache_dir
+        self.cache = None
+        # Normalised definition embeddings (one row per concept of vocab_new)
+        self.definition_embeddings = None
+        self.definition_row = {}
 
         logger.info("Known concepts    : %d", len(self.vocab_base))
         logger.info("Submitted concepts: %d", len(self.vocab_new))
         logger.info("New concepts added: %d", len(self.added_concepts))
         logger.debug("idx of new concepts: %s", self.idx_new)
 
-    def get_similarities_sbert(self, sentences, model="all-MiniLM-L6-v2") -> Tensor:
+    def load_model(self, model=DEFAULT_MODEL) -> SentenceTransformer:
+        """Load the Sentence Transformers model (once)."""
+        if self.model is None:
+            self.model = SentenceTransformer(model)
+            logger.debug("model %s loaded.", model)
+            if self.cache_dir is not None:
+                self.cache = EmbeddingCache(self.cache_dir, model)
+        return self.model
+
+    def encode(self, sentences, batch_size=ENCODE_BATCH_SIZE) -> np.ndarray:
+        """Return normalised embeddings; only sentences not in the cache are encoded."""
+
+        def encode_func(texts):
+            return self.model.encode(
+                texts,
+                batch_size=batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+            )
+
+        self.load_model()
+        if self.cache is None:
+            return encode_func(sentences)
+        return self.cache.encode(sentences, encode_func)
+
+    def save_cache(self) -> None:
+        """Write the embedding cache to disk (if used)."""
+        if self.cache is not None:
+            self.cache.save()
+
+    def get_similarities_sbert(  # noqa: PLR0913
+        self,
+        sentences,
+        query_idx: list[int],
+        base_idx: list[int],
+        *,
+        groups: list,
+        threshold: float,
+        top_k: int = DEFAULT_TOP_K,
+        tile_size: int = DEFAULT_TILE_SIZE,
+    ) -> list[tuple[int, int, float]]:
         """
         Determine similarity using Sentence Transformers.
 
+        For each sentence in query_idx (new concepts) the top_k most similar
+        sentences in base_idx and query_idx with a cosine similarity above
+        threshold are determined. Sentences of the same group (concept) are
+        not compared. Only the rectangular query x (base + query) part of the
+        cosine matrix is computed, in blocks of tile_size x tile_size, so
+        memory does not grow quadratically.
+
         Documentation: https://sbert.net/
         Publication: https://arxiv.org/abs/1908.10084
+
+        Returns:
+            Sparse list of (index, similar index, similarity). Pairs found for
+            both sentences are listed once.
         """
         logger.debug("Entering get_similarities_sbert method.")
-        if self.model is None:
-            # Load the model
-            self.model = SentenceTransformer(model)
-            logger.debug("model %s loaded.", model)
-        # Compute embeddings
-        embeddings = self.model.encode(sentences)
+        # Compute (normalised) embeddings
+        embeddings = self.encode(sentences)
         logger.debug("Embeddings calculated.")
-        # Compute cosine similarities
-        similarities = self.model.similarity(embeddings, embeddings)
+        group_ids = {group: n for n, group in enumerate(dict.fromkeys(groups))}
+        group_array = np.array([group_ids[group] for group in groups])
+        is_query = set(query_idx)
+        choice_idx = base_idx + query_idx
+        pairs = {}
+        for qi, cj, score in top_k_similar(
+            embeddings[query_idx],
+            embeddings[choice_idx],
+            query_groups=group_array[query_idx],
+            choice_groups=group_array[choice_idx],
+            k=top_k,
+            threshold=threshold,
+            tile_size=tile_size,
+        ):
+            i, j = query_idx[qi], choice_idx[cj]
+            # List similarity between two query sentences once (A-B, not B-A)
+            pairs[(j, i) if j in is_query and j < i else (i, j)] = score
         logger.debug("sbert similarities calculated.")
-        return similarities
+        return [(i, j, score) for (i, j), score in pairs.items()]
+
+    def encode_definitions(self, batch_size=ENCODE_BATCH_SIZE) -> None:
+        """Encode the definitions of all concepts in batches.
 
-    def get_similarities_levenshtein(self, sentences) -> list:
+        The embeddings are normalised, so the cosine similarity of two
+        definitions is the dot product of their rows.
+        """
+        self.load_model()
+        self.definition_row = {id_: i for i, id_ in enumerate(self.vocab_new)}
+        self.definition_embeddings = self.encode(
+            [concept.definition for concept in self.vocab_new.values()],
+            batch_size=batch_size,
+        )
+        logger.debug("Definition embeddings calculated.")
+
+    def get_definition_similarity(self, id_i: str, id_j: str) -> float:
+        """Return the cosine similarity of the definitions of two concepts."""
+        if self.definition_embeddings is None:
+            self.encode_definitions()
+        return float(
+            np.dot(
+                self.definition_embeddings[self.definition_row[id_i]],
+                self.definition_embeddings[self.definition_row[id_j]],
+            )
+        )
+
+    def get_similarities_levenshtein(
+        self, sentences, query_idx: list[int], base_idx: list[int], threshold: float
+    ) -> list[tuple[int, int, float]]:
         """
         Determine Levenshtein similarity after normalising terms.
 
         Normalisation includes stripping whitespace, converting to lowercase,
-        and replacing hyphens with spaces.
+        and replacing hyphens with spaces. The sentences in query_idx (new
+        concepts) are compared to the sentences in base_idx and to each other.
+
+        Returns:
+            Sparse list of (index, similar index, ratio) for all pairs with a
+            ratio above threshold. Pairs of two query sentences are listed once.
         """
         logger.debug("Entering get_similarities_levenshtein method.")
-        sentences = [s.strip().lower().replace("-", " ") for s in sentences]
-        similarities: list = []
-        for i, sentence1 in enumerate(sentences):
-            similarities.append([])
-            for j, sentence2 in enumerate(sentences):
-                if i >= j:
-                    similarities[i].append(-1)
-                else:
-                    similarities[i].append(ratio(sentence1, sentence2))
+        queries = [sentences[i] for i in query_idx]
+        pairs = [
+            (query_idx[qi], base_idx[bj], score)
+            for qi, bj, score in levenshtein_pairs(
+                queries, [sentences[j] for j in base_idx], threshold
+            )
+        ]
+        pairs += [
+            (query_idx[qi], query_idx[qj], score)
+            for qi, qj, score in levenshtein_pairs(queries, None, threshold)
+        ]
         logger.debug("Levenshtein similarities calculated.")
-        return similarities
+        return pairs
 
     def find_similarities(
-        self, labeled_sentences, similarities, thresholds, compare_all
+        self, labeled_sentences, candidate_pairs, threshold_definitions
     ):
         """
         Find and print similarities between new concepts and existing concepts.
+
+        candidate_pairs are (index, similar index, label similarity) tuples
+        referring to the sentences in labeled_sentences.
         """
-        threshold_labels, threshold_definitions = thresholds
         sentences = list(labeled_sentences.values())
         keys = list(labeled_sentences.keys())
         reportable_similarities = []
-        for idx_i, sentence1 in enumerate(sentences):
-            # Only list similarities for new concepts
-            if (not compare_all) or (idx_i not in self.idx_new):
+        for idx_i, idx_j, label_similarity in sorted(candidate_pairs):
+            id_i = keys[idx_i][0]
+            id_j = keys[idx_j][0]
+            if id_i == id_j:  # same concept
                 continue
-            for idx_j, sentence2 in enumerate(sentences):
-                if idx_i == idx_j:
-                    continue
-                # Skip listing similarity between two new concepts twice (A-B and B-A)
-                if idx_j in self.idx_new and idx_i >= idx_j:
-                    continue
-                if similarities[idx_i][idx_j] > threshold_labels:
-                    id_i = keys[idx_i][0]
-                    id_j = keys[idx_j][0]
-                    if id_i == id_j:  # same concept
-                        continue
-                    # Check how similar the definitions are (using Sentence Transformers)
-                    pair_definition_similarity = float(
-                        self.get_similarities_sbert(
-                            [
-                                self.vocab_new[id_i].definition,
-                                self.vocab_new[id_j].definition,
-                            ]
-                        )[0][1]
-                    )
-                    if pair_definition_similarity < threshold_definitions:
-                        continue
-                    # Check if the concepts have the same broader concept (set intersection)
-                    have_same_broader_concept = bool(
-                        set(self.vocab_new[id_i].parents)
-                        & set(self.vocab_new[id_j].parents)
-                    )
-                    logger.debug(
-                        "%s (%s) - %s (%s): %.4f",
-                        sentence1,
-                        id_i,
-                        sentence2,
-                        id_j,
-                        similarities[idx_i][idx_j],
-                    )
-                    reportable_similarities.append(
-                        ConceptSimilarity(
-                            concept_id=id_i,
-                            sentence_key=keys[idx_i],
-                            similar_concept_id=id_j,
-                            similar_sentence_key=keys[idx_j],
-                            similarity_score=float(similarities[idx_i][idx_j]),
-                            definition_similarity_score=pair_definition_similarity,
-                            have_same_broader_concept=have_same_broader_concept,
-                        )
-                    )
+            # Check how similar the definitions are (using Sentence Transformers)
+            pair_definition_similarity = self.get_definition_similarity(id_i, id_j)
+            if pair_definition_similarity < threshold_definitions:
+                continue
+            # Check if the concepts have the same broader concept (set intersection)
+            have_same_broader_concept = bool(
+                set(self.vocab_new[id_i].parents) & set(self.vocab_new[id_j].parents)
+            )
+            logger.debug(
+                "%s (%s) - %s (%s): %.4f",
+                sentences[idx_i],
+                id_i,
+                sentences[idx_j],
+                id_j,
+                label_similarity,
+            )
+            reportable_similarities.append(
+                ConceptSimilarity(
+                    concept_id=id_i,
+                    sentence_key=keys[idx_i],
+                    similar_concept_id=id_j,
+                    similar_sentence_key=keys[idx_j],
+                    similarity_score=float(label_similarity),
+                    definition_similarity_score=pair_definition_similarity,
+                    have_same_broader_concept=have_same_broader_concept,
+                )
+            )
         return reportable_similarities
 
-    def compare_concept_labels(
+    def compare_concept_labels(  # noqa: PLR0913
         self,
         method,
         include_alt_labels,
         threshold_labels,
         threshold_definitions,
         compare_all,  # true=compare all concepts, false=just new ones
+        *,
+        top_k=DEFAULT_TOP_K,
+        tile_size=DEFAULT_TILE_SIZE,
     ) -> dict:
+        # Encode all definitions in one batched pass (used for each candidate pair)
+        self.encode_definitions()
         new_vocab_labels = {
             (k, "pref_label"): v.pref_label.strip() for k, v in self.vocab_new.items()
         }
@@ -249,12 +451,30 @@ class CompareVocabularies:
                     new_vocab_alt_labels[(k, f"altLabel-{i}")] = alt_label
             new_vocab_labels.update(new_vocab_alt_labels)
         sentences = list(new_vocab_labels.values())
+        # Compare the labels of new concepts (or all if compare_all is set)
+        # with those of the base vocabulary and with each other.
+        query_idx, base_idx = [], []
+        for i, key in enumerate(new_vocab_labels):
+            if compare_all or key[0] in self.added_concepts:
+                query_idx.append(i)
+            else:
+                base_idx.append(i)
         if method == "sbert":
             # Use Sentence Transformers for semantic similarity
-            similarities = self.get_similarities_sbert(sentences)
+            candidate_pairs = self.get_similarities_sbert(
+                sentences,
+                query_idx,
+                base_idx,
+                groups=[key[0] for key in new_vocab_labels],
+                threshold=threshold_labels,
+                top_k=top_k,
+                tile_size=tile_size,
+            )
         elif method == "levenshtein":
             # Use Levenshtein ratio for string similarity
-            similarities = self.get_similarities_levenshtein(sentences)
+            candidate_pairs = self.get_similarities_levenshtein(
+                sentences, query_idx, base_idx, threshold_labels
+            )
         else:
             msg = f"Unknown method: {method}"
             raise ValueError(msg)
@@ -265,10 +485,7 @@ class CompareVocabularies:
             "threshold_definitions": threshold_definitions,
             "compare_all": compare_all,
             "data": self.find_similarities(
-                new_vocab_labels,
-                similarities,
-                thresholds=(threshold_labels, threshold_definitions),
-                compare_all=compare_all,
+                new_vocab_labels, candidate_pairs, threshold_definitions
             ),
         }
 
@@ -442,24 +659,48 @@ def cli():
     help="Threshold for definition similarity",
     default=0.8,
 )
-def find_similarities_in_one_vocab(
+@click.option(
+    "--cache-dir",
+    type=Path,
+    help="Directory to cache embeddings in (only new texts get encoded)",
+    default=None,
+)
+@click.option(
+    "--top-k",
+    type=click.IntRange(min=1),
+    help="Number of most similar labels to report per label (sbert)",
+    default=DEFAULT_TOP_K,
+)
+@click.option(
+    "--tile-size",
+    type=click.IntRange(min=1),
+    help="Block size for computing label similarities (sbert); lower it to save memory",
+    default=DEFAULT_TILE_SIZE,
+)
+def find_similarities_in_one_vocab(  # noqa: PLR0913, PLR0917 (one parameter per click option)
     vocab_src: Path,
     method: str,
     include_alt_labels: bool,
     threshold_labels: float,
     threshold_defs: float,
+    cache_dir: Path | None,
+    top_k: int,
+    tile_size: int,
 ) -> None:
     """Find similarities between concepts in a single vocabulary."""
     logger.info("Finding similarities in vocabulary: %s", vocab_src)
     # Add logic for finding similarities here
-    vocab = CompareVocabularies(vocab_src)
+    vocab = CompareVocabularies(vocab_src, cache_dir=cache_dir)
     results = vocab.compare_concept_labels(
         method,
         include_alt_labels,
         threshold_labels=threshold_labels,
         threshold_definitions=threshold_defs,
         compare_all=True,
+        top_k=top_k,
+        tile_size=tile_size,
     )
+    vocab.save_cache()
     vocab.markdown_report(results)
 
 
@@ -487,13 +728,41 @@ def find_similarities_in_one_vocab(
     help="Threshold for definition similarity",
     default=0.8,
 )
-def compare_vocabularies(
+@click.option(
+    "--cache-dir",
+    type=Path,
+    help="Directory to cache embeddings in (only new texts get encoded)",
+    default=None,
+)
+@click.option(
+    "--top-k",
+    type=click.IntRange(min=1),
+    help="Number of most similar labels to report per label (sbert)",
+    default=DEFAULT_TOP_K,
+)
+@click.option(
+    "--tile-size",
+    type=click.IntRange(min=1),
+    help="Block size for computing label similarities (sbert); lower it to save memory",
+    default=DEFAULT_TILE_SIZE,
+)
+@click.option(
+    "--all-pairs",
+    is_flag=True,
+    help="Compare all concepts with each other, not only the added ones",
+    default=False,
+)
+def compare_vocabularies(  # noqa: PLR0913, PLR0917 (one parameter per click option)
     vocab_src: Path,
     vocab_new_src: Path,
     method: str,
     include_alt_labels: bool,
     threshold_labels: float,
     threshold_defs: float,
+    cache_dir: Path | None,
+    top_k: int,
+    tile_size: int,
+    all_pairs: bool,
 ) -> None:
     """Compare two vocabularies and check additions for similarity with existing concepts."""
     logger.info(
@@ -501,14 +770,17 @@ def compare_vocabularies(
         vocab_new_src,
         vocab_src,
     )
-    vocab_old_new = CompareVocabularies(vocab_new_src, vocab_src)
+    vocab_old_new = CompareVocabularies(vocab_new_src, vocab_src, cache_dir=cache_dir)
     results = vocab_old_new.compare_concept_labels(
         method,
         include_alt_labels,
         threshold_labels=threshold_labels,
         threshold_definitions=threshold_defs,
-        compare_all=False,
+        compare_all=all_pairs,
+        top_k=top_k,
+        tile_size=tile_size,
     )
+    vocab_old_new.save_cache()
     vocab_old_new.markdown_report(results)
 
 
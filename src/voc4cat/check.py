@@ -5,22 +5,37 @@ from pathlib import Path
 
 import openpyxl
 from openpyxl.styles import PatternFill
+from rdflib import Graph
 
 from voc4cat import config
 from voc4cat.checks import (
     Voc4catError,
+    check_broader_cycles,
+    check_duplicate_labels,
     check_for_removed_iris,
     check_hierarchical_redundancy,
     check_number_of_files_in_inbox,
     validate_vocabulary_files_for_ci_workflow,
 )
 from voc4cat.convert import (
-    DEFAULT_PROFILE,
     get_bundled_profiles,
+    get_effective_profile,
+    load_vocab_graph,
     resolve_profile,
     validate_with_profile,
 )
-from voc4cat.models_v1 import CONCEPTS_READ_CONFIG, CONCEPTS_SHEET_NAME, ConceptV1
+from voc4cat.incremental import get_focus_nodes, load_base_graph
+from voc4cat.models_v1 import (
+    COLLECTIONS_READ_CONFIG,
+    COLLECTIONS_SHEET_NAME,
+    CONCEPTS_READ_CONFIG,
+    CONCEPTS_SHEET_NAME,
+    MAPPINGS_READ_CONFIG,
+    MAPPINGS_SHEET_NAME,
+    CollectionV1,
+    ConceptV1,
+    MappingV1,
+)
 from voc4cat.transform import join_split_turtle
 from voc4cat.utils import (
     EXCEL_FILE_ENDINGS,
@@ -35,64 +50,45 @@ from voc4cat.xlsx_common import (
 logger = logging.getLogger(__name__)
 
 
-def check_xlsx(fpath: Path, outfile: Path) -> int:
-    """
-    Complex checks of the xlsx file not handled by pydantic model validation
+# Sheets checked for unique IRIs: (sheet, model, read config, entity, key columns)
+# The key columns are IRI and language for concepts/collections and only the
+# IRI for mappings.
+UNIQUE_IRI_SHEETS = (
+    (CONCEPTS_SHEET_NAME, ConceptV1, CONCEPTS_READ_CONFIG, "Concept", 2),
+    (COLLECTIONS_SHEET_NAME, CollectionV1, COLLECTIONS_READ_CONFIG, "Collection", 2),
+    (MAPPINGS_SHEET_NAME, MappingV1, MAPPINGS_READ_CONFIG, "Concept", 1),
+)
 
-    Checks/validation implemented here need/use information from several rows
-    and can therefore not be easily done in models.py with pydantic.
-    However, SHACL validation does also catch the problem, at least in pre-
-    liminary testing. So this function may get removed later. Doing the check
-    in xlsx has the advantage that the cell position can be added to the
-    validation message which would not work with SHACL validation.
 
-    For concepts:
-    - The "Concept IRI" must be unique. However, it can be present in several
-      rows as long as the languages in the rows with the same IRI are
-      different. This condition is fulfilled when no language is used more
-      than once per concept.
-    """
-    logger.debug("Running check of Concepts sheet for file %s", fpath)
-    wb = openpyxl.load_workbook(fpath)
-    ws = wb["Concepts"]
-    color = PatternFill("solid", start_color="00FFCC00")  # orange
-
-    # Calculate data start row dynamically using xlsx-pydantic infrastructure
-    field_analyses = XLSXFieldAnalyzer.analyze_model(ConceptV1)
-    fields = list(field_analyses.values())
-    row_calculator = XLSXRowCalculator(CONCEPTS_READ_CONFIG)
-    data_start_row = row_calculator.get_data_start_row(fields)
+def _find_duplicate_iris(ws, data_start_row: int, entity: str, n_cols: int) -> set:
+    """Scan a sheet for IRIs used more than once (per language).
 
+    Returns the numbers of all rows involved in a duplicate.
+    """
+    first_row = {}  # (IRI, lang) or (IRI,) -> first row with this key
+    marked_rows = set()
     subsequent_empty_rows = 0
-    seen_concept_iris = []
-    failed_checks = 0
-    # v1.0 template: data starts after header row, columns are IRI(A), Language(B)
-    for row in ws.iter_rows(min_row=data_start_row, max_col=2):  # pragma: no branch
-        if row[0].value and row[1].value:
-            concept_iri, lang = (
-                c.value.strip() if c.value is not None else "" for c in row
-            )
-            # Check that IRI is valid.
-            #            config.IDRANGES
-            # Check that IRI is used for exactly one concept.
-            new_concept_iri = f'"{concept_iri}"@{lang.lower()}'
-            if new_concept_iri in seen_concept_iris:
-                failed_checks += 1
-                msg = (
-                    f'Same Concept IRI "{concept_iri}" used more than once for '
-                    f'language "{lang}"'
-                )
+    rows = ws.iter_rows(min_row=data_start_row, max_col=n_cols, values_only=True)
+    for row_no, values in enumerate(rows, start=data_start_row):
+        if len(values) == n_cols and all(values):
+            key = tuple(str(v).strip() for v in values)
+            if n_cols > 1:
+                key = (key[0], key[1].lower())
+            if key in first_row:
+                if n_cols > 1:
+                    msg = (
+                        f'Same {entity} IRI "{key[0]}" used more than once for '
+                        f'language "{str(values[1]).strip()}"'
+                    )
+                else:
+                    msg = (
+                        f'Same {entity} IRI "{key[0]}" used more than once in '
+                        f'sheet "{ws.title}"'
+                    )
                 logger.error(msg)
-                # colorize problematic cells (columns A and B for IRI and Language)
-                row[0].fill = color
-                row[1].fill = color
-                previously_seen_in_row = data_start_row + seen_concept_iris.index(
-                    new_concept_iri
-                )
-                ws[f"A{previously_seen_in_row}"].fill = color
-                ws[f"B{previously_seen_in_row}"].fill = color
+                marked_rows.update((row_no, first_row[key]))
             else:
-                seen_concept_iris.append(new_concept_iri)
+                first_row[key] = row_no
 
             subsequent_empty_rows = 0
 
@@ -100,21 +96,69 @@ def check_xlsx(fpath: Path, outfile: Path) -> int:
         elif subsequent_empty_rows < 2:  # noqa: PLR2004
             subsequent_empty_rows += 1
         else:
-            subsequent_empty_rows = 0
             break
+    return marked_rows
+
+
+def check_xlsx(fpath: Path, outfile: Path) -> None:
+    """
+    Complex checks of the xlsx file not handled by pydantic model validation
 
-    if failed_checks:
-        wb.save(outfile)
-        logger.info("-> Saved file with highlighted errors as %s", outfile)
-        # Extend size (length) of tables in all sheets
-        adjust_all_tables_length(
-            outfile,
-            rows_pre_allocated=config.xlsx_rows_pre_allocated,
-            active_sheet=CONCEPTS_SHEET_NAME,
-        )
+    Checks/validation implemented here need/use information from several rows
+    and can therefore not be easily done in models.py with pydantic.
+    However, SHACL validation does also catch the problem, at least in pre-
+    liminary testing. So this function may get removed later. Doing the check
+    in xlsx has the advantage that the cell position can be added to the
+    validation message which would not work with SHACL validation.
+
+    For concepts and collections:
+    - The IRI must be unique. However, it can be present in several
+      rows as long as the languages in the rows with the same IRI are
+      different. This condition is fulfilled when no language is used more
+      than once per concept/collection.
+
+    For mappings:
+    - The "Concept IRI" must be unique.
+
+    The workbook is scanned in read-only mode. Only if problems are found it
+    is loaded again to highlight the problematic cells and saved as outfile.
+    """
+    logger.debug("Running check of xlsx sheets for file %s", fpath)
+    marked = {}  # sheet name -> (rows to highlight, number of key columns)
+    wb = openpyxl.load_workbook(fpath, read_only=True)
+    try:
+        for sheet, model, read_config, entity, n_cols in UNIQUE_IRI_SHEETS:
+            if sheet not in wb.sheetnames:
+                continue
+            # Calculate data start row dynamically using xlsx-pydantic infrastructure
+            fields = list(XLSXFieldAnalyzer.analyze_model(model).values())
+            data_start_row = XLSXRowCalculator(read_config).get_data_start_row(fields)
+            rows = _find_duplicate_iris(wb[sheet], data_start_row, entity, n_cols)
+            if rows:
+                marked[sheet] = (rows, n_cols)
+    finally:
+        wb.close()
+
+    if not marked:
+        logger.info("-> xlsx check passed for file: %s", fpath)
         return
 
-    logger.info("-> xlsx check passed for file: %s", fpath)
+    wb = openpyxl.load_workbook(fpath)
+    color = PatternFill("solid", start_color="00FFCC00")  # orange
+    for sheet, (rows, n_cols) in marked.items():
+        ws = wb[sheet]
+        for row_no in rows:
+            # colorize problematic cells (IRI and Language columns)
+            for col in range(1, n_cols + 1):
+                ws.cell(row=row_no, column=col).fill = color
+    wb.save(outfile)
+    logger.info("-> Saved file with highlighted errors as %s", outfile)
+    # Extend size (length) of tables in all sheets
+    adjust_all_tables_length(
+        outfile,
+        rows_pre_allocated=config.xlsx_rows_pre_allocated,
+        active_sheet=CONCEPTS_SHEET_NAME,
+    )
 
 
 def ci_post(args):
@@ -139,7 +183,7 @@ def ci_post(args):
                 new.name,
             )
             continue
-        check_for_removed_iris(prev, new)
+        check_for_removed_iris(prev, new, report_changes=args.report_changes)
         logger.info("-> Check ci-post passed.")
 
 
@@ -161,6 +205,49 @@ def _check_ci_args(args):
         raise Voc4catError(msg)
 
 
+def _validate_rdf_file(file: Path, graph: Graph, profile: str, args) -> None:
+    """Validate an RDF file, optionally only where it changed (--incremental-from)."""
+    base = getattr(args, "incremental_from", None)
+    base_graph = load_base_graph(file, base) if base else None
+    if base is not None and base_graph is None:
+        logger.info("No previous version of %s found; validating all.", file)
+    validate_with_profile(
+        graph,
+        profile=profile,
+        error_level=args.fail_at_level,
+        focus_nodes=None if base_graph is None else get_focus_nodes(base_graph, graph),
+        quick=args.quick,
+    )
+
+
+def _log_broader_cycles(all_cycles: dict) -> None:
+    logger.info("Checking for cycles in skos:broader.")
+    if not all_cycles:
+        logger.info("-> No cycles in skos:broader detected.")
+        return
+    for file, cycles in all_cycles.items():
+        logger.error("File: %s", file.name)
+        for cycle in cycles:
+            logger.error("  Cycle in skos:broader: %s", " -> ".join(cycle))
+    total = sum(len(c) for c in all_cycles.values())
+    logger.error("Total: %d cycle(s) in skos:broader", total)
+
+
+def _log_duplicate_labels(all_duplicates: dict) -> None:
+    logger.info("Checking for labels used by more than one concept.")
+    if not all_duplicates:
+        logger.info("-> No duplicate labels detected.")
+        return
+    for file, duplicates in all_duplicates.items():
+        logger.error("File: %s", file.name)
+        for label, lang, concepts in duplicates:
+            logger.error(
+                '  Label "%s"@%s used by: %s', label, lang, ", ".join(concepts)
+            )
+    total = sum(len(d) for d in all_duplicates.values())
+    logger.error("Total: %d label(s) used by more than one concept", total)
+
+
 def check(args):
     logger.debug("Check subcommand started!")
 
@@ -226,43 +313,31 @@ def check(args):
 
     # validate rdf files with profile/pyshacl
     all_redundancies = {}  # file -> list of redundancies
+    all_cycles = {}  # file -> list of cycles
+    all_duplicates = {}  # file -> list of duplicate labels
     for file in rdf_files:
         logger.debug("Running SHACL validation for file %s", file)
-        # Priority: CLI --profile (highest) > config profile_local_path > default
-        # If user explicitly set --profile (not default), use it
-        user_set_profile = args.profile != DEFAULT_PROFILE
-        if user_set_profile:
-            effective_profile = args.profile
-        else:
-            # Check config for vocab-specific profile
-            vocab_name = file.stem.lower()
-            vocab_config = config.IDRANGES.vocabs.get(vocab_name)
-            if (
-                vocab_config
-                and vocab_config.profile_local_path
-                and config.IDRANGES_PATH
-            ):
-                effective_profile = str(
-                    (
-                        config.IDRANGES_PATH.parent / vocab_config.profile_local_path
-                    ).resolve()
-                )
-            else:
-                effective_profile = args.profile  # default
-        validate_with_profile(
-            str(file),
-            profile=effective_profile,
-            error_level=args.fail_at_level,
-        )
+        # Parse once for validation and the hierarchy checks.
+        graph = load_vocab_graph(file)
+        effective_profile = get_effective_profile(file.stem.lower(), args.profile)
+        _validate_rdf_file(file, graph, effective_profile, args)
         # Get profile name for log message
         _, profile_name = resolve_profile(effective_profile)
         logger.info("-> The file is valid according to the %s profile.", profile_name)
 
         # Check for redundant hierarchical relationships if requested
         if args.redundant_hierarchies:
-            redundancies = check_hierarchical_redundancy(file)
+            redundancies = check_hierarchical_redundancy(file, graph)
             if redundancies:
                 all_redundancies[file] = redundancies
+        if args.broader_cycles:
+            cycles = check_broader_cycles(file, graph)
+            if cycles:
+                all_cycles[file] = cycles
+        if args.duplicate_labels:
+            duplicates = check_duplicate_labels(file, graph)
+            if duplicates:
+                all_duplicates[file] = duplicates
 
     # Report all redundant hierarchical relationships at the end
     if args.redundant_hierarchies:
@@ -284,3 +359,9 @@ def check(args):
             logger.error("Total: %d redundant relationship(s) to remove", total)
         else:
             logger.info("-> No redundant hierarchical relationships detected.")
+
+    if args.broader_cycles:
+        _log_broader_cycles(all_cycles)
+
+    if args.duplicate_labels:
+        _log_duplicate_labels(all_duplicates)
@@ -13,14 +13,13 @@ from curies import Converter
 from rdflib import RDF, SKOS, Graph, compare
 
 from voc4cat import config
+from voc4cat.errors import Voc4catError
+from voc4cat.hierarchy import HierarchyIndex
+from voc4cat.label_index import LabelIndex
 
 logger = logging.getLogger(__name__)
 
 
-class Voc4catError(Exception):
-    pass
-
-
 def validate_config_has_idrange(vocab_name):
     """Check that the vocabulary has at least one id_range."""
     logger.debug('-> Validating ID range config for vocabulary "%s".', vocab_name)
@@ -116,12 +115,27 @@ def validate_vocabulary_files_for_ci_workflow(vocab_dir: Path, inbox_dir: Path):
         raise Voc4catError(msg % ", ".join(missing_in_config))
 
 
-def check_for_removed_iris(prev_vocab: Path, new_vocab: Path):
+def _log_changed_triples(prev: Graph, new: Graph) -> None:
+    """Log the triples that differ between prev and new (slow for large graphs)."""
+    _, in_prev, in_new = compare.graph_diff(prev, new)
+    for s, p, o in sorted(in_prev):
+        logger.debug("-> Removed triple: %s %s %s", s.n3(), p.n3(), o.n3())
+    for s, p, o in sorted(in_new):
+        logger.debug("-> Added triple: %s %s %s", s.n3(), p.n3(), o.n3())
+
+
+def check_for_removed_iris(
+    prev_vocab: Path, new_vocab: Path, *, report_changes: bool = False
+):
     """
     Validate that concepts/collection were not removed from prev_vocab to new_vocab.
 
     Logs a warning for removed parts and raises a Voc4catError exception if
     the configuration [vocabs.prev_vocab.checks] sets allow_delete to True.
+
+    Removals are detected by comparing the sets of typed subjects. If
+    report_changes is True, all changed triples are logged in addition, which
+    requires a (much slower) comparison of the full graphs.
     """
     logger.debug(
         "-> Checking changes between %s (previous) and %s (new)", prev_vocab, new_vocab
@@ -132,69 +146,125 @@ def check_for_removed_iris(prev_vocab: Path, new_vocab: Path):
     new = Graph()
     new.parse(new_vocab.resolve().as_uri(), format="turtle")
 
-    _, in_prev, _ = compare.graph_diff(prev, new)
-    # print("Only in 1st\n", in_prev.serialize(format="turtle"))
-    # print("Only in 2nd\n", in_new.serialize(format="turtle"))
+    if report_changes:
+        _log_changed_triples(prev, new)
+
+    removed_iris = {}
+    for rdf_type, type_name in (
+        (SKOS.Concept, "Concept"),
+        (SKOS.Collection, "Collection"),
+    ):
+        prev_iris = set(prev.subjects(RDF.type, rdf_type))
+        new_iris = set(new.subjects(RDF.type, rdf_type))
+        removed_iris[type_name] = sorted(prev_iris - new_iris)
 
     voc = config.IDRANGES.vocabs.get(prev_vocab.stem, {})
     delete_allowed = voc.checks.allow_delete if getattr(voc, "checks", False) else False
-    if in_prev:
-        removed = 0
-        for iri in in_prev.subjects(RDF.type, SKOS.Concept):
-            msg = "-> Removal of a Concept detected: %s"
+    removed = 0
+    for type_name, iris in removed_iris.items():
+        msg = f"-> Removal of a {type_name} detected: %s"
+        for iri in iris:
             if delete_allowed:
                 logger.warning(msg, iri)
             else:
                 logger.error(msg, iri)
             removed += 1
-        for iri in in_prev.subjects(RDF.type, SKOS.Collection):
-            msg = "-> Removal of a Collection detected: %s"
-            if delete_allowed:
-                logger.warning(msg, iri)
-            else:
-                logger.error(msg, iri)
-            removed += 1
-        if not delete_allowed and removed:
-            msg = f"Forbidden removal of {removed} concepts/collections detected. See log for IRIs."
-            raise Voc4catError(msg)
-    else:
+    if not removed:
         logger.debug("-> No removals detected.")
+    elif not delete_allowed:
+        msg = f"Forbidden removal of {removed} concepts/collections detected. See log for IRIs."
+        raise Voc4catError(msg)
+
+
+def _load_vocab(vocab_path: Path, graph: Graph | None):
+    """Return graph and CURIE converter for a vocabulary."""
+    if graph is None:
+        graph = Graph()
+        graph.parse(vocab_path.resolve().as_uri(), format="turtle")
+
+    # Build curies converter from graph's namespace bindings
+    converter = Converter.from_prefix_map(
+        {prefix: str(uri) for prefix, uri in graph.namespaces()}
+    )
+    return graph, converter
+
 
+def _load_hierarchy(vocab_path: Path, graph: Graph | None):
+    """Return hierarchy index and CURIE converter for a vocabulary."""
+    graph, converter = _load_vocab(vocab_path, graph)
+    return HierarchyIndex(graph), converter
 
-def check_hierarchical_redundancy(vocab_path: Path) -> list[tuple[str, str, str]]:
+
+def check_hierarchical_redundancy(
+    vocab_path: Path, graph: Graph | None = None
+) -> list[tuple[str, str, str]]:
     """
     Detect redundant hierarchical relationships in a SKOS vocabulary.
 
     A redundant relationship exists when concept C has skos:broader to both
     B and A, where A is already an ancestor of B (reachable via skos:broader).
 
+    An already parsed graph of the vocabulary can be passed to avoid parsing
+    vocab_path again.
+
     Returns list of tuples (concept_curie, redundant_ancestor_curie, intermediate_parent_curie)
     for each redundant relationship found. The triple to eliminate is:
     <concept> skos:broader <redundant_ancestor>
     """
     logger.debug("-> Checking for hierarchical redundancy in %s", vocab_path)
+    index, converter = _load_hierarchy(vocab_path, graph)
+    return [
+        tuple(converter.compress(str(iri), passthrough=True) for iri in redundancy)
+        for redundancy in index.redundancies()
+    ]
 
-    g = Graph()
-    g.parse(vocab_path.resolve().as_uri(), format="turtle")
 
-    # Build curies converter from graph's namespace bindings
-    converter = Converter.from_prefix_map(
-        {prefix: str(uri) for prefix, uri in g.namespaces()}
-    )
+def check_broader_cycles(
+    vocab_path: Path, graph: Graph | None = None
+) -> list[list[str]]:
+    """
+    Detect cycles in the skos:broader hierarchy of a SKOS vocabulary.
+
+    An already parsed graph of the vocabulary can be passed to avoid parsing
+    vocab_path again.
+
+    Returns one list of CURIEs per cycle, e.g. ["ex:A", "ex:B", "ex:A"] for
+    A broader B broader A.
+    """
+    logger.debug("-> Checking for cycles in skos:broader in %s", vocab_path)
+    index, converter = _load_hierarchy(vocab_path, graph)
+    return [
+        [converter.compress(str(iri), passthrough=True) for iri in cycle]
+        for cycle in index.cycles()
+    ]
+
+
+def check_duplicate_labels(
+    vocab_path: Path, graph: Graph | None = None
+) -> list[tuple[str, str, list[str]]]:
+    """
+    Detect labels (prefLabel or altLabel) used by more than one concept.
 
-    redundancies = []
-    for concept, parent1 in sorted(g.subject_objects(SKOS.broader)):
-        for parent2 in sorted(g.objects(concept, SKOS.broader)):
-            if parent1 == parent2:
-                continue  # must be different parents
-            # Check if parent2 is an ancestor of parent1 (reachable via broader)
-            if parent2 in g.transitive_objects(parent1, SKOS.broader):
-                redundancies.append(
-                    (
-                        converter.compress(str(concept), passthrough=True),
-                        converter.compress(str(parent2), passthrough=True),
-                        converter.compress(str(parent1), passthrough=True),
-                    )
-                )
-
-    return redundancies
+    Labels are compared after normalisation (case, surrounding whitespace,
+    hyphens) per language.
+
+    An already parsed graph of the vocabulary can be passed to avoid parsing
+    vocab_path again.
+
+    Returns list of tuples (label, language, concept_curies) for each label
+    that is used by several concepts.
+    """
+    logger.debug("-> Checking for duplicate labels in %s", vocab_path)
+    graph, converter = _load_vocab(vocab_path, graph)
+    index = LabelIndex.from_graph(graph)
+    duplicates = []
+    for entries in index.duplicates():
+        iris = sorted({index.iris[e] for e in entries})
+        duplicates.append(
+            (
+                index.labels[entries[0]],
+                index.langs[entries[0]],
+                [converter.compress(iri, passthrough=True) for iri in iris],
+            )
+        )
+    return sorted(duplicates)
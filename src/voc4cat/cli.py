@@ -1,24 +1,40 @@
-"""New cleaner command line interface for voc4cat with subcommands."""
+"""New cleaner command line interface for voc4cat with subcommands.
+
+The modules of the subcommands (and their dependencies like rdflib, pyshacl
+or openpyxl) are only imported when a subcommand runs, so that building the
+parser and printing help is fast.
+"""
 
 import argparse
+import importlib
 import logging
 import os.path
 import sys
 import textwrap
 from pathlib import Path
 
-from voc4cat import __version__, config, setup_logging
-from voc4cat.check import check
-from voc4cat.checks import Voc4catError
-from voc4cat.convert import DEFAULT_PROFILE, convert
-from voc4cat.docs import docs
-from voc4cat.gen_template import template_cmd
-from voc4cat.transform import transform
-from voc4cat.utils import ConversionError
+from voc4cat import DEFAULT_PROFILE, __version__, setup_logging
+from voc4cat.errors import ConversionError, Voc4catError
+from voc4cat.serve import (
+    DAEMON_SUBCOMMANDS,
+    DEFAULT_GRAPH_CACHE_SIZE,
+    SOCKET_ENV,
+    run_in_daemon,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def lazy_command(module_name, func_name):
+    """Return a subcommand handler that imports its module when called."""
+
+    def run_command(args):
+        module = importlib.import_module(module_name)
+        return getattr(module, func_name)(args)
+
+    return run_command
+
+
 def process_common_options(args, raw_args):
     # set up output directory
     outdir = getattr(args, "outdir", None)
@@ -43,6 +59,8 @@ def process_common_options(args, raw_args):
 
     # load config
     if args.config is not None:
+        from voc4cat import config  # noqa: PLC0415
+
         if args.config.exists():
             config.load_config(config_file=Path(args.config))
         else:
@@ -221,6 +239,29 @@ def add_transform_subparser(subparsers, options):
         ),
         default=None,
     )
+    skosopt.add_argument(
+        "--prov-cache",
+        metavar="FILE",
+        type=Path,
+        help=(
+            "Cache file for git history information used by --prov-from-git. "
+            "History is only recomputed for files that changed since the run "
+            "that wrote the cache. The file is created if it does not exist."
+        ),
+        default=None,
+    )
+    skosopt.add_argument(
+        "-j",
+        "--jobs",
+        metavar="N",
+        type=int,
+        help=(
+            "Number of worker processes for --prov-from-git. Several vocabulary "
+            "directories are processed concurrently, a single directory is "
+            "processed file by file in parallel. (default: 1)"
+        ),
+        default=1,
+    )
     parser.add_argument(
         "--inplace",  # was "--no-warn"
         help=(
@@ -234,7 +275,7 @@ def add_transform_subparser(subparsers, options):
         type=Path,
         help="Either the file to process or a directory with files to process.",
     )
-    parser.set_defaults(func=transform)
+    parser.set_defaults(func=lazy_command("voc4cat.transform", "transform"))
 
 
 def add_convert_subparser(subparsers, options):
@@ -271,6 +312,46 @@ def add_convert_subparser(subparsers, options):
         choices=["043", "auto"],
         default="auto",
     )
+    skosopt.add_argument(
+        "--streaming",
+        help=(
+            "With --from 043: write the converted triples directly to the output "
+            "file instead of building the converted graph in memory. The output "
+            "is Turtle with one triple per line (only --outputformat turtle)."
+        ),
+        action="store_true",
+        default=False,
+    )
+    shacl = parser.add_argument_group("RDF validation")
+    shacl.add_argument(
+        "--validate",
+        help=(
+            "Validate the RDF graph created from xlsx with the SHACL profile "
+            "before writing it. The file is not written if validation fails."
+        ),
+        action="store_true",
+        default=False,
+    )
+    shacl.add_argument(
+        "-p",
+        "--profile",
+        help=(
+            "A SHACL profile token or path to a profile file used with --validate. "
+            "A profile_local_path set in idranges.toml is used if this option "
+            f'is not given. (default: "{DEFAULT_PROFILE}")'
+        ),
+        default=DEFAULT_PROFILE,
+    )
+    shacl.add_argument(
+        "--fail-at-level",
+        help=(
+            "The minimum level which fails SHACL validation with --validate: "
+            "1-info, 2-warning, 3-violation (default: 1-info)"
+        ),
+        default=1,
+        type=int,
+        choices=[1, 2, 3],
+    )
     xlsxopt = parser.add_argument_group("Creating Excel/xlsx")
     xlsxopt.add_argument(
         "-t",
@@ -287,7 +368,108 @@ def add_convert_subparser(subparsers, options):
         type=Path,
         help="Either the file to process or a directory with files to process.",
     )
-    parser.set_defaults(func=convert)
+    parser.set_defaults(func=lazy_command("voc4cat.convert", "convert"))
+
+
+def add_migrate_subparser(subparsers, options):
+    """Bulk migration of 0.4.3 format RDF vocabularies to v1.0 RDF."""
+    parser = subparsers.add_parser(
+        "migrate",
+        description=(
+            "Migrate all 0.4.3 format RDF files in a directory tree (or in a "
+            "directory at one or more git refs) to v1.0 RDF. The files are "
+            "converted triple by triple, in parallel with --jobs."
+        ),
+        help="Migrate a tree or git refs of 0.4.3 format RDF vocabularies to v1.0.",
+        **options,
+    )
+    parser.add_argument(
+        "--outputformat",
+        help="Output format for the migrated RDF files. (default: turtle)",
+        choices=["turtle", "nt"],
+        default="turtle",
+    )
+    parser.add_argument(
+        "--ref",
+        dest="refs",
+        metavar="REF",
+        action="append",
+        help=(
+            "Migrate the files in VOCAB as they were at the git ref (branch, tag "
+            "or commit) to OUTDIR/REF/. Can be given more than once. Requires "
+            "--outdir."
+        ),
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        metavar="N",
+        type=int,
+        help="Number of worker processes. (default: 1)",
+        default=1,
+    )
+    parser.add_argument(
+        "--summary",
+        type=Path,
+        metavar="FILE",
+        help=(
+            "Write a JSON summary with the triple counts and dropped predicates "
+            "of all migrated files."
+        ),
+    )
+    parser.add_argument(
+        "VOCAB",
+        type=Path,
+        help="Either the file to migrate or a directory tree with files to migrate.",
+    )
+    parser.set_defaults(func=lazy_command("voc4cat.migrate", "migrate"))
+
+
+def add_ids_subparser(subparsers, options):
+    """Find free IDs in the ID ranges of a split vocabulary."""
+    parser = subparsers.add_parser(
+        "ids",
+        description=(
+            "Show unused and free IDs in the ID ranges of a vocabulary. The used "
+            "IDs are taken from the filenames of the split vocabulary directory."
+        ),
+        help="Show free IDs in the ID ranges of a split vocabulary.",
+        **options,
+    )
+    parser.add_argument(
+        "-a",
+        "--actor",
+        help=(
+            "Only show the ID ranges of this GitHub name, ORCID or ROR ID. "
+            "(default: all ID ranges)"
+        ),
+        default=None,
+    )
+    parser.add_argument(
+        "-n",
+        "--count",
+        metavar="N",
+        type=int,
+        help="Number of free IDs to list. (default: 10)",
+        default=10,
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="FILE",
+        type=Path,
+        help=(
+            "Cache file for the bitmap of used IDs. Only partition directories "
+            "changed since the last run are listed again. The file is created "
+            "if it does not exist."
+        ),
+        default=None,
+    )
+    parser.add_argument(
+        "VOCAB",
+        type=Path,
+        help="Directory with the split vocabulary (as created by transform --split).",
+    )
+    parser.set_defaults(func=lazy_command("voc4cat.id_alloc", "ids_cmd"))
 
 
 def add_check_subparser(subparsers, options):
@@ -343,6 +525,25 @@ def add_check_subparser(subparsers, options):
         ),
         action="store_true",
     )
+    shacl.add_argument(
+        "--quick",
+        help=(
+            "Run only the fast native checks of the most common vp4cat rules "
+            "(labels, definitions, scheme) instead of the full SHACL "
+            "validation, e.g. in pre-commit hooks."
+        ),
+        action="store_true",
+        default=False,
+    )
+    shacl.add_argument(
+        "--incremental-from",
+        metavar="BASE",
+        help=(
+            "Validate only concepts that changed compared to BASE (and their SKOS "
+            "neighbours). BASE is a directory with the previous, validated "
+            "vocabulary files or a git ref."
+        ),
+    )
     shacl.add_argument(
         "--redundant-hierarchies",
         help=(
@@ -352,6 +553,24 @@ def add_check_subparser(subparsers, options):
         action="store_true",
         default=False,
     )
+    shacl.add_argument(
+        "--broader-cycles",
+        help=(
+            "Detect cycles in the skos:broader hierarchy, e.g. a concept that is "
+            "(indirectly) broader than itself."
+        ),
+        action="store_true",
+        default=False,
+    )
+    shacl.add_argument(
+        "--duplicate-labels",
+        help=(
+            "Detect prefLabels/altLabels that are used by more than one concept "
+            "(same language, ignoring case and hyphens)."
+        ),
+        action="store_true",
+        default=False,
+    )
     workflow = parser.add_argument_group("Workflow options")
     workflow.add_argument(
         "--ci-pre",
@@ -372,13 +591,22 @@ def add_check_subparser(subparsers, options):
             "are allowed."
         ),
     )
+    workflow.add_argument(
+        "--report-changes",
+        help=(
+            "With --ci-post, log all triples that were added or removed between "
+            "EXISTING and VOCAB (slow for large vocabularies)."
+        ),
+        action="store_true",
+        default=False,
+    )
     parser.add_argument(
         "VOCAB",
         nargs="?",
         type=Path,
         help="Either the file to process or a directory with files to process.",
     )
-    parser.set_defaults(func=check, _parser=parser)
+    parser.set_defaults(func=lazy_command("voc4cat.check", "check"), _parser=parser)
 
 
 def add_docs_subparser(subparsers, options):
@@ -408,7 +636,7 @@ def add_docs_subparser(subparsers, options):
         type=Path,
         help="Either the file to process or a directory with files to process.",
     )
-    parser.set_defaults(func=docs)
+    parser.set_defaults(func=lazy_command("voc4cat.docs", "docs"))
 
 
 def add_template_subparser(subparsers, options):
@@ -438,7 +666,42 @@ def add_template_subparser(subparsers, options):
         type=str,
         help="Vocabulary name used as the filename for the generated xlsx template.",
     )
-    parser.set_defaults(func=template_cmd)
+    parser.set_defaults(func=lazy_command("voc4cat.gen_template", "template_cmd"))
+
+
+def add_serve_subparser(subparsers, options):
+    """Daemon that runs subcommands in a warm process."""
+    parser = subparsers.add_parser(
+        "serve",
+        description=(
+            "Start a daemon that runs the subcommands "
+            f"{', '.join(DAEMON_SUBCOMMANDS)} without the startup cost of a new "
+            "process. Set the environment variable "
+            f"{SOCKET_ENV} to the socket path to send commands to the daemon; "
+            "without a running daemon they run in-process."
+        ),
+        help="Run subcommands in a long-running daemon.",
+        **options,
+    )
+    parser.add_argument(
+        "--socket",
+        help=(
+            f"Path of the Unix domain socket. (default: ${SOCKET_ENV} or "
+            "voc4cat-<uid>.sock in the temp directory)"
+        ),
+        type=Path,
+    )
+    parser.add_argument(
+        "--graph-cache",
+        help=(
+            "Number of parsed vocabulary files to keep in memory. "
+            f"(default: {DEFAULT_GRAPH_CACHE_SIZE})"
+        ),
+        type=int,
+        default=DEFAULT_GRAPH_CACHE_SIZE,
+        metavar="N",
+    )
+    parser.set_defaults(func=lazy_command("voc4cat.serve", "serve"), VOCAB=None)
 
 
 def main_cli(raw_args=None):
@@ -463,9 +726,12 @@ def main_cli(raw_args=None):
     }
     add_transform_subparser(subparsers, common_options)
     add_convert_subparser(subparsers, common_options)
+    add_migrate_subparser(subparsers, common_options)
+    add_ids_subparser(subparsers, common_options)
     add_check_subparser(subparsers, common_options)
     add_docs_subparser(subparsers, common_options)
     add_template_subparser(subparsers, common_options)
+    add_serve_subparser(subparsers, common_options)
 
     if not raw_args:
         parser.print_help()
@@ -479,18 +745,31 @@ def main_cli(raw_args=None):
     args.func(args)
 
 
-def run_cli_app(raw_args=None):
-    """Entry point for running the cli app."""
-    if raw_args is None:
-        raw_args = sys.argv[1:]
+def run_main_cli(raw_args) -> int:
+    """Run the cli app in this process and return the exit code."""
     try:
         main_cli(raw_args)
     except (Voc4catError, ConversionError) as e:
         logger.error("Terminating with error: %s", e)  # noqa: TRY400
-        sys.exit(1)
+        return 1
     except Exception:  # pragma: no cover
         logger.exception("Unexpected error.")
-        sys.exit(3)  # value 2 is used by argparse for invalid args.
+        return 3  # value 2 is used by argparse for invalid args.
+    return 0
+
+
+def run_cli_app(raw_args=None):
+    """Entry point for running the cli app."""
+    if raw_args is None:
+        raw_args = sys.argv[1:]
+    exit_code = None
+    if raw_args and raw_args[0] in DAEMON_SUBCOMMANDS and os.environ.get(SOCKET_ENV):
+        # Thin client: run in the daemon of "voc4cat serve" if one is listening.
+        exit_code = run_in_daemon(raw_args)
+    if exit_code is None:
+        exit_code = run_main_cli(raw_args)
+    if exit_code:
+        sys.exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -21,6 +21,7 @@ from rdflib.namespace import NamespaceManager
 from typing_extensions import Self
 
 from voc4cat.fields import ORCIDIdentifier, RORIdentifier
+from voc4cat.id_space import IdRangeIndex
 
 if sys.version_info >= (3, 11):
     import tomllib
@@ -121,14 +122,12 @@ class Vocab(BaseModel):
     @field_validator("id_range", mode="before")
     @classmethod
     def check_names_not_empty(cls, value):
-        ids_defined = set()
+        ids_defined = IdRangeIndex()
         for idr in value:
-            new_ids = set(range(idr["first_id"], idr["last_id"] + 1))
-            reused = list(ids_defined & new_ids)
-            if reused:
-                msg = f"Overlapping ID ranges for IDs {min(reused)}-{max(reused)}."
-                raise ValueError(msg)
-            ids_defined = ids_defined | new_ids
+            first, last = idr["first_id"], idr["last_id"]
+            if last < first:
+                continue  # reported by IdrangeItem.order_of_ids
+            ids_defined.add(first, last)  # raises ValueError for overlaps
         return value
 
     @model_validator(mode="after")
@@ -185,6 +184,7 @@ IDRANGES_PATH: Path | None = (
 )
 ID_PATTERNS = {}
 ID_RANGES_BY_ACTOR = defaultdict(list)
+ID_RANGE_INDEX: dict[str, IdRangeIndex] = {}
 CURIES_CONVERTER_MAP = {}
 
 
@@ -206,10 +206,25 @@ def _id_ranges_by_actor(new_conf):
     return id_ranges_by_actor
 
 
+def _id_range_index(new_conf):
+    # create index to look up the ID range (and its owner) of an ID per vocab
+    return {
+        name: IdRangeIndex((idr.first_id, idr.last_id, idr) for idr in voc.id_range)
+        for name, voc in new_conf["IDRANGES"].vocabs.items()
+    }
+
+
+def id_range_owner(vocab_name: str, id_: int) -> IdrangeItem | None:
+    """Return the ID range of a vocabulary that contains id_ or None."""
+    index = ID_RANGE_INDEX.get(vocab_name)
+    return None if index is None else index.owner(id_)
+
+
 def load_config(config_file: Path | None = None, config: IDrangeConfig | None = None):
     new_conf = {}
     new_conf["ID_PATTERNS"] = {}
     new_conf["ID_RANGES_BY_ACTOR"] = defaultdict(list)
+    new_conf["ID_RANGE_INDEX"] = {}
     new_conf["IDRANGES_PATH"] = None
     if config_file is not None and not config_file.exists():
         logger.warning('Configuration file "%s" not found.', config_file)
@@ -238,6 +253,7 @@ def load_config(config_file: Path | None = None, config: IDrangeConfig | None =
     new_conf["ID_PATTERNS"] = id_patterns
 
     new_conf["ID_RANGES_BY_ACTOR"] = _id_ranges_by_actor(new_conf)
+    new_conf["ID_RANGE_INDEX"] = _id_range_index(new_conf)
 
     # Initialize curies-converter for all vocabs with default namespace of rdflib.Graph
     namespace_manager = NamespaceManager(Graph())
@@ -1,20 +1,23 @@
 import logging
+from collections import OrderedDict
 from itertools import chain
 from pathlib import Path
 
 import pyshacl
 from colorama import Fore, Style
 from pyshacl.pytypes import GraphLike
-from rdflib import RDF, SH
+from rdflib import RDF, SH, Graph
 
-from voc4cat import config
+from voc4cat import DEFAULT_PROFILE, config
 from voc4cat.checks import Voc4catError
-from voc4cat.convert_043 import convert_rdf_043_to_v1
+from voc4cat.convert_043 import convert_rdf_043_to_v1, stream_rdf_043_to_v1
 from voc4cat.convert_v1 import (
     excel_to_rdf_v1,
     rdf_to_excel_v1,
 )
+from voc4cat.incremental import build_focus_subgraph
 from voc4cat.models_v1 import CONCEPTS_SHEET_NAME
+from voc4cat.quick_check import QUICK_PROFILES, quick_validate
 from voc4cat.utils import (
     EXCEL_FILE_ENDINGS,
     RDF_FILE_ENDINGS,
@@ -27,7 +30,15 @@ from voc4cat.xlsx_common import adjust_all_tables_length
 logger = logging.getLogger(__name__)
 
 PROFILE_DIR = Path(__file__).parent / "profile"
-DEFAULT_PROFILE = "vp4cat-5.2"
+
+# Parsed SHACL profiles: resolved path -> (mtime_ns, shapes graph)
+_PROFILE_GRAPHS: dict[Path, tuple[int, Graph]] = {}
+
+# Number of parsed vocabulary files to keep (0: no caching). It is set by the
+# long-running daemon of "voc4cat serve".
+VOCAB_GRAPH_CACHE_SIZE = 0
+# Parsed vocabulary files: resolved path -> ((mtime_ns, size), graph)
+_VOCAB_GRAPHS: OrderedDict[Path, tuple[tuple[int, int], Graph]] = OrderedDict()
 
 
 def get_bundled_profiles() -> dict[str, Path]:
@@ -76,36 +87,87 @@ def resolve_profile(profile: str) -> tuple[Path, str]:
     raise Voc4catError(msg)
 
 
-def validate_with_profile(
-    data_graph: GraphLike | str | bytes,
-    profile: str = DEFAULT_PROFILE,
-    error_level: int = 1,
-):
-    """Validate data graph against a SHACL profile.
+def get_effective_profile(vocab_name: str, profile: str) -> str:
+    """Return the SHACL profile to use for a vocabulary.
+
+    Priority: profile set by the user (not the default) > profile_local_path
+    of the vocabulary in idranges.toml > default profile.
 
     Args:
-        data_graph: The RDF data to validate.
-        profile: Either a bundled profile token (e.g., "vocpub-4.7") or
-                 a path to a custom SHACL profile file.
-        error_level: Minimum severity level to treat as error (1=info, 2=warning, 3=violation).
+        vocab_name: Name of the vocabulary (lowercase).
+        profile: Profile token or path given on the command line.
+
+    Returns:
+        Profile token or path to a profile file.
     """
-    allow_warnings = error_level > 1
+    if profile != DEFAULT_PROFILE:
+        return profile
+    vocab_config = config.IDRANGES.vocabs.get(vocab_name)
+    if vocab_config and vocab_config.profile_local_path and config.IDRANGES_PATH:
+        return str(
+            (config.IDRANGES_PATH.parent / vocab_config.profile_local_path).resolve()
+        )
+    return profile
 
-    # Resolve profile to file path
-    shacl_graph_path, _profile_name = resolve_profile(profile)
-    shacl_graph_path = str(shacl_graph_path)
 
-    # validate the RDF file
-    _conforms, results_graph, _results_text = pyshacl.validate(
-        data_graph,
-        shacl_graph=shacl_graph_path,
-        allow_warnings=allow_warnings,
-    )
+def load_profile_graph(profile_path: Path) -> Graph:
+    """Return the parsed shapes graph of a SHACL profile file.
 
-    info_list = []
-    warning_list = []
-    violation_list = []
+    Parsed profiles are kept for the lifetime of the process, so repeated
+    validations (e.g. of all vocabularies in a directory) parse each profile
+    only once. A profile file that changed on disk is parsed again.
+
+    Args:
+        profile_path: Path to the SHACL profile file.
 
+    Returns:
+        The shapes graph.
+    """
+    key = profile_path.resolve()
+    mtime = key.stat().st_mtime_ns
+    cached = _PROFILE_GRAPHS.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    logger.debug("Loading SHACL profile %s", profile_path)
+    shapes = Graph().parse(key, format=RDF_FILE_ENDINGS.get(key.suffix.lower(), "ttl"))
+    _PROFILE_GRAPHS[key] = (mtime, shapes)
+    return shapes
+
+
+def load_vocab_graph(path: Path) -> Graph:
+    """Parse a vocabulary file, reusing a recently parsed graph if possible.
+
+    Up to VOCAB_GRAPH_CACHE_SIZE parsed files are kept. A file that changed on
+    disk is parsed again. The returned graph may be shared, so callers must
+    not modify it.
+
+    Args:
+        path: Path to the RDF file.
+
+    Returns:
+        The parsed graph.
+    """
+    if VOCAB_GRAPH_CACHE_SIZE <= 0:
+        return Graph().parse(path)
+    key = path.resolve()
+    stat = key.stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _VOCAB_GRAPHS.get(key)
+    if cached is not None and cached[0] == version:
+        _VOCAB_GRAPHS.move_to_end(key)
+        logger.debug("Using cached graph of %s", path)
+        return cached[1]
+    graph = Graph().parse(key)
+    _VOCAB_GRAPHS[key] = (version, graph)
+    _VOCAB_GRAPHS.move_to_end(key)
+    while len(_VOCAB_GRAPHS) > VOCAB_GRAPH_CACHE_SIZE:
+        _VOCAB_GRAPHS.popitem(last=False)
+    return graph
+
+
+def _results_from_report(results_graph: Graph) -> list[dict]:
+    """Return the results of a SHACL validation report as list of dicts."""
+    results = []
     for report in results_graph.subjects(RDF.type, SH.ValidationReport):
         for result in results_graph.objects(report, SH.result):
             result_dict = {}
@@ -122,19 +184,37 @@ def validate_with_profile(
                     result_dict["sourceShape"] = str(o)
                 elif p == SH.value:
                     result_dict["value"] = str(o)
-            result_message_formatted = format_log_msg(result_dict)
-            result_message = format_log_msg(
-                result_dict, colored=True
-            )  # output to screen
-            if result_dict["resultSeverity"] == str(SH.Info):
-                logger.info(result_message_formatted)
-                info_list.append(result_message)
-            elif result_dict["resultSeverity"] == str(SH.Warning):
-                logger.warning(result_message_formatted)
-                warning_list.append(result_message)
-            elif result_dict["resultSeverity"] == str(SH.Violation):
-                logger.error(result_message_formatted)
-                violation_list.append(result_message)
+            results.append(result_dict)
+    return results
+
+
+def report_validation_results(results: list[dict], profile: str, error_level: int):
+    """Log validation results and raise if any reaches the error level.
+
+    Args:
+        results: Result dicts as used by format_log_msg.
+        profile: Profile token or path (for the error message).
+        error_level: Minimum severity level to treat as error (1=info, 2=warning, 3=violation).
+
+    Raises:
+        ConversionError: If the vocabulary is not valid.
+    """
+    info_list = []
+    warning_list = []
+    violation_list = []
+
+    for result_dict in results:
+        result_message_formatted = format_log_msg(result_dict)
+        result_message = format_log_msg(result_dict, colored=True)  # output to screen
+        if result_dict["resultSeverity"] == str(SH.Info):
+            logger.info(result_message_formatted)
+            info_list.append(result_message)
+        elif result_dict["resultSeverity"] == str(SH.Warning):
+            logger.warning(result_message_formatted)
+            warning_list.append(result_message)
+        elif result_dict["resultSeverity"] == str(SH.Violation):
+            logger.error(result_message_formatted)
+            violation_list.append(result_message)
 
     # Log summary of validation results
     n_info = len(info_list)
@@ -162,6 +242,71 @@ def validate_with_profile(
         raise ConversionError(msg)
 
 
+def validate_with_profile(
+    data_graph: GraphLike | str | bytes,
+    profile: str = DEFAULT_PROFILE,
+    error_level: int = 1,
+    *,
+    focus_nodes: set | None = None,
+    quick: bool = False,
+):
+    """Validate data graph against a SHACL profile.
+
+    Args:
+        data_graph: The RDF data to validate.
+        profile: Either a bundled profile token (e.g., "vocpub-4.7") or
+                 a path to a custom SHACL profile file.
+        error_level: Minimum severity level to treat as error (1=info, 2=warning, 3=violation).
+        focus_nodes: Optional set of IRIs. If given, only these nodes of the
+                 data graph (an rdflib Graph) are validated, see
+                 voc4cat.incremental.
+        quick: Run only the native checks of voc4cat.quick_check for the
+                 most common vp4cat rules instead of the full SHACL validation.
+    """
+    allow_warnings = error_level > 1
+
+    # Resolve profile to file path
+    shacl_graph_path, profile_name = resolve_profile(profile)
+
+    ignored_nodes = set()
+    if focus_nodes is not None:
+        logger.info("Validating %i changed or related node(s).", len(focus_nodes))
+        data_graph, context_nodes = build_focus_subgraph(data_graph, focus_nodes)
+        ignored_nodes = {str(node) for node in context_nodes}
+
+    if quick:
+        shapes_graph = None
+        if profile_name in QUICK_PROFILES and shacl_graph_path.parent == PROFILE_DIR:
+            shapes_graph = load_profile_graph(shacl_graph_path)
+        else:
+            logger.warning(
+                "Quick checks implement the vp4cat rules, not the %s profile.",
+                profile_name,
+            )
+        if isinstance(data_graph, str):
+            data_graph = Graph().parse(data_graph)
+        results = [
+            r
+            for r in quick_validate(data_graph, shapes_graph)
+            if r["focusNode"] not in ignored_nodes
+        ]
+        report_validation_results(results, profile, error_level)
+        return
+
+    # validate the RDF file
+    _conforms, results_graph, _results_text = pyshacl.validate(
+        data_graph,
+        shacl_graph=load_profile_graph(shacl_graph_path),
+        allow_warnings=allow_warnings,
+    )
+    results = [
+        r
+        for r in _results_from_report(results_graph)
+        if r["focusNode"] not in ignored_nodes
+    ]
+    report_validation_results(results, profile, error_level)
+
+
 def format_log_msg(result: dict, colored: bool = False) -> str:
     formatted_msg = ""
     message = f"""Validation Result in {result["sourceConstraintComponent"].split(str(SH))[1]} ({result["sourceConstraintComponent"]}):
@@ -195,7 +340,7 @@ def format_log_msg(result: dict, colored: bool = False) -> str:
 # ===== convert command & helpers to validate cmd options =====
 
 
-def _get_vocab_config(vocab_name: str) -> "config.Vocab | None":
+def get_vocab_config(vocab_name: str) -> "config.Vocab | None":
     """Get vocab config for a vocabulary name if available.
 
     Returns the Vocab config from idranges.toml if:
@@ -246,6 +391,55 @@ def _check_convert_args(args):
             raise Voc4catError(msg % '", "'.join(duplicates))
 
 
+def _convert_and_validate(file, output_file_path, args, vocab_config):
+    """Convert xlsx to RDF and validate the graph before it is written.
+
+    The graph is validated in memory, so it does not have to be parsed
+    again from the serialized file. Nothing is written if it is not valid.
+    """
+    graph = excel_to_rdf_v1(
+        file,
+        output_type="graph",
+        vocab_config=vocab_config,
+    )
+    effective_profile = get_effective_profile(file.stem.lower(), args.profile)
+    validate_with_profile(
+        graph,
+        profile=effective_profile,
+        error_level=args.fail_at_level,
+    )
+    _, profile_name = resolve_profile(effective_profile)
+    logger.info("-> The graph is valid according to the %s profile.", profile_name)
+
+    # Use longturtle for better git diffability
+    rdf_format = "longturtle" if args.outputformat == "turtle" else args.outputformat
+    graph.serialize(destination=str(output_file_path), format=rdf_format)
+
+
+def check_convert_043_args(args):
+    """Raise an error if 043 conversion is not possible with config and args."""
+    # Require config for --from 043
+    if config.IDRANGES.default_config:
+        msg = (
+            "--from 043 requires an idranges.toml config file. "
+            "Use --config option to specify the config file."
+        )
+        raise Voc4catError(msg)
+
+    # Check config version - require v1.0 for conversion
+    if not config.IDRANGES.config_version:
+        msg = (
+            "Pre-v1.0 idranges.toml detected (missing 'config_version' field). "
+            "Please update your config file to v1.0 format. "
+            "See template at: src/voc4cat/templates/vocab/idranges.toml"
+        )
+        raise Voc4catError(msg)
+
+    if getattr(args, "streaming", False) and args.outputformat != "turtle":
+        msg = "Option --streaming only supports --outputformat turtle."
+        raise Voc4catError(msg)
+
+
 def convert(args):
     logger.debug("Convert subcommand started!")
 
@@ -265,22 +459,8 @@ def convert(args):
                 "XLSX files ignored when using --from 043 (RDF-to-RDF conversion only)"
             )
 
-        # Require config for --from 043
-        if config.IDRANGES.default_config:
-            msg = (
-                "--from 043 requires an idranges.toml config file. "
-                "Use --config option to specify the config file."
-            )
-            raise Voc4catError(msg)
-
-        # Check config version - require v1.0 for conversion
-        if not config.IDRANGES.config_version:
-            msg = (
-                "Pre-v1.0 idranges.toml detected (missing 'config_version' field). "
-                "Please update your config file to v1.0 format. "
-                "See template at: src/voc4cat/templates/vocab/idranges.toml"
-            )
-            raise Voc4catError(msg)
+        check_convert_043_args(args)
+        streaming = getattr(args, "streaming", False)
 
         # Proceed with RDF conversion
         for file in rdf_files:
@@ -291,14 +471,17 @@ def convert(args):
 
             # Get vocab config for metadata enrichment
             vocab_name = file.stem.lower()
-            vocab_config = _get_vocab_config(vocab_name)
-
-            convert_rdf_043_to_v1(
-                file,
-                output_file_path,
-                output_format=args.outputformat,
-                vocab_config=vocab_config,
-            )
+            vocab_config = get_vocab_config(vocab_name)
+
+            if streaming:
+                stream_rdf_043_to_v1(file, output_file_path, vocab_config=vocab_config)
+            else:
+                convert_rdf_043_to_v1(
+                    file,
+                    output_file_path,
+                    output_format=args.outputformat,
+                    vocab_config=vocab_config,
+                )
             logger.info("-> successfully converted to %s", output_file_path)
         return
 
@@ -309,7 +492,7 @@ def convert(args):
         vocab_name = file.stem.lower()
 
         # Get vocab config for ConceptScheme metadata
-        vocab_config = _get_vocab_config(vocab_name)
+        vocab_config = get_vocab_config(vocab_name)
 
         if file in xlsx_files:
             if args.template is not None:
@@ -325,12 +508,15 @@ def convert(args):
                 raise Voc4catError(msg)
             suffix = "ttl" if args.outputformat == "turtle" else args.outputformat
             output_file_path = outfile.with_suffix(f".{suffix}")
-            excel_to_rdf_v1(
-                file,
-                output_file_path,
-                output_format=args.outputformat,
-                vocab_config=vocab_config,
-            )
+            if getattr(args, "validate", False):
+                _convert_and_validate(file, output_file_path, args, vocab_config)
+            else:
+                excel_to_rdf_v1(
+                    file,
+                    output_file_path,
+                    output_format=args.outputformat,
+                    vocab_config=vocab_config,
+                )
             logger.info("-> successfully converted to %s", output_file_path)
         elif file in rdf_files:
             output_file_path = outfile.with_suffix(".xlsx")
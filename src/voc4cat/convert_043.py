@@ -5,15 +5,22 @@ This module handles migration of legacy vocabulary files:
 - ConceptScheme metadata enrichment from config
 - Unknown predicate handling with warnings
 
+The streaming mode (``stream_rdf_043_to_v1``) writes each converted triple
+directly to an N-Triples or Turtle file instead of building the converted
+graph in memory. N-Triples input is also read line by line.
+
 The 043 format was used in earlier versions of voc4cat-tool and differs
 from v1.0 in several predicate choices and structural conventions.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import re
+from collections import Counter
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Literal as TypingLiteral
@@ -33,6 +40,7 @@ from rdflib import (
     Namespace,
     URIRef,
 )
+from rdflib.plugins.parsers.ntriples import W3CNTriplesParser
 
 from voc4cat import config
 from voc4cat.convert_v1 import (
@@ -46,6 +54,8 @@ from voc4cat.convert_v1_helpers import add_provenance_triples_to_graph
 from voc4cat.utils import RDF_FILE_ENDINGS
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from voc4cat.config import Vocab
 
 logger = logging.getLogger(__name__)
@@ -53,6 +63,9 @@ logger = logging.getLogger(__name__)
 # schema.org namespace (not in rdflib by default)
 SDO = Namespace("https://schema.org/")
 
+# Output formats of the streaming conversion and their file suffix
+STREAM_FORMATS = {"turtle": ".ttl", "nt": ".nt"}
+
 
 # =============================================================================
 # 043 to v1.0 RDF Conversion
@@ -310,6 +323,63 @@ def _add_provenance_triples(
     )
 
 
+@dataclass
+class MigrationStats:
+    """Triple counts of a 043 to v1.0 conversion.
+
+    Attributes:
+        input_path: The converted 043 RDF file.
+        output_path: The written v1.0 RDF file.
+        triples_in: Number of triples read.
+        triples_out: Number of triples written.
+        dropped_predicates: Number of dropped triples per unknown predicate.
+    """
+
+    input_path: Path
+    output_path: Path
+    triples_in: int = 0
+    triples_out: int = 0
+    dropped_predicates: Counter = field(default_factory=Counter)
+
+
+def _check_input_path(input_path: Path) -> None:
+    if input_path.suffix.lower() not in RDF_FILE_ENDINGS:
+        msg = (
+            "Files for conversion must end with one of the RDF file formats: "
+            f"'{', '.join(RDF_FILE_ENDINGS.keys())}'"
+        )
+        raise ValueError(msg)
+
+
+def get_id_pattern(
+    vocab_name: str, vocab_config: Vocab | None
+) -> re.Pattern[str] | None:
+    """Return the pattern to extract IDs from 043 identifiers of a vocabulary."""
+    id_pattern = config.ID_PATTERNS.get(vocab_name)
+    if not id_pattern and vocab_config:
+        # Fall back to compiling pattern from vocab_config.id_length
+        id_pattern = re.compile(
+            rf"(?<![0-9])(?P<identifier>[0-9]{{{vocab_config.id_length}}})$"
+        )
+    return id_pattern
+
+
+def default_output_path(input_path: Path, suffix: str) -> Path:
+    """Return the input path with _v1 added to the stem and the given suffix."""
+    return input_path.with_stem(f"{input_path.stem}_v1").with_suffix(suffix)
+
+
+def _log_dropped_predicates(dropped_predicates: Counter) -> None:
+    if not dropped_predicates:
+        return
+    logger.warning(
+        "Dropped %d unknown predicate type(s) during 043->v1.0 conversion:",
+        len(dropped_predicates),
+    )
+    for pred in sorted(dropped_predicates, key=str):
+        logger.warning("  - %s (%d triples)", pred, dropped_predicates[pred])
+
+
 def convert_rdf_043_to_v1(
     input_path: Path,
     output_path: Path | None = None,
@@ -339,12 +409,7 @@ def convert_rdf_043_to_v1(
     Returns:
         Path to the generated v1.0 RDF file.
     """
-    if input_path.suffix.lower() not in RDF_FILE_ENDINGS:
-        msg = (
-            "Files for conversion must end with one of the RDF file formats: "
-            f"'{', '.join(RDF_FILE_ENDINGS.keys())}'"
-        )
-        raise ValueError(msg)
+    _check_input_path(input_path)
 
     logger.info("Converting 043 RDF to v1.0: %s", input_path)
 
@@ -378,17 +443,12 @@ def convert_rdf_043_to_v1(
     # Get ConceptScheme(s) for special handling of dcterms:hasPart
     concept_schemes = set(input_graph.subjects(RDF.type, SKOS.ConceptScheme))
 
-    # Track unknown predicates for warning
-    unknown_predicates: set[URIRef] = set()
+    # Count triples of unknown predicates for warning
+    unknown_predicates: Counter = Counter()
 
     # Get ID pattern for identifier transformation
     vocab_name = input_path.stem.lower()
-    id_pattern = config.ID_PATTERNS.get(vocab_name)
-    if not id_pattern and vocab_config:
-        # Fall back to compiling pattern from vocab_config.id_length
-        id_pattern = re.compile(
-            rf"(?<![0-9])(?P<identifier>[0-9]{{{vocab_config.id_length}}})$"
-        )
+    id_pattern = get_id_pattern(vocab_name, vocab_config)
 
     # Process each triple
     for s, p, o in input_graph:
@@ -406,21 +466,13 @@ def convert_rdf_043_to_v1(
             output_graph.add(new_triple)
 
     # Log warnings for unknown predicates
-    if unknown_predicates:
-        logger.warning(
-            "Dropped %d unknown predicate type(s) during 043->v1.0 conversion:",
-            len(unknown_predicates),
-        )
-        for pred in sorted(unknown_predicates, key=str):
-            count = len(list(input_graph.triples((None, pred, None))))
-            logger.warning("  - %s (%d triples)", pred, count)
+    _log_dropped_predicates(unknown_predicates)
 
     # Enrich ConceptScheme metadata from config if provided
     if vocab_config is not None:
         _enrich_concept_scheme_from_config(output_graph, vocab_config)
 
         # Add provenance triples for concepts and collections
-        vocab_name = input_path.stem.lower()
         _add_provenance_triples(
             output_graph, concepts, collections, vocab_name, vocab_config
         )
@@ -434,7 +486,7 @@ def convert_rdf_043_to_v1(
         else:
             suffix = ".ttl"
         # Add _v1 suffix before extension
-        output_path = input_path.with_stem(f"{input_path.stem}_v1").with_suffix(suffix)
+        output_path = default_output_path(input_path, suffix)
 
     # Serialize (use longturtle for better git diffability)
     logger.info("Writing v1.0 RDF to: %s", output_path)
@@ -450,6 +502,276 @@ def convert_rdf_043_to_v1(
     return output_path
 
 
+class _TripleSink:
+    """Sink for the N-Triples parser that collects the parsed triples."""
+
+    def __init__(self):
+        self.triples = []
+
+    def triple(self, s, p, o):
+        self.triples.append((s, p, o))
+
+
+class _TripleReader:
+    """Triples of an RDF file that can be iterated over more than once.
+
+    N-Triples files are read line by line on each iteration, so they are
+    never held in memory. Files in all other formats are parsed into a graph
+    once, since their parsers need the whole document.
+    """
+
+    def __init__(self, input_path: Path):
+        self.input_path = input_path
+        self.graph = None
+        rdf_format = RDF_FILE_ENDINGS[input_path.suffix.lower()]
+        if rdf_format != "nt":
+            self.graph = Graph().parse(str(input_path), format=rdf_format)
+        self._sink = _TripleSink()
+        # One parser for all passes to keep blank node IDs stable.
+        self._parser = W3CNTriplesParser(self._sink)
+
+    def namespaces(self):
+        return () if self.graph is None else self.graph.namespaces()
+
+    def __iter__(self) -> Iterator[tuple]:
+        if self.graph is not None:
+            yield from self.graph
+            return
+        with self.input_path.open(encoding="utf-8") as f:
+            for line in f:
+                self._parser.parsestring(line)
+                yield from self._sink.triples
+                self._sink.triples.clear()
+
+
+# Predicates that link the ConceptScheme to schema.org entities.
+_ENTITY_PREDICATES = {
+    DCTERMS.creator,
+    DCTERMS.contributor,
+    DCTERMS.publisher,
+    DCAT.contactPoint,
+}
+
+
+@dataclass
+class _StreamSubjects:
+    """Subjects of the input that the streaming conversion handles specially."""
+
+    concepts: set[URIRef] = field(default_factory=set)
+    collections: set[URIRef] = field(default_factory=set)
+    concept_schemes: set[URIRef] = field(default_factory=set)
+    # creator, publisher, ... entities of the ConceptScheme
+    scheme_entities: set[URIRef] = field(default_factory=set)
+
+    def is_scheme_metadata(self, triple: tuple) -> bool:
+        """Return True for triples changed by the enrichment from config."""
+        return triple[0] in self.concept_schemes or triple[0] in self.scheme_entities
+
+
+def _collect_subjects(triples, vocab_config: Vocab | None) -> _StreamSubjects:
+    """Pre-pass over the input to collect concepts, collections and schemes.
+
+    The scheme entities are the objects of the ConceptScheme's creator,
+    publisher, ... triples and the entity URLs in vocab_config.
+    """
+    subjects = _StreamSubjects()
+    by_type = {
+        SKOS.Concept: subjects.concepts,
+        SKOS.Collection: subjects.collections,
+        SKOS.ConceptScheme: subjects.concept_schemes,
+    }
+    entity_links = set()
+    for s, p, o in triples:
+        if p == RDF.type and o in by_type:
+            by_type[o].add(s)
+        elif p in _ENTITY_PREDICATES and isinstance(o, URIRef):
+            entity_links.add((s, o))
+    subjects.scheme_entities = {
+        o for s, o in entity_links if s in subjects.concept_schemes
+    }
+    if vocab_config is not None:
+        for value in (
+            vocab_config.creator,
+            vocab_config.publisher,
+            vocab_config.custodian,
+        ):
+            for line in (value or "").splitlines():
+                _name, url = parse_name_url(line)
+                if url:
+                    subjects.scheme_entities.add(URIRef(url))
+    return subjects
+
+
+def _nt_term(term) -> str:
+    """Return term in N-Triples syntax."""
+    if not isinstance(term, Literal):
+        return term.n3()
+    # Literal.n3() uses Turtle's long strings for multi-line values.
+    value = (
+        str(term)
+        .replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+    if term.language:
+        return f'"{value}"@{term.language}'
+    if term.datatype:
+        return f'"{value}"^^<{term.datatype}>'
+    return f'"{value}"'
+
+
+class _TripleWriter:
+    """Write triples as N-Triples lines, each distinct triple once.
+
+    Only a 16 byte digest of each written line is kept to skip duplicates.
+    """
+
+    def __init__(self, out):
+        self.out = out
+        self.written = 0
+        self._seen = set()
+
+    def write(self, triple: tuple) -> None:
+        line = " ".join(_nt_term(term) for term in triple) + " .\n"
+        digest = hashlib.blake2b(line.encode("utf-8"), digest_size=16).digest()
+        if digest in self._seen:
+            return
+        self._seen.add(digest)
+        self.out.write(line)
+        self.written += 1
+
+
+def _write_prefixes(out, namespaces, vocab_config: Vocab | None) -> None:
+    """Write the Turtle prefix declarations of the input and config prefixes."""
+    prefixes = dict(namespaces)
+    # Ensure prov namespace is bound (needed for new predicates)
+    prefixes["prov"] = PROV
+    if vocab_config is not None and vocab_config.prefix_map:
+        prefixes.update(vocab_config.prefix_map)
+    for prefix, namespace in prefixes.items():
+        out.write(f"@prefix {prefix}: <{namespace}> .\n")
+    out.write("\n")
+
+
+def _write_provenance_triples(
+    writer: _TripleWriter, iris: set[URIRef], vocab_name: str, vocab_config: Vocab
+) -> None:
+    """Write the provenance triples of concepts/collections one by one."""
+    for iri in sorted(iris):
+        graph = Graph()
+        add_provenance_triples_to_graph(
+            graph,
+            iri,
+            vocab_name,
+            vocab_config.provenance_url_template or "",
+            vocab_config.repository or "",
+            vocab_config.id_length,
+        )
+        for triple in graph:
+            writer.write(triple)
+
+
+def stream_rdf_043_to_v1(
+    input_path: Path,
+    output_path: Path | None = None,
+    output_format: TypingLiteral["turtle", "nt"] = "turtle",
+    vocab_config: Vocab | None = None,
+    *,
+    id_pattern: re.Pattern[str] | None = None,
+) -> MigrationStats:
+    """Convert a 0.4.3 format RDF vocabulary to v1.0 RDF, triple by triple.
+
+    Performs the same transformations as ``convert_rdf_043_to_v1`` but
+    writes each converted triple directly to the output file instead of
+    collecting it in a graph. A first pass over the input collects the
+    concepts, collections and concept schemes; the second pass converts the
+    triples. Only the triples of the ConceptScheme and its creator,
+    publisher, ... entities are kept in memory to enrich them from
+    vocab_config. The output has one triple per line, each distinct triple
+    once; for Turtle the prefixes are declared at the top. The output is written to a temporary
+    file that replaces output_path when the conversion is complete.
+
+    Args:
+        input_path: Path to the 043 RDF file.
+        output_path: Optional path for output. Defaults to input with _v1 suffix.
+        output_format: Output format, "turtle" or "nt" (N-Triples).
+        vocab_config: Optional Vocab config for metadata enrichment.
+        id_pattern: Pattern to extract the IDs from 043 identifiers. Derived
+            from the config if not given.
+
+    Returns:
+        The triple counts and dropped predicates of the conversion.
+    """
+    _check_input_path(input_path)
+    if output_format not in STREAM_FORMATS:
+        msg = (
+            f'Unsupported output format for streaming conversion: "{output_format}". '
+            f"Use one of: {', '.join(STREAM_FORMATS)}"
+        )
+        raise ValueError(msg)
+    if output_path is None:
+        output_path = default_output_path(input_path, STREAM_FORMATS[output_format])
+
+    logger.info("Converting 043 RDF to v1.0 (streaming): %s", input_path)
+    triples = _TripleReader(input_path)
+
+    subjects = _collect_subjects(triples, vocab_config)
+
+    vocab_name = input_path.stem.lower()
+    if id_pattern is None:
+        id_pattern = get_id_pattern(vocab_name, vocab_config)
+    stats = MigrationStats(input_path, output_path)
+    scheme_graph = Graph()
+
+    logger.info("Writing v1.0 RDF to: %s", output_path)
+    tmp_path = output_path.with_name(f"{output_path.name}.tmp")
+    with tmp_path.open("w", encoding="utf-8") as out:
+        if output_format == "turtle":
+            _write_prefixes(out, triples.namespaces(), vocab_config)
+        writer = _TripleWriter(out)
+
+        for s, p, o in triples:
+            stats.triples_in += 1
+            new_triple = _transform_triple_043_to_v1(
+                s,
+                p,
+                o,
+                subjects.concepts,
+                subjects.collections,
+                subjects.concept_schemes,
+                stats.dropped_predicates,
+                id_pattern,
+            )
+            if new_triple is None:
+                continue
+            if vocab_config is not None and subjects.is_scheme_metadata(new_triple):
+                scheme_graph.add(new_triple)
+            else:
+                writer.write(new_triple)
+
+        if vocab_config is not None:
+            _enrich_concept_scheme_from_config(scheme_graph, vocab_config)
+            for triple in scheme_graph:
+                writer.write(triple)
+            _write_provenance_triples(
+                writer,
+                subjects.concepts | subjects.collections,
+                vocab_name,
+                vocab_config,
+            )
+    stats.triples_out = writer.written
+    os.replace(tmp_path, output_path)
+
+    _log_dropped_predicates(stats.dropped_predicates)
+    logger.info(
+        "Conversion complete: %d triples in, %d triples out",
+        stats.triples_in,
+        stats.triples_out,
+    )
+    return stats
+
+
 def _transform_triple_043_to_v1(  # noqa: PLR0911
     s: URIRef,
     p: URIRef,
@@ -457,7 +779,7 @@ def _transform_triple_043_to_v1(  # noqa: PLR0911
     concepts: set[URIRef],
     collections: set[URIRef],
     concept_schemes: set[URIRef],
-    unknown_predicates: set[URIRef],
+    unknown_predicates: Counter,
     id_pattern: re.Pattern[str] | None = None,
 ) -> tuple | None:
     """Transform a single triple from 043 to v1.0 format.
@@ -469,7 +791,7 @@ def _transform_triple_043_to_v1(  # noqa: PLR0911
         concepts: Set of concept IRIs (for rdfs:isDefinedBy handling)
         collections: Set of collection IRIs (for dcterms:isPartOf handling)
         concept_schemes: Set of ConceptScheme IRIs (for dcterms:hasPart handling)
-        unknown_predicates: Set to collect unknown predicates
+        unknown_predicates: Counter of the triples with unknown predicates
         id_pattern: Compiled regex pattern for extracting IDs from identifiers.
 
     Returns:
@@ -528,6 +850,6 @@ def _transform_triple_043_to_v1(  # noqa: PLR0911
     if str(p).startswith("https://schema.org/"):
         return (s, p, o)
 
-    # Unknown predicate - collect for warning and drop
-    unknown_predicates.add(p)
+    # Unknown predicate - count for warning and drop
+    unknown_predicates[p] += 1
     return None
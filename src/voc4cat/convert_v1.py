@@ -54,6 +54,7 @@ from voc4cat.convert_v1_helpers import (
     validate_deprecation,
     validate_entity_deprecation,
 )
+from voc4cat.id_space import IdSpace
 from voc4cat.models_v1 import (
     COLLECTIONS_EXPORT_CONFIG,
     COLLECTIONS_READ_CONFIG,
@@ -1622,11 +1623,11 @@ def rdf_to_excel_v1(
     id_ranges_v1: list[IDRangeInfoV1] | None = None
     if vocab_config is not None and vocab_config.id_range:
         logger.debug("Building ID range info...")
-        used_ids = extract_used_ids(concepts_v1, collections_v1, vocab_config)
+        used_ids = IdSpace(extract_used_ids(concepts_v1, collections_v1, vocab_config))
         id_ranges_v1 = build_id_range_info(vocab_config, used_ids)
         # Derive contributors from ID range usage
         logger.debug("Deriving contributors from ID range usage...")
-        derived_contributors = derive_contributors(vocab_config, used_ids)
+        derived_contributors = derive_contributors(vocab_config, used_ids, vocab_name)
         if derived_contributors:
             concept_scheme_v1 = concept_scheme_v1.model_copy(
                 update={"contributor": derived_contributors}
@@ -2787,7 +2788,7 @@ def excel_to_rdf_v1(
     if vocab_config.id_range:
         logger.debug("Deriving contributors from ID range usage...")
         used_ids = extract_used_ids(concept_rows, collection_rows, vocab_config)
-        derived_contributors = derive_contributors(vocab_config, used_ids)
+        derived_contributors = derive_contributors(vocab_config, used_ids, vocab_name)
 
     # Build ConceptScheme from config (xlsx sheet is read-only, never read)
     concept_scheme = config_to_concept_scheme_v1(
@@ -20,6 +20,7 @@ import curies
 from jinja2 import Template
 
 from voc4cat import config
+from voc4cat.id_space import IdSpace
 from voc4cat.models_v1 import (
     CollectionV1,
     ConceptV1,
@@ -446,19 +447,20 @@ def extract_used_ids(
 
 def build_id_range_info(
     vocab_config: Vocab,
-    used_ids: set[int],
+    used_ids: set[int] | IdSpace,
 ) -> list[IDRangeInfoV1]:
     """Build ID range info rows from config and usage data.
 
     Args:
         vocab_config: Vocab config with id_range list and id_length.
-        used_ids: Set of integer IDs that are in use.
+        used_ids: Integer IDs that are in use (set or IdSpace).
 
     Returns:
         List of IDRangeInfoV1 model instances.
     """
     rows: list[IDRangeInfoV1] = []
     id_length = vocab_config.id_length
+    id_space = used_ids if isinstance(used_ids, IdSpace) else IdSpace(used_ids)
 
     for idr in vocab_config.id_range:
         # Determine identifier: gh_name or orcid fallback
@@ -473,16 +475,14 @@ def build_id_range_info(
         range_str = f"{idr.first_id:0{id_length}d} - {idr.last_id:0{id_length}d}"
 
         # Calculate unused IDs in this range
-        range_ids = set(range(idr.first_id, idr.last_id + 1))
-        unused_in_range = range_ids - used_ids
+        first_unused = id_space.next_unused(idr.first_id, idr.last_id)
 
-        if not unused_in_range:
+        if first_unused is None:
             unused_str = "all IDs used. Request a new range!"
         else:
-            first_unused = min(unused_in_range)
+            unused_count = id_space.count_unused(idr.first_id, idr.last_id)
             unused_str = (
-                f"next unused: {first_unused:0{id_length}d}, "
-                f"unused: {len(unused_in_range)}"
+                f"next unused: {first_unused:0{id_length}d}, unused: {unused_count}"
             )
 
         rows.append(
@@ -532,7 +532,8 @@ def format_contributor_string(idr: IdrangeItem) -> str:
 
 def derive_contributors(
     vocab_config: Vocab,
-    used_ids: set[int],
+    used_ids: set[int] | IdSpace,
+    vocab_name: str,
 ) -> str:
     """Derive contributors from ID range usage.
 
@@ -541,13 +542,16 @@ def derive_contributors(
 
     Args:
         vocab_config: Vocab configuration from idranges.toml.
-        used_ids: Set of integer IDs that are in use.
+        used_ids: Integer IDs that are in use (set or IdSpace).
+        vocab_name: Name of the vocabulary; its ID ranges are looked up in
+            ``config.ID_RANGE_INDEX``.
 
     Returns:
         Multi-line string of contributors, one per line, format:
         "<name> <orcid-URL or github-URL>"
     """
     contributors: list[str] = []
+    id_space = used_ids if isinstance(used_ids, IdSpace) else IdSpace(used_ids)
 
     # Parse creator field to extract identifiers for exclusion
     creator_identifiers: set[str] = set()
@@ -572,11 +576,10 @@ def derive_contributors(
                         gh = part.split("github.com/")[-1].rstrip("/")
                         creator_identifiers.add(gh.lower())
 
-    for idr in vocab_config.id_range:
-        # Check if any IDs from this range are used
-        range_ids = set(range(idr.first_id, idr.last_id + 1))
-        if not (range_ids & used_ids):
-            continue  # No IDs used from this range
+    # Ranges with at least one used ID, in the order of the config
+    index = config.ID_RANGE_INDEX.get(vocab_name)
+    in_use = [] if index is None else index.owners_in_use(id_space)
+    for idr in sorted(in_use, key=vocab_config.id_range.index):
 
         # Skip if this contributor is in the creator list
         skip = False
@@ -0,0 +1,154 @@
+"""On-disk cache for sentence embeddings of the vocabulary assistant.
+
+Encoding all labels and definitions of a large vocabulary with a Sentence
+Transformers model takes minutes on a CPU, although only a few texts change
+between two runs. The cache stores the embeddings per model in a NumPy array
+that is opened memory-mapped, plus a JSON index that maps the hash of each
+text to its row. Only texts missing in the cache are encoded.
+
+Entries not used in the last ``max_unused_runs`` runs are evicted when the
+cache is saved.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "index.json"
+EMBEDDINGS_FILE = "embeddings.npy"
+CACHE_VERSION = 1
+
+
+def text_hash(text: str) -> str:
+    """Return the key of a text in the cache."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """Embeddings of texts for one model, stored in a directory.
+
+    Args:
+        cache_dir: Directory of the cache; each model gets a subdirectory.
+        model_name: Name of the model that computes the embeddings.
+        max_unused_runs: Number of runs after which unused entries are evicted.
+    """
+
+    def __init__(self, cache_dir: Path, model_name: str, max_unused_runs: int = 5):
+        self.model_name = model_name
+        self.max_unused_runs = max_unused_runs
+        self.path = Path(cache_dir) / re.sub(r"[^\w.-]", "_", model_name)
+        self.run = 1
+        self.rows = {}  # text hash -> row in embeddings
+        self.last_used = {}  # text hash -> run in which the entry was last used
+        self.embeddings = None  # memory-mapped array of stored embeddings
+        self.added = {}  # text hash -> embedding computed in this run
+        self._load()
+
+    def _load(self) -> None:
+        index_file = self.path / INDEX_FILE
+        if not index_file.exists():
+            return
+        index = json.loads(index_file.read_text(encoding="utf-8"))
+        if (
+            index.get("version") != CACHE_VERSION
+            or index.get("model") != self.model_name
+        ):
+            logger.info("Ignoring incompatible embedding cache in %s", self.path)
+            return
+        self.run = index["run"] + 1
+        for key, (row, last_used) in index["entries"].items():
+            self.rows[key] = row
+            self.last_used[key] = last_used
+        if self.rows:
+            self.embeddings = np.load(self.path / EMBEDDINGS_FILE, mmap_mode="r")
+        logger.debug("Loaded %i cached embeddings from %s", len(self.rows), self.path)
+
+    def encode(
+        self, texts: list[str], encode_func: Callable[[list[str]], np.ndarray]
+    ) -> np.ndarray:
+        """Return the embeddings of texts; encode only texts not in the cache.
+
+        Args:
+            texts: Texts to get the embeddings for.
+            encode_func: Function that computes the embeddings of a list of
+                texts as 2D array (e.g. ``SentenceTransformer.encode``).
+
+        Returns:
+            Array with one row per text.
+        """
+        keys = [text_hash(text) for text in texts]
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in self.rows and key not in self.added:
+                missing.setdefault(key, text)
+        if missing:
+            logger.debug("Encoding %i text(s) not in the cache.", len(missing))
+            vectors = np.asarray(encode_func(list(missing.values())))
+            self.added.update(zip(missing, vectors))
+        logger.debug("Using %i cached embedding(s).", len(texts) - len(missing))
+
+        for key in keys:
+            self.last_used[key] = self.run
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack(
+            [
+                self.added[key]
+                if key in self.added
+                else self.embeddings[self.rows[key]]
+                for key in keys
+            ]
+        )
+
+    def save(self) -> None:
+        """Write new entries to disk and evict entries that were unused too long."""
+        keep = [
+            key
+            for key in self.rows
+            if self.run - self.last_used[key] < self.max_unused_runs
+        ]
+        evicted = len(self.rows) - len(keep)
+        blocks = []
+        if keep:
+            blocks.append(np.asarray(self.embeddings[[self.rows[k] for k in keep]]))
+        if self.added:
+            blocks.append(np.stack(list(self.added.values())))
+        keys = keep + list(self.added)
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        if self.added or evicted:
+            # Close the memory map before the file gets replaced.
+            self.embeddings = None
+            tmp_file = self.path / f"{EMBEDDINGS_FILE}.tmp"
+            with tmp_file.open("wb") as f:
+                np.save(f, np.concatenate(blocks) if blocks else np.empty((0, 0)))
+            os.replace(tmp_file, self.path / EMBEDDINGS_FILE)
+            self.rows = {key: row for row, key in enumerate(keys)}
+            self.added = {}
+            if self.rows:
+                self.embeddings = np.load(self.path / EMBEDDINGS_FILE, mmap_mode="r")
+        self.last_used = {key: self.last_used[key] for key in keys}
+
+        index = {
+            "version": CACHE_VERSION,
+            "model": self.model_name,
+            "run": self.run,
+            "entries": {key: [self.rows[key], self.last_used[key]] for key in keys},
+        }
+        tmp_file = self.path / f"{INDEX_FILE}.tmp"
+        tmp_file.write_text(json.dumps(index), encoding="utf-8")
+        os.replace(tmp_file, self.path / INDEX_FILE)
+        logger.info(
+            "Embedding cache saved: %i entries (%i evicted) in %s",
+            len(keys),
+            evicted,
+            self.path,
+        )
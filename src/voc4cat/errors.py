@@ -0,0 +1,13 @@
+"""Exceptions of voc4cat.
+
+This module has no dependencies so the command line interface can handle
+errors without importing the modules of the subcommands.
+"""
+
+
+class Voc4catError(Exception):
+    pass
+
+
+class ConversionError(Exception):
+    pass
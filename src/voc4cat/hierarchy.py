@@ -0,0 +1,150 @@
+"""Index of the skos:broader hierarchy of a vocabulary.
+
+Walking up the hierarchy with ``Graph.transitive_objects`` for every pair of
+parents repeats the same traversals again and again, which gets slow for deep
+polyhierarchies. The index computes the ancestor set of every concept once.
+Ancestor sets are stored as integer bitsets (bit i = concept number i) and
+computed along the strongly connected components of the hierarchy, so that
+cycles are handled and found as well.
+"""
+
+import logging
+from collections import deque
+
+from rdflib import SKOS, Graph
+
+logger = logging.getLogger(__name__)
+
+
+def _pop_component(stack: list, on_stack: set, root) -> list:
+    """Pop the strongly connected component with the given root from stack."""
+    component = []
+    while True:
+        member = stack.pop()
+        on_stack.discard(member)
+        component.append(member)
+        if member == root:
+            return sorted(component)
+
+
+class HierarchyIndex:
+    """Ancestor sets and cycles of the skos:broader relations of a graph."""
+
+    def __init__(self, graph: Graph):
+        self.parents = {}
+        for child, parent in graph.subject_objects(SKOS.broader):
+            self.parents.setdefault(child, set()).add(parent)
+            self.parents.setdefault(parent, set())
+        self.nodes = sorted(self.parents)
+        self._bit = {node: i for i, node in enumerate(self.nodes)}
+        self._ancestors = {}
+        self.components = self._strongly_connected_components()
+        for component in self.components:
+            self._add_ancestors(component)
+
+    def _strongly_connected_components(self) -> list[list]:
+        """Return the SCCs (Tarjan), each after all SCCs of its ancestors."""
+        index = {}
+        lowlink = {}
+        on_stack = set()
+        stack = []
+        components = []
+        for root in self.nodes:
+            if root in index:
+                continue
+            # Iterative DFS to support deep hierarchies.
+            work = [(root, iter(sorted(self.parents[root])))]
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, parents = work[-1]
+                for parent in parents:
+                    if parent not in index:
+                        index[parent] = lowlink[parent] = len(index)
+                        stack.append(parent)
+                        on_stack.add(parent)
+                        work.append((parent, iter(sorted(self.parents[parent]))))
+                        break
+                    if parent in on_stack:
+                        lowlink[node] = min(lowlink[node], index[parent])
+                else:
+                    work.pop()
+                    if work:
+                        caller = work[-1][0]
+                        lowlink[caller] = min(lowlink[caller], lowlink[node])
+                    if lowlink[node] == index[node]:
+                        components.append(_pop_component(stack, on_stack, node))
+        return components
+
+    def _add_ancestors(self, component: list) -> None:
+        """Compute the ancestor bitset shared by all members of a component."""
+        members = set(component)
+        bits = 0
+        for node in component:
+            for parent in self.parents[node]:
+                bits |= 1 << self._bit[parent]
+                if parent not in members:
+                    bits |= self._ancestors[parent]
+        for node in component:
+            self._ancestors[node] = bits
+
+    def ancestors(self, node) -> set:
+        """Return all nodes reachable from node via skos:broader."""
+        bits = self._ancestors.get(node, 0)
+        return {n for i, n in enumerate(self.nodes) if bits >> i & 1}
+
+    def is_ancestor(self, ancestor, node) -> bool:
+        """Return True if ancestor is reachable from node via skos:broader."""
+        bit = self._bit.get(ancestor)
+        return bit is not None and bool(self._ancestors.get(node, 0) >> bit & 1)
+
+    def redundancies(self) -> list[tuple]:
+        """Return (concept, redundant ancestor, intermediate parent) tuples.
+
+        A skos:broader relation from concept to a parent is redundant if the
+        parent is also an ancestor of another parent of the concept.
+        """
+        found = []
+        for concept in self.nodes:
+            parents = sorted(self.parents[concept])
+            if len(parents) < 2:  # noqa: PLR2004
+                continue
+            for parent1 in parents:
+                for parent2 in parents:
+                    if parent1 != parent2 and self.is_ancestor(parent2, parent1):
+                        found.append((concept, parent2, parent1))
+        return found
+
+    def cycles(self) -> list[list]:
+        """Return one cycle (list of nodes, first = last) per cyclic component."""
+        found = []
+        for component in self.components:
+            start = component[0]
+            if len(component) == 1 and start not in self.parents[start]:
+                continue
+            found.append(self._shortest_cycle(start, set(component)))
+        return found
+
+    def _shortest_cycle(self, start, members: set) -> list:
+        """Return the shortest path from start back to start within members."""
+        previous = {}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for parent in sorted(self.parents[node]):
+                if parent not in members or parent in previous:
+                    continue
+                previous[parent] = node
+                if parent == start:
+                    queue.clear()
+                    break
+                queue.append(parent)
+        path = [start]
+        node = previous[start]
+        while node != start:
+            path.append(node)
+            node = previous[node]
+        path.append(start)
+        path.reverse()
+        return path
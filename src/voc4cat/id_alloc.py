@@ -0,0 +1,292 @@
+"""Find free IDs in the ID ranges of a vocabulary.
+
+The used IDs are read from the filenames of a split vocabulary directory
+(``IDs0000xxx/0000123.ttl``, see ``transform --split``); no RDF is parsed.
+They are kept in a bitmap with one bit per ID. Each partition directory holds
+1000 IDs, which are exactly 125 bytes of the bitmap.
+
+The bitmap can be saved to a cache file together with the modification time
+of each partition directory. When it is loaded again, only the partitions
+that were added, removed or changed since then are listed again.
+"""
+
+import json
+import logging
+import re
+from pathlib import Path
+
+from voc4cat import config
+from voc4cat.config import IdrangeItem
+from voc4cat.errors import Voc4catError
+from voc4cat.transform import PARTITION_SIZE
+
+logger = logging.getLogger(__name__)
+
+BITMAP_VERSION = 1
+PARTITION_BYTES = PARTITION_SIZE // 8
+PARTITION_DIR_PATTERN = re.compile(r"^IDs(?P<partition>[0-9]+)xxx$")
+ID_FILE_PATTERN = re.compile(r"^(?P<id>[0-9]+)\.ttl$")
+# Runs of bytes without or with only used IDs, or a single mixed byte
+_BYTE_RUNS = re.compile(rb"\x00+|\xff+|[\x01-\xfe]")
+# Unused bit positions of each byte value
+_FREE_BITS = [[bit for bit in range(8) if not value >> bit & 1] for value in range(256)]
+
+
+class UsedIdBitmap:
+    """Bitmap of the IDs used in a split vocabulary directory.
+
+    Attributes:
+        bits: One bit per ID; bit ``id % 8`` of byte ``id // 8`` is set if
+            the ID is used.
+        partitions: Modification time (ns) of each scanned partition directory.
+        vocab_dir: The scanned directory.
+    """
+
+    def __init__(self):
+        self.bits = bytearray()
+        self.partitions = {}
+        self.vocab_dir = ""
+
+    def is_used(self, id_: int) -> bool:
+        byte = id_ >> 3
+        return byte < len(self.bits) and bool(self.bits[byte] & (1 << (id_ & 7)))
+
+    def _set(self, id_: int) -> None:
+        byte = id_ >> 3
+        if byte >= len(self.bits):
+            self.bits.extend(bytes(byte + 1 - len(self.bits)))
+        self.bits[byte] |= 1 << (id_ & 7)
+
+    def _scan_partition(self, partition_dir: Path, partition: int) -> None:
+        """Replace the bits of a partition by the IDs of its files."""
+        start = partition * PARTITION_BYTES
+        if start < len(self.bits):
+            end = min(start + PARTITION_BYTES, len(self.bits))
+            self.bits[start:end] = bytes(end - start)
+        if not partition_dir.is_dir():
+            self.partitions.pop(partition_dir.name, None)
+            return
+        self.partitions[partition_dir.name] = partition_dir.stat().st_mtime_ns
+        for file in partition_dir.iterdir():
+            match = ID_FILE_PATTERN.match(file.name)
+            if match:
+                self._set(int(match.group("id")))
+
+    def update(self, vocab_dir: Path) -> int:
+        """Rescan the partition directories that changed since the last scan.
+
+        Returns:
+            Number of partition directories that were scanned.
+        """
+        if self.vocab_dir != str(vocab_dir.resolve()):
+            # Bitmap of another directory: start from scratch.
+            self.bits = bytearray()
+            self.partitions = {}
+            self.vocab_dir = str(vocab_dir.resolve())
+        current = {
+            path.name: path
+            for path in vocab_dir.iterdir()
+            if path.is_dir() and PARTITION_DIR_PATTERN.match(path.name)
+        }
+        changed = [
+            name
+            for name, path in current.items()
+            if self.partitions.get(name) != path.stat().st_mtime_ns
+        ]
+        changed += [name for name in self.partitions if name not in current]
+        for name in changed:
+            partition = int(PARTITION_DIR_PATTERN.match(name).group("partition"))
+            self._scan_partition(vocab_dir / name, partition)
+        logger.debug("Scanned %i changed ID partition(s).", len(changed))
+        return len(changed)
+
+    @classmethod
+    def from_directory(cls, vocab_dir: Path) -> "UsedIdBitmap":
+        """Build the bitmap from the filenames of a split vocabulary."""
+        bitmap = cls()
+        bitmap.update(vocab_dir)
+        return bitmap
+
+    def count_used(self, first: int, last: int) -> int:
+        """Return the number of used IDs in the range first..last."""
+        if last < first or first >= len(self.bits) * 8:
+            return 0
+        last = min(last, len(self.bits) * 8 - 1)
+        value = int.from_bytes(self.bits[first >> 3 : (last >> 3) + 1], "little")
+        value >>= first & 7
+        value &= (1 << (last - first + 1)) - 1
+        return value.bit_count()
+
+    def free_ids(self, first: int, last: int, count: int | None = None) -> list[int]:
+        """Return up to count unused IDs of the range first..last (all if None).
+
+        Runs of bytes with no or all bits set are handled as a whole; only
+        bytes with both used and unused IDs are looked at bit by bit.
+        """
+        free = []
+        limit = max(last + 1 - first, 0) if count is None else count
+        end = min(last + 1, len(self.bits) * 8)
+        if first < end:
+            for run in _BYTE_RUNS.finditer(self.bits, first >> 3, (end + 7) >> 3):
+                value = run.group()[0]
+                if value == 0xFF:  # noqa: PLR2004
+                    continue
+                base = run.start() * 8
+                start_id, stop_id = max(first, base), min(end, run.end() * 8)
+                if value == 0:
+                    ids = range(start_id, stop_id)
+                else:
+                    ids = [
+                        base + bit
+                        for bit in _FREE_BITS[value]
+                        if start_id <= base + bit < stop_id
+                    ]
+                free.extend(ids[: limit - len(free)])
+                if len(free) >= limit:
+                    return free
+        # Everything above the highest used ID is free.
+        free.extend(range(max(first, end), last + 1)[: limit - len(free)])
+        return free
+
+    def save(self, path: Path) -> None:
+        """Save the bitmap with the scanned partitions to a cache file."""
+        header = {
+            "version": BITMAP_VERSION,
+            "vocab_dir": self.vocab_dir,
+            "partitions": self.partitions,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            f.write(self.bits)
+        logger.debug("ID bitmap saved to %s", path)
+
+    @classmethod
+    def load(cls, path: Path) -> "UsedIdBitmap":
+        """Load a bitmap saved with ``save``; returns an empty one if unusable."""
+        bitmap = cls()
+        if not path.exists():
+            return bitmap
+        with path.open("rb") as f:
+            header_line = f.readline()
+            bits = f.read()
+        try:
+            header = json.loads(header_line)
+        except json.JSONDecodeError:
+            header = {}
+        if header.get("version") != BITMAP_VERSION:
+            logger.info("Ignoring incompatible ID bitmap cache %s", path)
+            return bitmap
+        bitmap.bits = bytearray(bits)
+        bitmap.vocab_dir = header["vocab_dir"]
+        bitmap.partitions = header["partitions"]
+        return bitmap
+
+
+def load_used_ids(vocab_dir: Path, cache_file: Path | None = None) -> UsedIdBitmap:
+    """Return the bitmap of used IDs of a split vocabulary directory.
+
+    With a cache file, the saved bitmap is updated for the changed partition
+    directories and saved again.
+    """
+    if cache_file is None:
+        return UsedIdBitmap.from_directory(vocab_dir)
+    bitmap = UsedIdBitmap.load(cache_file)
+    if bitmap.update(vocab_dir) or not cache_file.exists():
+        bitmap.save(cache_file)
+    return bitmap
+
+
+def _actor_names(idr: IdrangeItem) -> set[str]:
+    """Return the names by which the owner of an ID range can be given."""
+    names = set()
+    if idr.gh_name:
+        names.add(idr.gh_name.lower())
+    if idr.orcid:
+        names.add(str(idr.orcid).lower())
+        names.add(str(idr.orcid).split("orcid.org/")[-1].lower())
+    if idr.ror_id:
+        names.add(str(idr.ror_id).lower())
+    return names
+
+
+def actor_id_ranges(vocab_name: str, actor: str | None = None) -> list[IdrangeItem]:
+    """Return the ID ranges of an actor (GitHub name, ORCID or ROR ID) or all ranges.
+
+    The ranges are taken from ``config.ID_RANGE_INDEX`` and sorted by first ID.
+    """
+    index = config.ID_RANGE_INDEX.get(vocab_name)
+    ranges = [] if index is None else index.owners
+    if actor is None:
+        return list(ranges)
+    return [idr for idr in ranges if actor.lower() in _actor_names(idr)]
+
+
+def allocate_ids(
+    vocab_dir: Path,
+    vocab_name: str,
+    actor: str | None = None,
+    count: int | None = None,
+    cache_file: Path | None = None,
+) -> list[tuple[IdrangeItem, int, list[int]]]:
+    """Find free IDs in the ID ranges of an actor (or of all actors).
+
+    Args:
+        vocab_dir: Split vocabulary directory.
+        vocab_name: Name of the vocabulary in the config.
+        actor: GitHub name, ORCID or ROR ID; all ranges if None.
+        count: Maximum number of free IDs to return in total (all if None).
+        cache_file: Optional cache file for the bitmap of used IDs.
+
+    Returns:
+        List of (ID range, number of unused IDs, free IDs) per range.
+
+    Raises:
+        Voc4catError: If count is less than 1.
+    """
+    if count is not None and count < 1:
+        msg = f"The number of IDs to allocate must be at least 1, not {count}."
+        raise Voc4catError(msg)
+    bitmap = load_used_ids(vocab_dir, cache_file)
+    result = []
+    remaining = count
+    for idr in actor_id_ranges(vocab_name, actor):
+        size = idr.last_id - idr.first_id + 1
+        unused = size - bitmap.count_used(idr.first_id, idr.last_id)
+        free = bitmap.free_ids(idr.first_id, idr.last_id, remaining)
+        if remaining is not None:
+            remaining -= len(free)
+        result.append((idr, unused, free))
+    return result
+
+
+def ids_cmd(args):
+    logger.debug("Ids subcommand started!")
+    vocab_dir = args.VOCAB
+    if not vocab_dir.is_dir():
+        msg = f'"{vocab_dir}" is not a directory with a split vocabulary.'
+        raise Voc4catError(msg)
+    vocab_name = vocab_dir.name.lower()
+    vocab_config = config.IDRANGES.vocabs.get(vocab_name)
+    if vocab_config is None:
+        msg = f'No ID ranges configured for vocabulary "{vocab_name}".'
+        raise Voc4catError(msg)
+
+    ranges = allocate_ids(vocab_dir, vocab_name, args.actor, args.count, args.cache)
+    if not ranges:
+        msg = f'No ID range found for "{args.actor}" in vocabulary "{vocab_name}".'
+        raise Voc4catError(msg)
+    id_length = vocab_config.id_length
+    for idr, unused, free in ranges:
+        owner = idr.gh_name or str(idr.orcid or idr.ror_id)
+        logger.info(
+            "ID range %0*d - %0*d (%s): %i unused",
+            id_length,
+            idr.first_id,
+            id_length,
+            idr.last_id,
+            owner,
+            unused,
+        )
+        if free:
+            logger.info("  free: %s", ", ".join(f"{i:0{id_length}d}" for i in free))
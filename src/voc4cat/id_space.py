@@ -0,0 +1,182 @@
+"""Queries on the used IDs of a vocabulary without materializing ID ranges.
+
+The ID ranges in idranges.toml may span hundreds of thousands of IDs. Instead
+of building a set with all IDs of each range, ``IdSpace`` keeps the used IDs
+in a sorted list and answers range queries by bisection:
+
+- ``count_used``/``count_unused``/``any_used`` in O(log n),
+- ``next_unused`` in O(log n) by a binary search for the first gap,
+- ``unused`` to iterate over the free IDs of a range gap by gap.
+
+n is the number of used IDs; the size of the ranges does not matter.
+
+``IdRangeIndex`` is the counterpart for the ID ranges themselves: the ranges
+of a vocabulary do not overlap, so sorted lists of their first and last IDs
+answer ownership ("which range contains ID n") and overlap queries by
+bisection as well.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import Any
+
+
+class IdSpace:
+    """Sorted set of used numeric IDs with range queries.
+
+    Ranges are given by their first and last ID (both inclusive), as in
+    idranges.toml.
+
+    Args:
+        used_ids: The IDs that are in use.
+    """
+
+    def __init__(self, used_ids: Iterable[int] = ()):
+        self.ids = sorted(set(used_ids))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, id_: int) -> bool:
+        pos = bisect_left(self.ids, id_)
+        return pos < len(self.ids) and self.ids[pos] == id_
+
+    def _slice(self, first: int, last: int) -> tuple[int, int]:
+        """Return the positions of the used IDs in first..last."""
+        return bisect_left(self.ids, first), bisect_right(self.ids, last)
+
+    def count_used(self, first: int, last: int) -> int:
+        """Return the number of used IDs in the range first..last."""
+        lo, hi = self._slice(first, last)
+        return hi - lo
+
+    def count_unused(self, first: int, last: int) -> int:
+        """Return the number of unused IDs in the range first..last."""
+        return max(last - first + 1, 0) - self.count_used(first, last)
+
+    def any_used(self, first: int, last: int) -> bool:
+        """Return True if at least one ID of the range first..last is used."""
+        return self.count_used(first, last) > 0
+
+    def next_unused(self, first: int, last: int) -> int | None:
+        """Return the smallest unused ID in first..last or None if all are used."""
+        lo, hi = self._slice(first, last)
+        # ids[lo + k] - (first + k) never decreases, so the first k where the
+        # used IDs leave a gap can be found by bisection.
+        left, right = 0, hi - lo
+        while left < right:
+            mid = (left + right) // 2
+            if self.ids[lo + mid] == first + mid:
+                left = mid + 1
+            else:
+                right = mid
+        candidate = first + left
+        return candidate if candidate <= last else None
+
+    def unused(self, first: int, last: int) -> Iterator[int]:
+        """Iterate over the unused IDs in first..last in ascending order."""
+        lo, hi = self._slice(first, last)
+        start = first
+        for used in self.ids[lo:hi]:
+            yield from range(start, used)
+            start = used + 1
+        yield from range(start, last + 1)
+
+
+class IdRangeIndex:
+    """Index of non-overlapping ID ranges with an owner for each range.
+
+    The ranges are kept sorted by their first ID. Since they do not overlap,
+    the last IDs are sorted as well.
+
+    Args:
+        ranges: (first, last, owner) for each range; the ranges must not overlap.
+
+    Raises:
+        ValueError: If two ranges overlap.
+    """
+
+    def __init__(self, ranges: Iterable[tuple[int, int, Any]] = ()):
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        self.owners: list[Any] = []
+        for first, last, owner in sorted(ranges, key=lambda rng: rng[0]):
+            if self.ends and first <= self.ends[-1]:
+                self._raise_overlap(first, min(last, self.ends[-1]))
+            self.starts.append(first)
+            self.ends.append(last)
+            self.owners.append(owner)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __contains__(self, id_: int) -> bool:
+        return self._position(id_) is not None
+
+    @staticmethod
+    def _raise_overlap(first: int, last: int):
+        msg = f"Overlapping ID ranges for IDs {first}-{last}."
+        raise ValueError(msg)
+
+    def _position(self, id_: int) -> int | None:
+        """Return the position of the range that contains id_."""
+        pos = bisect_right(self.starts, id_) - 1
+        if pos >= 0 and id_ <= self.ends[pos]:
+            return pos
+        return None
+
+    def owner(self, id_: int) -> Any:
+        """Return the owner of the range that contains id_ or None."""
+        pos = self._position(id_)
+        return None if pos is None else self.owners[pos]
+
+    def overlap(self, first: int, last: int) -> tuple[int, int] | None:
+        """Return the first and last ID of first..last that are in a range.
+
+        Returns None if no ID of first..last is in a range of the index.
+        """
+        lo = bisect_left(self.ends, first)
+        hi = bisect_right(self.starts, last)
+        if lo >= hi:
+            return None
+        return max(first, self.starts[lo]), min(last, self.ends[hi - 1])
+
+    def add(self, first: int, last: int, owner: Any = None) -> None:
+        """Add the range first..last.
+
+        Raises:
+            ValueError: If the range overlaps a range of the index.
+        """
+        overlap = self.overlap(first, last)
+        if overlap is not None:
+            self._raise_overlap(*overlap)
+        pos = bisect_left(self.starts, first)
+        self.starts.insert(pos, first)
+        self.ends.insert(pos, last)
+        self.owners.insert(pos, owner)
+
+    def owners_in_use(self, id_space: IdSpace) -> list[Any]:
+        """Return the owners of the ranges with at least one used ID.
+
+        The used IDs and the ranges are walked together, skipping over
+        ranges without used IDs and over used IDs outside of any range, so
+        the cost depends on the smaller of both.
+        """
+        owners = []
+        ids = id_space.ids
+        pos_id, pos_range = 0, 0
+        while pos_id < len(ids) and pos_range < len(self.starts):
+            id_ = ids[pos_id]
+            if id_ < self.starts[pos_range]:
+                pos_id = bisect_left(ids, self.starts[pos_range], pos_id)
+            elif id_ > self.ends[pos_range]:
+                pos_range = bisect_left(self.ends, id_, pos_range)
+            else:
+                owners.append(self.owners[pos_range])
+                pos_range += 1
+        return owners
@@ -0,0 +1,169 @@
+"""Restrict SHACL validation to the part of a vocabulary that changed.
+
+A full SHACL validation visits every concept of a vocabulary, even if only a
+few concepts were changed compared to a previous (validated) version. The
+functions in this module determine the changed subjects, extend them by
+their SKOS neighbours and build a subgraph that contains everything the
+shapes need to validate these focus nodes.
+"""
+
+import logging
+import subprocess
+from pathlib import Path
+
+from rdflib import BNode, Graph, URIRef
+from rdflib.namespace import RDF, SKOS
+from rdflib.util import guess_format
+
+from voc4cat.errors import Voc4catError
+from voc4cat.transform import (
+    GitBlobReader,
+    _run_git,
+    repo_relative_path,
+    validate_git_ref,
+)
+
+logger = logging.getLogger(__name__)
+
+# Predicates that link a subject to the nodes whose validation may depend on it.
+NEIGHBOUR_PREDICATES = (
+    SKOS.broader,
+    SKOS.narrower,
+    SKOS.member,
+    SKOS.inScheme,
+    SKOS.hasTopConcept,
+    SKOS.topConceptOf,
+)
+
+
+def _describe(graph: Graph, node, seen: frozenset = frozenset()) -> frozenset:
+    """Return a hashable description of node independent of blank node labels."""
+    desc = []
+    for p, o in graph.predicate_objects(node):
+        if not isinstance(o, BNode):
+            desc.append((p, o))
+        elif o not in seen:
+            # Blank nodes are described by their content.
+            desc.append((p, _describe(graph, o, seen | {node})))
+    return frozenset(desc)
+
+
+def changed_subjects(old: Graph, new: Graph) -> set[URIRef]:
+    """Return the IRIs of all subjects that differ between old and new.
+
+    Subjects that were added or removed are included. Triples of blank nodes
+    count for the IRI subject that refers to them.
+
+    Args:
+        old: The previous version of the vocabulary.
+        new: The current version of the vocabulary.
+
+    Returns:
+        Set of changed subject IRIs.
+    """
+    subjects = {s for s in old.subjects(unique=True) if isinstance(s, URIRef)}
+    subjects |= {s for s in new.subjects(unique=True) if isinstance(s, URIRef)}
+    return {s for s in subjects if _describe(old, s) != _describe(new, s)}
+
+
+def get_focus_nodes(old: Graph, new: Graph) -> set[URIRef]:
+    """Return the nodes of new that need validation after changes from old.
+
+    These are the changed subjects plus their SKOS neighbours (broader,
+    narrower, member, inScheme, hasTopConcept, topConceptOf in both
+    directions). Neighbours are taken from both versions, so that e.g. the
+    narrower concepts of a removed concept are validated again.
+
+    Args:
+        old: The previous (validated) version of the vocabulary.
+        new: The current version of the vocabulary.
+
+    Returns:
+        Set of IRIs that are subjects in new.
+    """
+    changed = changed_subjects(old, new)
+    focus = set(changed)
+    for graph in (old, new):
+        for node in changed:
+            for pred in NEIGHBOUR_PREDICATES:
+                focus.update(graph.objects(node, pred))
+                focus.update(graph.subjects(pred, node))
+    return {
+        node for node in focus if isinstance(node, URIRef) and (node, None, None) in new
+    }
+
+
+def build_focus_subgraph(graph: Graph, focus_nodes: set) -> tuple[Graph, set]:
+    """Build the subgraph needed to validate focus_nodes.
+
+    The subgraph contains the concise bounded description (CBD) of each focus
+    node, the CBD of each IRI these refer to (e.g. the broader concept or an
+    agent, for sh:class and sh:node constraints) and all concept schemes.
+
+    Args:
+        graph: The full vocabulary graph.
+        focus_nodes: IRIs to validate.
+
+    Returns:
+        Tuple of (subgraph, context nodes). The context nodes are only
+        included to validate the focus nodes; validation results for them
+        must be ignored.
+    """
+    subgraph = Graph()
+    for node in focus_nodes:
+        subgraph += graph.cbd(node)
+    in_focus = set(subgraph.subjects(unique=True))
+
+    referenced = {
+        o
+        for p, o in subgraph.predicate_objects()
+        if isinstance(o, URIRef) and p != RDF.type and o not in focus_nodes
+    }
+    for node in referenced:
+        subgraph += graph.cbd(node)
+    # A vocabulary must have exactly one concept scheme.
+    for scheme in graph.subjects(RDF.type, SKOS.ConceptScheme):
+        subgraph.add((scheme, RDF.type, SKOS.ConceptScheme))
+
+    context = set(subgraph.subjects(unique=True)) - in_focus
+    return subgraph, context - set(focus_nodes)
+
+
+def git_toplevel(path: Path) -> Path:
+    """Return the root of the git repository containing path."""
+    try:
+        proc = _run_git(["git", "rev-parse", "--show-toplevel"], path)
+    except subprocess.CalledProcessError as exc:
+        msg = f'"{path}" is not inside a git repository.'
+        raise Voc4catError(msg) from exc
+    return Path(proc.stdout.strip())
+
+
+def load_base_graph(file: Path, base: str) -> Graph | None:
+    """Load the previous version of a vocabulary file.
+
+    Args:
+        file: The current vocabulary file.
+        base: Either a directory with the previous vocabulary files or a git
+              ref (branch, tag or commit).
+
+    Returns:
+        The previous version as graph or None if there is no previous version.
+
+    Raises:
+        Voc4catError: If base is neither a directory nor a valid git ref.
+    """
+    base_dir = Path(base)
+    if base_dir.is_dir():
+        base_file = base_dir / file.name
+        if not base_file.exists():
+            return None
+        return Graph().parse(base_file)
+
+    repo_dir = git_toplevel(file.resolve().parent)
+    validate_git_ref(base, repo_dir)
+    with GitBlobReader(repo_dir) as reader:
+        content = reader.read(base, repo_relative_path(file.resolve(), repo_dir))
+    if content is None:
+        return None
+    return Graph().parse(data=content, format=guess_format(file.name) or "turtle")
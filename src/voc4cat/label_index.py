@@ -0,0 +1,234 @@
+"""Inverted index of the labels of a vocabulary.
+
+The index maps character n-grams and tokens of the normalised prefLabels and
+altLabels to the index entries that contain them. It is used
+
+- to generate candidates for the Levenshtein similarity search of the
+  vocabulary assistant without comparing each label with every other label,
+- to find labels used by more than one concept (``check --duplicate-labels``).
+
+The candidate search uses the q-gram count filter: two strings with an edit
+distance of at most k share at least max(len1, len2) + q - 1 - k*q padded
+q-grams. Only the postings of the rarest n-grams of a label are scanned
+(prefix filter). No pair with a similarity above the threshold is missed, but
+the candidates must still be scored.
+
+An index can be saved as JSON and loaded again to reuse it between runs
+without building it again.
+"""
+
+import json
+import logging
+import math
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from rdflib import RDF, SKOS, Graph
+
+logger = logging.getLogger(__name__)
+
+NGRAM_SIZE = 3
+# Padding character for n-grams at the start and end of a label
+PAD = "\x02"
+INDEX_VERSION = 1
+
+
+def normalise_label(label: str) -> str:
+    """Normalise a label: lowercase, replace hyphens with spaces and strip.
+
+    Normalising a normalised label does not change it.
+    """
+    return label.lower().replace("-", " ").strip()
+
+
+def ngrams(text: str, size: int = NGRAM_SIZE) -> Counter:
+    """Return the padded character n-grams of text with their counts."""
+    padded = PAD * (size - 1) + text + PAD * (size - 1)
+    return Counter(padded[i : i + size] for i in range(len(padded) - size + 1))
+
+
+class LabelIndex:
+    """N-gram and token index of labels.
+
+    Each entry is a label of a concept identified by its position in the
+    index. The lists ``iris``, ``langs``, ``kinds``,
+    ``labels`` and ``texts`` (normalised labels) hold the entry data.
+
+    Args:
+        size: Length of the character n-grams.
+    """
+
+    def __init__(self, size: int = NGRAM_SIZE):
+        self.size = size
+        self.iris = []
+        self.langs = []
+        self.kinds = []
+        self.labels = []
+        self.texts = []
+        self.grams = defaultdict(list)  # n-gram -> [(entry, count), ...]
+        self.tokens = defaultdict(list)  # token -> [entry, ...]
+        self._by_length = defaultdict(list)  # text length -> [entry, ...]
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def add(self, iri: str, label: str, lang: str = "", kind: str = "pref") -> int:
+        """Add a label of the concept iri and return its entry number."""
+        entry = len(self.texts)
+        text = normalise_label(label)
+        self.iris.append(iri)
+        self.langs.append(lang)
+        self.kinds.append(kind)
+        self.labels.append(label)
+        self.texts.append(text)
+        self._index_entry(entry)
+        return entry
+
+    def _index_entry(self, entry: int) -> None:
+        text = self.texts[entry]
+        for gram, count in ngrams(text, self.size).items():
+            self.grams[gram].append((entry, count))
+        for token in set(text.split()):
+            self.tokens[token].append(entry)
+        self._by_length[len(text)].append(entry)
+
+    @classmethod
+    def from_graph(cls, graph: Graph, size: int = NGRAM_SIZE) -> "LabelIndex":
+        """Build the index from the prefLabels and altLabels of all concepts."""
+        index = cls(size)
+        for subject in sorted(graph.subjects(RDF.type, SKOS.Concept)):
+            for pred, kind in ((SKOS.prefLabel, "pref"), (SKOS.altLabel, "alt")):
+                for label in sorted(graph.objects(subject, pred)):
+                    lang = getattr(label, "language", None) or ""
+                    index.add(str(subject), str(label), lang, kind)
+        return index
+
+    @classmethod
+    def from_concepts(
+        cls, rows, size: int = NGRAM_SIZE, *, converter=None
+    ) -> "LabelIndex":
+        """Build the index from the concept rows of an xlsx file (ConceptV1).
+
+        With a curies converter, the concept IRIs (CURIEs in the xlsx file)
+        are expanded to full IRIs as in an index built with ``from_graph``.
+        """
+        from voc4cat.convert_v1 import strip_label_from_iri  # noqa: PLC0415
+        from voc4cat.convert_v1_helpers import expand_curie  # noqa: PLC0415
+
+        index = cls(size)
+        for row in rows:
+            if not row.concept_iri:
+                continue
+            iri = strip_label_from_iri(row.concept_iri)
+            if converter is not None:
+                iri = expand_curie(iri, converter)
+            lang = row.language_code or ""
+            if row.preferred_label:
+                index.add(iri, row.preferred_label, lang, "pref")
+            for label in (row.alternate_labels or "").split("|"):
+                if label.strip():
+                    index.add(iri, label.strip(), lang, "alt")
+        return index
+
+    def token_candidates(self, label: str) -> set[int]:
+        """Return the entries that share at least one token with label."""
+        found = set()
+        for token in set(normalise_label(label).split()):
+            found.update(self.tokens.get(token, ()))
+        return found
+
+    def candidates(self, label: str, threshold: float) -> list[int]:
+        """Return the entries that may have a similarity above threshold.
+
+        The similarity is the normalised Indel similarity (as
+        ``Levenshtein.ratio``) of the normalised labels. The result is a
+        superset of the entries with a similarity above threshold.
+        """
+        text = normalise_label(label)
+        length = len(text)
+        found = set()
+        need_by_length = {}
+        for other_length, entries in self._by_length.items():
+            # Largest Indel distance for ratio > threshold (rounded up to be safe)
+            max_dist = math.floor((1 - threshold) * (length + other_length) + 1e-9)
+            if abs(length - other_length) > max_dist:
+                continue
+            # Indel distance is an upper bound of the edit distance.
+            need = max(length, other_length) + self.size - 1 - max_dist * self.size
+            if need <= 0:
+                # Too short to exclude anything by shared n-grams
+                found.update(entries)
+            else:
+                need_by_length[other_length] = need
+        if not need_by_length:
+            return sorted(found)
+
+        # Prefix filter: an entry that shares none of the rarest n-grams of
+        # label (more than total - need of them) cannot share need n-grams.
+        grams = ngrams(text, self.size)
+        max_unshared = sum(grams.values()) - min(need_by_length.values())
+        covered = 0
+        for gram, count in sorted(
+            grams.items(), key=lambda item: len(self.grams.get(item[0], ()))
+        ):
+            if covered > max_unshared:
+                break
+            covered += count
+            for entry, _ in self.grams.get(gram, ()):
+                if len(self.texts[entry]) in need_by_length:
+                    found.add(entry)
+        return sorted(found)
+
+    def duplicates(self) -> list[list[int]]:
+        """Return groups of entries with the same label in the same language.
+
+        Only groups with labels of more than one IRI are returned.
+        """
+        groups = defaultdict(list)
+        for entry, (text, lang) in enumerate(zip(self.texts, self.langs)):
+            groups[text, lang].append(entry)
+        return [
+            entries
+            for entries in groups.values()
+            if len({self.iris[e] for e in entries}) > 1
+        ]
+
+    def to_dict(self) -> dict:
+        """Return the index as JSON-serializable dict."""
+        return {
+            "version": INDEX_VERSION,
+            "size": self.size,
+            "iris": self.iris,
+            "langs": self.langs,
+            "kinds": self.kinds,
+            "labels": self.labels,
+            "texts": self.texts,
+            "grams": self.grams,
+            "tokens": self.tokens,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LabelIndex":
+        """Restore an index from the dict created by ``to_dict``."""
+        if data.get("version") != INDEX_VERSION:
+            msg = f"Unsupported label index version: {data.get('version')}"
+            raise ValueError(msg)
+        index = cls(data["size"])
+        for attr in ("iris", "langs", "kinds", "labels", "texts"):
+            setattr(index, attr, data[attr])
+        for gram, postings in data["grams"].items():
+            index.grams[gram] = [tuple(posting) for posting in postings]
+        index.tokens.update(data["tokens"])
+        for entry, text in enumerate(index.texts):
+            index._by_length[len(text)].append(entry)
+        return index
+
+    def save(self, path: Path) -> None:
+        """Save the index as JSON file."""
+        Path(path).write_text(json.dumps(self.to_dict()), encoding="utf-8")
+        logger.debug("Label index with %i entries saved to %s", len(self), path)
+
+    @classmethod
+    def load(cls, path: Path) -> "LabelIndex":
+        """Load an index saved with ``save``."""
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
@@ -0,0 +1,261 @@
+"""Bulk migration of 0.4.3 format vocabularies to v1.0 RDF.
+
+``voc4cat migrate`` converts all RDF files in a directory tree, or in a
+directory as it was at one or more git refs, with the streaming 043 to v1.0
+converter (``convert_043.stream_rdf_043_to_v1``). The files are converted in
+parallel worker processes. The vocabulary config and the ID pattern are looked
+up once per vocabulary and passed to the workers together with the files.
+
+The triple counts and dropped predicates of all files can be written to a
+JSON summary.
+"""
+
+import json
+import logging
+import re
+import tempfile
+from pathlib import Path, PurePosixPath
+
+from voc4cat.convert import check_convert_043_args, get_vocab_config
+from voc4cat.convert_043 import (
+    STREAM_FORMATS,
+    MigrationStats,
+    default_output_path,
+    get_id_pattern,
+    stream_rdf_043_to_v1,
+)
+from voc4cat.errors import Voc4catError
+from voc4cat.incremental import git_toplevel
+from voc4cat.transform import (
+    GitBlobReader,
+    get_blobs_at_ref,
+    repo_relative_path,
+    validate_git_ref,
+)
+from voc4cat.utils import RDF_FILE_ENDINGS, map_in_workers
+
+logger = logging.getLogger(__name__)
+
+
+def _ref_dir_name(ref: str) -> str:
+    """Return a directory name for the output of a git ref."""
+    return re.sub(r"[^\w.-]", "_", ref)
+
+
+def _migrate_file(
+    input_path: Path, output_path: Path, output_format: str, vocab_config, id_pattern
+) -> MigrationStats:
+    """Migrate one file; runs in a worker process if jobs > 1."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    return stream_rdf_043_to_v1(
+        input_path,
+        output_path,
+        output_format,
+        vocab_config,
+        id_pattern=id_pattern,
+    )
+
+
+class _VocabSettings:
+    """Config-derived settings per vocabulary, looked up once for all files."""
+
+    def __init__(self):
+        self._settings = {}
+
+    def get(self, input_path: Path) -> tuple:
+        vocab_name = input_path.stem.lower()
+        if vocab_name not in self._settings:
+            vocab_config = get_vocab_config(vocab_name)
+            id_pattern = get_id_pattern(vocab_name, vocab_config)
+            self._settings[vocab_name] = (vocab_config, id_pattern)
+        return self._settings[vocab_name]
+
+
+def _tree_files(
+    vocab: Path, *, skip_migrated: bool = False
+) -> list[tuple[Path, PurePosixPath]]:
+    """Return the RDF files of vocab (file or directory tree) with relative paths.
+
+    With skip_migrated, the "_v1" files written by an earlier in-place
+    migration are left out of a directory tree.
+    """
+    if vocab.is_file():
+        return [(vocab, PurePosixPath(vocab.name))]
+    return [
+        (path, PurePosixPath(path.relative_to(vocab).as_posix()))
+        for path in sorted(vocab.rglob("*"))
+        if path.is_file()
+        and path.suffix.lower() in RDF_FILE_ENDINGS
+        and not (skip_migrated and path.stem.endswith("_v1"))
+    ]
+
+
+def _ref_files(
+    vocab: Path, refs: list[str], extract_dir: Path
+) -> list[tuple[str, Path, PurePosixPath]]:
+    """Write the RDF files of vocab at each git ref to extract_dir.
+
+    Returns:
+        List of (ref, extracted file, path relative to vocab).
+    """
+    # vocab may be missing in the working tree, so a file is told by its suffix.
+    vocab = vocab.resolve()
+    base_dir = vocab.parent if vocab.suffix.lower() in RDF_FILE_ENDINGS else vocab
+    repo_dir = git_toplevel(base_dir)
+    rel_base = PurePosixPath(repo_relative_path(base_dir, repo_dir))
+
+    files = []
+    with GitBlobReader(repo_dir) as reader:
+        for ref in refs:
+            validate_git_ref(ref, repo_dir)
+            for path in sorted(get_blobs_at_ref(ref, vocab, repo_dir)):
+                repo_path = PurePosixPath(path)
+                if repo_path.suffix.lower() not in RDF_FILE_ENDINGS:
+                    continue
+                rel_path = repo_path.relative_to(rel_base)
+                extracted = extract_dir / _ref_dir_name(ref) / rel_path
+                extracted.parent.mkdir(parents=True, exist_ok=True)
+                extracted.write_text(reader.read(ref, path), encoding="utf-8")
+                files.append((ref, extracted, rel_path))
+    return files
+
+
+def migrate_043(  # noqa: PLR0913
+    vocab: Path,
+    outdir: Path | None = None,
+    *,
+    refs: list[str] | None = None,
+    output_format: str = "turtle",
+    jobs: int = 1,
+    summary_file: Path | None = None,
+) -> list[dict]:
+    """Migrate all 043 RDF files of a directory tree or of git refs to v1.0.
+
+    Without refs, the RDF files in vocab (a file or a directory tree) are
+    converted. Without outdir, each output file is written next to its input
+    file with "_v1" added to the name, like ``convert --from 043`` does; "_v1"
+    files in the tree are not migrated again. With outdir, the output keeps the directory structure below vocab. With refs,
+    the files in vocab at each git ref are converted to outdir/<ref>/.
+
+    Args:
+        vocab: RDF file or directory with 043 RDF files.
+        outdir: Output directory; required for refs.
+        refs: Git refs (branches, tags or commits) to migrate.
+        output_format: Output format, "turtle" or "nt" (N-Triples).
+        jobs: Number of worker processes.
+        summary_file: Optional path of a JSON summary to write.
+
+    Returns:
+        List with a summary dict per migrated file.
+
+    Raises:
+        Voc4catError: If refs are given without outdir or two input files
+            would be migrated to the same output file.
+    """
+    if refs and outdir is None:
+        msg = "An output directory (--outdir) is required to migrate git refs."
+        raise Voc4catError(msg)
+    suffix = STREAM_FORMATS[output_format]
+    settings = _VocabSettings()
+
+    with tempfile.TemporaryDirectory() as extract_dir:
+        if refs:
+            sources = [
+                (
+                    f"{ref}:{rel_path}",
+                    path,
+                    (outdir / _ref_dir_name(ref) / rel_path).with_suffix(suffix),
+                )
+                for ref, path, rel_path in _ref_files(vocab, refs, Path(extract_dir))
+            ]
+        else:
+            sources = [
+                (
+                    str(path),
+                    path,
+                    default_output_path(path, suffix)
+                    if outdir is None
+                    else (outdir / rel_path).with_suffix(suffix),
+                )
+                for path, rel_path in _tree_files(vocab, skip_migrated=outdir is None)
+            ]
+        if not sources:
+            logger.warning("No RDF files found to migrate in %s", vocab)
+        _check_unique_outputs(sources)
+
+        tasks = [
+            (path, output, output_format, *settings.get(path))
+            for _, path, output in sources
+        ]
+        logger.info("Migrating %i file(s) with %i worker(s).", len(tasks), max(jobs, 1))
+        results = map_in_workers(_migrate_file, tasks, jobs)
+
+    files = [
+        {
+            "source": source,
+            "output": str(stats.output_path),
+            "triples_in": stats.triples_in,
+            "triples_out": stats.triples_out,
+            "dropped_predicates": {
+                str(pred): count
+                for pred, count in sorted(stats.dropped_predicates.items())
+            },
+        }
+        for (source, _, _), stats in zip(sources, results)
+    ]
+    logger.info(
+        "Migrated %i file(s): %i triples in, %i triples out",
+        len(files),
+        sum(f["triples_in"] for f in files),
+        sum(f["triples_out"] for f in files),
+    )
+    if summary_file is not None:
+        _write_summary(summary_file, files)
+    return files
+
+
+def _check_unique_outputs(sources: list[tuple[str, Path, Path]]) -> None:
+    """Raise an error if two sources would be migrated to the same file."""
+    seen = {}
+    for source, _, output in sources:
+        if output in seen:
+            msg = (
+                f'"{seen[output]}" and "{source}" would both be migrated to "{output}".'
+            )
+            raise Voc4catError(msg)
+        seen[output] = source
+
+
+def _write_summary(summary_file: Path, files: list[dict]) -> None:
+    dropped = {}
+    for file in files:
+        for pred, count in file["dropped_predicates"].items():
+            dropped[pred] = dropped.get(pred, 0) + count
+    summary = {
+        "files": files,
+        "totals": {
+            "files": len(files),
+            "triples_in": sum(f["triples_in"] for f in files),
+            "triples_out": sum(f["triples_out"] for f in files),
+            "dropped_predicates": dict(sorted(dropped.items())),
+        },
+    }
+    summary_file.parent.mkdir(parents=True, exist_ok=True)
+    summary_file.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    logger.info("Migration summary written to %s", summary_file)
+
+
+def migrate(args):
+    logger.debug("Migrate subcommand started!")
+    check_convert_043_args(args)
+    if not args.VOCAB.exists() and not args.refs:
+        msg = f'File or directory not found: "{args.VOCAB}"'
+        raise Voc4catError(msg)
+    migrate_043(
+        args.VOCAB,
+        args.outdir,
+        refs=args.refs,
+        output_format=args.outputformat,
+        jobs=args.jobs,
+        summary_file=args.summary,
+    )
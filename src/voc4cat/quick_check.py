@@ -0,0 +1,180 @@
+"""Native Python checks for the most common vp4cat SHACL constraints.
+
+pyshacl validation of a large vocabulary takes seconds to minutes. Most
+findings are however simple cardinality and datatype rules on concepts. The
+checks in this module cover these rules in a single pass over the graph and
+return results with the same keys as the SHACL validation report, so they can
+be logged with ``format_log_msg``. They are a subset of the profile; run the
+full SHACL validation for a complete report.
+
+Checked for each skos:Concept:
+
+- exactly one skos:prefLabel, one per language, as string literal
+- at least one skos:definition, one per language, as string literal
+- exactly one skos:inScheme pointing to a skos:ConceptScheme
+- skos:topConceptOf pointing to a skos:ConceptScheme
+- skos:broader / skos:narrower pointing to a skos:Concept
+"""
+
+import logging
+from collections import defaultdict
+
+from rdflib import RDF, SH, SKOS, XSD, Graph, Literal, URIRef
+
+logger = logging.getLogger(__name__)
+
+# Bundled profiles whose rules are implemented here.
+QUICK_PROFILES = {"vp4cat-5.2", "vp4cat"}
+
+VP4CAT = "https://w3id.org/nfdi4cat/vp4cat/"
+
+_STRING_TYPES = {None, XSD.string, RDF.langString}
+_INDEXED = {
+    SKOS.prefLabel,
+    SKOS.definition,
+    SKOS.inScheme,
+    SKOS.broader,
+    SKOS.narrower,
+    SKOS.topConceptOf,
+}
+
+
+class _Shapes:
+    """Message and severity of the profile shapes that the checks implement."""
+
+    def __init__(self, shapes_graph: Graph | None):
+        self.graph = shapes_graph if shapes_graph is not None else Graph()
+
+    def _property_shape(self, shape: str, path: URIRef):
+        node = URIRef(VP4CAT + shape)
+        if (node, RDF.type, SH.PropertyShape) in self.graph:
+            return node
+        for prop in self.graph.objects(node, SH.property):
+            if self.graph.value(prop, SH.path) == path:
+                return prop
+        return None
+
+    def result(self, focus, component, source, message, value=None) -> dict:
+        """Return a result dict; message is used if the profile has none.
+
+        source is the tuple of shape name and property path that is checked.
+        """
+        shape, path = source
+        prop = self._property_shape(shape, path)
+        severity = SH.Violation
+        if prop is not None:
+            message = str(self.graph.value(prop, SH.message, default=message))
+            severity = self.graph.value(prop, SH.severity, default=severity)
+        result = {
+            "focusNode": str(focus),
+            "resultMessage": message,
+            "resultSeverity": str(severity),
+            "sourceConstraintComponent": str(component),
+            "sourceShape": VP4CAT + shape,
+        }
+        if value is not None:
+            result["value"] = str(value)
+        return result
+
+
+def _check_text(shapes, concept, values, pred, max_count) -> list[dict]:
+    """Check cardinality, unique language and datatype of prefLabel/definition."""
+    shape = pred.fragment
+    prop = f"skos:{shape}"
+    results = []
+    if not values:
+        msg = f"{prop} is required."
+        results.append(
+            shapes.result(concept, SH.MinCountConstraintComponent, (shape, pred), msg)
+        )
+    elif max_count is not None and len(values) > max_count:
+        msg = f"{prop} must be given exactly once, found {len(values)}."
+        results.append(
+            shapes.result(concept, SH.MaxCountConstraintComponent, (shape, pred), msg)
+        )
+    langs = [v.language for v in values if isinstance(v, Literal) and v.language]
+    if len(langs) != len(set(langs)):
+        msg = f"Only one {prop} per language is allowed."
+        results.append(
+            shapes.result(concept, SH.UniqueLangConstraintComponent, (shape, pred), msg)
+        )
+    for value in values:
+        if not isinstance(value, Literal) or value.datatype not in _STRING_TYPES:
+            msg = f"{prop} must be a string literal."
+            results.append(
+                shapes.result(
+                    concept, SH.OrConstraintComponent, (shape, pred), msg, value
+                )
+            )
+    return results
+
+
+def _check_concept(shapes, concept, props: dict, types: dict) -> list:
+    results = _check_text(shapes, concept, props[SKOS.prefLabel], SKOS.prefLabel, 1)
+    results += _check_text(
+        shapes, concept, props[SKOS.definition], SKOS.definition, None
+    )
+
+    schemes = props[SKOS.inScheme]
+    shape = "Requirement-2.1.8"
+    if not schemes:
+        msg = "Each Concept MUST indicate its vocabulary with skos:inScheme."
+        results.append(
+            shapes.result(
+                concept, SH.MinCountConstraintComponent, (shape, SKOS.inScheme), msg
+            )
+        )
+    elif len(schemes) > 1:
+        msg = "Each Concept MUST be in exactly one Concept Scheme."
+        results.append(
+            shapes.result(
+                concept, SH.MaxCountConstraintComponent, (shape, SKOS.inScheme), msg
+            )
+        )
+    for target_pred, target_type, shape_name in (
+        (SKOS.inScheme, SKOS.ConceptScheme, shape),
+        (SKOS.topConceptOf, SKOS.ConceptScheme, "Shui-Concept"),
+        (SKOS.broader, SKOS.Concept, "Shui-Concept"),
+        (SKOS.narrower, SKOS.Concept, "Shui-Concept"),
+    ):
+        for target in props[target_pred]:
+            if target_type not in types.get(target, ()):
+                msg = f"Value of skos:{target_pred.fragment} must be a {target_type.n3()}."
+                results.append(
+                    shapes.result(
+                        concept,
+                        SH.ClassConstraintComponent,
+                        (shape_name, target_pred),
+                        msg,
+                        target,
+                    )
+                )
+    return results
+
+
+def quick_validate(graph: Graph, shapes_graph: Graph | None = None) -> list[dict]:
+    """Check the concepts in graph for the most common vp4cat violations.
+
+    Args:
+        graph: The vocabulary graph.
+        shapes_graph: The vp4cat profile. If given, the results use the
+            sh:message and sh:severity of its shapes.
+
+    Returns:
+        List of result dicts with the keys used by ``format_log_msg``.
+    """
+    shapes = _Shapes(shapes_graph)
+    types = defaultdict(set)
+    props = defaultdict(lambda: defaultdict(list))
+    for s, p, o in graph:
+        if p == RDF.type:
+            types[s].add(o)
+        elif p in _INDEXED:
+            props[s][p].append(o)
+
+    results = []
+    for subject, subject_types in types.items():
+        if SKOS.Concept in subject_types and isinstance(subject, URIRef):
+            results += _check_concept(shapes, subject, props[subject], types)
+    logger.debug("Quick check found %i problem(s).", len(results))
+    return results
@@ -0,0 +1,246 @@
+"""Daemon that runs voc4cat subcommands in a long-running process.
+
+Each call of ``voc4cat`` starts a new interpreter, imports rdflib, pyshacl and
+openpyxl, parses the config, the SHACL profile and the vocabulary. Editor
+integrations and pre-commit hooks that call voc4cat many times pay this for
+every call. ``voc4cat serve`` starts a daemon that listens on a Unix domain
+socket and keeps the imported modules, the parsed SHACL profiles and recently
+parsed vocabulary files in memory.
+
+If the environment variable ``VOC4CAT_SOCKET`` is set to the socket path,
+``voc4cat check|convert|transform ...`` sends the command line to the daemon
+and prints its output. If no daemon is listening, the command runs in the
+calling process as usual.
+
+The protocol is one JSON line per connection in each direction:
+
+- request: ``{"args": [...], "cwd": "...", "env": {...}}``
+- response: ``{"exit_code": 0, "stdout": "...", "stderr": "..."}``
+
+Jobs run one after another in the daemon process. Each job starts with the
+default config and in the working directory of the client, like a new
+process would.
+
+This module only imports the standard library at import time, so that the
+client side adds nothing to the startup time of the CLI.
+"""
+
+import importlib
+import io
+import json
+import logging
+import os
+import signal
+import socket
+import socketserver
+import sys
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+from voc4cat.errors import Voc4catError
+
+logger = logging.getLogger(__name__)
+
+SOCKET_ENV = "VOC4CAT_SOCKET"
+# Subcommands that are sent to the daemon if SOCKET_ENV is set.
+DAEMON_SUBCOMMANDS = ("check", "convert", "transform")
+# Environment variables read by the subcommands; passed from the client to the job.
+FORWARDED_ENV = (
+    "LOGLEVEL",
+    "VOC4CAT_VERSION",
+    "VOC4CAT_MODIFIED",
+    "GITHUB_REPOSITORY",
+    "CI",
+)
+DEFAULT_GRAPH_CACHE_SIZE = 8
+
+
+def default_socket_path() -> Path:
+    """Return the socket path from SOCKET_ENV or a per-user default."""
+    if os.environ.get(SOCKET_ENV):
+        return Path(os.environ[SOCKET_ENV])
+    user = os.getuid() if hasattr(os, "getuid") else "user"
+    return Path(tempfile.gettempdir()) / f"voc4cat-{user}.sock"
+
+
+def _set_env(env: dict[str, str | None]) -> dict[str, str | None]:
+    """Set (or unset for None) environment variables; return the old values."""
+    old = {}
+    for name, value in env.items():
+        old[name] = os.environ.get(name)
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+    return old
+
+
+def run_job(args: list[str], cwd: str, env: dict[str, str | None]) -> dict:
+    """Run a voc4cat command line in this process and capture its output.
+
+    Args:
+        args: Command line arguments (without "voc4cat").
+        cwd: Working directory of the client.
+        env: Values of FORWARDED_ENV in the client (None if not set).
+
+    Returns:
+        Dict with exit_code, stdout and stderr of the command.
+    """
+    from voc4cat import config  # noqa: PLC0415
+    from voc4cat.cli import run_main_cli  # noqa: PLC0415
+
+    # A new process would start with the default config.
+    config.load_config()
+
+    # setup_logging (via logging.basicConfig) only adds a handler if the root
+    # logger has none, so the daemon's handlers are removed during the job.
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    root.handlers.clear()
+    stdout, stderr = io.StringIO(), io.StringIO()
+    old_cwd = os.getcwd()
+    old_env = _set_env({name: env.get(name) for name in FORWARDED_ENV})
+    try:
+        os.chdir(cwd)
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                exit_code = run_main_cli(args)
+            except SystemExit as exc:  # argparse errors and --help
+                exit_code = exc.code if isinstance(exc.code, int) else 0
+    finally:
+        os.chdir(old_cwd)
+        _set_env(old_env)
+        for handler in root.handlers:
+            handler.close()
+        root.handlers[:] = handlers
+        root.setLevel(level)
+    return {
+        "exit_code": exit_code,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+
+
+class _JobHandler(socketserver.StreamRequestHandler):
+    """Run the job sent by a client and send back its output."""
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            args = request["args"]
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring invalid request.")
+            return
+        logger.info("Running job: voc4cat %s", " ".join(args))
+        response = run_job(
+            args, request.get("cwd", os.getcwd()), request.get("env", {})
+        )
+        logger.info("Job finished with exit code %i", response["exit_code"])
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+def _connect(socket_path: Path) -> socket.socket | None:
+    """Return a socket connected to the daemon or None if none is listening."""
+    if not hasattr(socket, "AF_UNIX"):  # pragma: no cover
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def warm_up(graph_cache_size: int = DEFAULT_GRAPH_CACHE_SIZE) -> None:
+    """Import the subcommand modules and parse the default SHACL profile."""
+    for name in DAEMON_SUBCOMMANDS:
+        importlib.import_module(f"voc4cat.{name}")
+    from voc4cat import DEFAULT_PROFILE, convert  # noqa: PLC0415
+
+    convert.VOCAB_GRAPH_CACHE_SIZE = graph_cache_size
+    convert.load_profile_graph(convert.resolve_profile(DEFAULT_PROFILE)[0])
+
+
+def create_server(socket_path: Path) -> socketserver.UnixStreamServer:
+    """Bind the daemon to socket_path.
+
+    A socket file left behind by a daemon that is no longer running is
+    replaced.
+
+    Raises:
+        Voc4catError: If Unix domain sockets are not supported or another
+            daemon is listening on socket_path.
+    """
+    if not hasattr(socket, "AF_UNIX"):  # pragma: no cover
+        msg = "voc4cat serve requires Unix domain sockets."
+        raise Voc4catError(msg)
+    if socket_path.exists():
+        sock = _connect(socket_path)
+        if sock is not None:
+            sock.close()
+            msg = f'A voc4cat daemon is already listening on "{socket_path}".'
+            raise Voc4catError(msg)
+        socket_path.unlink()
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    server = socketserver.UnixStreamServer(str(socket_path), _JobHandler)
+    socket_path.chmod(0o600)
+    return server
+
+
+def run_in_daemon(args: list[str], socket_path: Path | None = None) -> int | None:
+    """Send a command line to the daemon and print its output.
+
+    Args:
+        args: Command line arguments (without "voc4cat").
+        socket_path: Socket of the daemon; default_socket_path() if None.
+
+    Returns:
+        Exit code of the command or None if no daemon is listening.
+    """
+    socket_path = default_socket_path() if socket_path is None else socket_path
+    sock = _connect(socket_path)
+    if sock is None:
+        logger.debug('No voc4cat daemon at "%s"; running in-process.', socket_path)
+        return None
+    request = {
+        "args": args,
+        "cwd": os.getcwd(),
+        "env": {name: os.environ.get(name) for name in FORWARDED_ENV},
+    }
+    with sock, sock.makefile("rwb") as stream:
+        stream.write(json.dumps(request).encode("utf-8") + b"\n")
+        stream.flush()
+        line = stream.readline()
+    if not line:
+        logger.error("The voc4cat daemon closed the connection without a result.")
+        return 3
+    response = json.loads(line)
+    print(response["stdout"], end="")
+    print(response["stderr"], end="", file=sys.stderr)
+    return response["exit_code"]
+
+
+def _stop_on_sigterm(signum, frame):
+    raise KeyboardInterrupt
+
+
+def serve(args):
+    logger.debug("Serve subcommand started!")
+    socket_path = default_socket_path() if args.socket is None else args.socket
+    server = create_server(socket_path)
+    signal.signal(signal.SIGTERM, _stop_on_sigterm)
+    try:
+        warm_up(args.graph_cache)
+        logger.info(
+            'Listening on "%s". Set %s to this path to run commands in the daemon.',
+            socket_path,
+            SOCKET_ENV,
+        )
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Stopping the daemon.")
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
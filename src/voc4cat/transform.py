@@ -1,33 +1,60 @@
+import hashlib
+import json
 import logging
 import os
+import re
 import shutil
 import subprocess
 import sys
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlsplit
 
-from rdflib import DCTERMS, OWL, RDF, SDO, SKOS, XSD, Graph, Literal, Namespace
+from rdflib import (
+    DCTERMS,
+    OWL,
+    RDF,
+    SDO,
+    SKOS,
+    XSD,
+    BNode,
+    Graph,
+    Literal,
+    Namespace,
+)
+from rdflib.compare import to_canonical_graph
+from rdflib.util import from_n3
 
 if sys.version_info < (3, 11):
     import isodate
 
 from voc4cat import config
 from voc4cat.checks import Voc4catError
-from voc4cat.utils import EXCEL_FILE_ENDINGS, RDF_FILE_ENDINGS
+from voc4cat.utils import EXCEL_FILE_ENDINGS, RDF_FILE_ENDINGS, map_in_workers
 
 logger = logging.getLogger(__name__)
 
+# Turtle/SPARQL-style prefix declarations for the dcterms namespace.
+DCT_PREFIX_PATTERN = re.compile(
+    r"^\s*(?:@prefix|PREFIX)\s+([\w-]*):\s*<http://purl\.org/dc/terms/>",
+    re.MULTILINE | re.IGNORECASE,
+)
 
-def _run_git(cmd: list[str], repo_dir: Path) -> subprocess.CompletedProcess[str]:
-    """Run a constrained git command in a repo directory."""
+
+def _check_git_cmd(cmd: list[str]) -> None:
+    """Ensure that cmd is a git command and that git is available."""
     if not cmd or cmd[0] != "git":
         msg = "Only 'git' commands are allowed."
         raise Voc4catError(msg)
     if shutil.which("git") is None:
         msg = "git executable not found in PATH."
         raise Voc4catError(msg)
+
+
+def _run_git(cmd: list[str], repo_dir: Path) -> subprocess.CompletedProcess[str]:
+    """Run a constrained git command in a repo directory."""
+    _check_git_cmd(cmd)
     return subprocess.run(  # noqa: S603
         cmd,
         cwd=repo_dir,
@@ -38,7 +65,7 @@ def _run_git(cmd: list[str], repo_dir: Path) -> subprocess.CompletedProcess[str]
     )
 
 
-def _repo_relative_path(path: Path, repo_dir: Path) -> str:
+def repo_relative_path(path: Path, repo_dir: Path) -> str:
     """Return a repo-relative POSIX path and reject paths outside the repo."""
     repo_dir = repo_dir.resolve()
     path = path if path.is_absolute() else (repo_dir / path)
@@ -66,65 +93,316 @@ class FileGitInfo:
     modified_at: datetime = None
 
 
-def _get_file_git_info(filepath: str, repo_dir: Path) -> FileGitInfo | None:
-    """Get git info for a single file, following renames.
+def _parse_git_date(date_str: str) -> datetime:
+    """Parse a strict ISO 8601 date as written by git (%aI)."""
+    if sys.version_info >= (3, 11):
+        return datetime.fromisoformat(date_str)
+    return isodate.parse_datetime(date_str)
+
+
+def _parse_commit(name: str, email: str, date_str: str) -> tuple[str, str, datetime]:
+    """Convert raw author name, email and ISO date from git log to a tuple."""
+    return name, email, _parse_git_date(date_str)
+
+
+def _file_git_info_from_commits(
+    modified: tuple[str, str, datetime], created: tuple[str, str, datetime]
+) -> FileGitInfo:
+    """Build FileGitInfo from the newest and the oldest commit of a file."""
+    modified_name, modified_email, modified_at = modified
+    created_name, created_email, created_at = created
+    return FileGitInfo(
+        created_by=created_name,
+        created_email=created_email,
+        created_at=created_at,
+        modified_by=modified_name,
+        modified_email=modified_email,
+        modified_at=modified_at,
+    )
+
+
+def _get_files_git_info_batched(
+    filepaths: list[str], repo_dir: Path
+) -> dict[str, FileGitInfo]:
+    """Get git info for many files from a single pass over the git history.
+
+    Runs one ``git log --name-status -M`` over the whole repository (a pathspec
+    would hide renames across directory boundaries) and follows renames in
+    Python. Walking from the newest to the oldest commit, every path is mapped
+    to the tracked file(s) whose history it represents. A rename ``old -> new``
+    transfers the history of ``new`` to ``old``, which is what ``git log
+    --follow`` does for a single file.
+
+    Like ``git log --follow``, this does no history simplification: merge
+    commits have no name-status and do not count, while every commit of a
+    merged side branch that touched a file counts, even if the merge
+    discarded its change.
 
     Args:
-        filepath: Repo-relative POSIX path to the file.
+        filepaths: Repo-relative POSIX paths of the tracked files.
         repo_dir: Git repository root directory.
 
     Returns:
-        FileGitInfo with creation/modification info, or None if no history found.
+        Dictionary mapping each file path with history to its FileGitInfo.
     """
     log_cmd = [
         "git",
         "log",
-        "--follow",
-        "--format=%an%x00%ae%x00%aI",
-        "--",
-        filepath,
+        "--name-status",
+        "-M",
+        "-z",
+        "--format=%x1e%an%x00%ae%x00%aI",
     ]
     try:
         log_result = _run_git(log_cmd, repo_dir)
     except subprocess.CalledProcessError:
-        return None
+        return {}
 
-    lines = [line.strip() for line in log_result.stdout.split("\n") if line.strip()]
-    if not lines:
-        return None
+    # path in history -> tracked file paths whose history continues there
+    aliases: dict[str, list[str]] = {path: [path] for path in filepaths}
+    newest: dict[str, tuple[str, str, datetime]] = {}
+    oldest: dict[str, tuple[str, str, datetime]] = {}
+
+    # Each commit record starts with \x1e, fields and file entries are \0-separated.
+    for record in log_result.stdout.split("\x1e")[1:]:
+        fields = record.split("\x00")
+        commit = None
+        entries = iter(fields[3:])
+        for raw_status in entries:
+            status = raw_status.strip()
+            if not status:
+                continue
+            if status.startswith("R"):
+                old_path, new_path = next(entries), next(entries)
+                owners = aliases.pop(new_path, [])
+                if owners:
+                    aliases.setdefault(old_path, []).extend(owners)
+            else:
+                owners = aliases.get(next(entries), [])
+            if not owners:
+                continue
+            if commit is None:
+                commit = _parse_commit(*fields[:3])
+            for owner in owners:
+                newest.setdefault(owner, commit)
+                oldest[owner] = commit
 
-    def parse_commit(line: str) -> tuple[str, str, datetime]:
-        name, email, date_str = line.split("\x00")
-        if sys.version_info >= (3, 11):
-            date_commit = datetime.fromisoformat(date_str)
-        else:
-            date_commit = isodate.parse_datetime(date_str)
-        return name, email, date_commit
+    return {
+        path: _file_git_info_from_commits(newest[path], oldest[path])
+        for path in filepaths
+        if path in newest
+    }
 
-    # First line = most recent (modified), last line = oldest following renames (created)
-    modified_name, modified_email, modified_at = parse_commit(lines[0])
-    created_name, created_email, created_at = parse_commit(lines[-1])
 
-    return FileGitInfo(
-        created_by=created_name,
-        created_email=created_email,
-        created_at=created_at,
-        modified_by=modified_name,
-        modified_email=modified_email,
-        modified_at=modified_at,
+class ProvCache:
+    """On-disk cache of git history information for provenance.
+
+    Entries are keyed by repo-relative path and store the blob SHA of the file
+    together with its FileGitInfo. The cache remembers the HEAD commit it was
+    written for. An entry is reused if the blob SHA is unchanged and the path
+    was not touched by any commit between the cached HEAD and the current HEAD
+    (which then must be a descendant of the cached HEAD).
+
+    The cache also keeps summaries of files at a diff base (content fingerprint
+    and dates, see _summarize_base) keyed by blob SHA alone. These never get
+    stale but only the summaries for the latest diff base are kept.
+    """
+
+    VERSION = 1
+
+    def __init__(self, cache_file: Path, repo_dir: Path):
+        self.cache_file = Path(cache_file)
+        self.repo_dir = repo_dir
+        self.head = _run_git(["git", "rev-parse", "HEAD"], repo_dir).stdout.strip()
+        self.entries: dict[str, dict] = {}
+        self.bases: dict[str, dict | None] = {}
+        self.base: str | None = None
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self) -> None:
+        if not self.cache_file.exists():
+            return
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable provenance cache %s", self.cache_file)
+            return
+        if data.get("version") != self.VERSION:
+            return
+        self.bases = data.get("bases", {})
+        self.base = data.get("base")
+        entries = data.get("entries", {})
+        cached_head = data.get("head", "")
+        if cached_head != self.head:
+            touched = self._touched_since(cached_head)
+            if touched is None:
+                logger.debug("Provenance cache is stale (history rewritten).")
+                return
+            entries = {k: v for k, v in entries.items() if k not in touched}
+        self.entries = entries
+
+    def _touched_since(self, cached_head: str) -> set[str] | None:
+        """Return paths changed from cached_head to HEAD or None if not comparable."""
+        try:
+            _run_git(
+                ["git", "merge-base", "--is-ancestor", cached_head, self.head],
+                self.repo_dir,
+            )
+            result = _run_git(
+                [
+                    "git",
+                    "diff",
+                    "--name-only",
+                    "--no-renames",
+                    "-z",
+                    cached_head,
+                    self.head,
+                ],
+                self.repo_dir,
+            )
+        except subprocess.CalledProcessError:
+            return None
+        return {path for path in result.stdout.split("\x00") if path}
+
+    def get(self, blobs: dict[str, str]) -> dict[str, FileGitInfo]:
+        """Return cached git info for paths whose blob SHA matches.
+
+        Args:
+            blobs: Dictionary mapping repo-relative paths to blob SHAs.
+        """
+        found = {}
+        for path, blob in blobs.items():
+            entry = self.entries.get(path)
+            if entry is not None and entry["blob"] == blob:
+                found[path] = FileGitInfo(
+                    **{
+                        key: _parse_git_date(value) if key.endswith("_at") else value
+                        for key, value in entry["info"].items()
+                    }
+                )
+        self.hits += len(found)
+        self.misses += len(blobs) - len(found)
+        return found
+
+    def update(self, infos: dict[str, FileGitInfo], blobs: dict[str, str]) -> None:
+        """Add or replace cache entries for the given paths."""
+        for path, info in infos.items():
+            self.entries[path] = {
+                "blob": blobs[path],
+                "info": {
+                    key: value.isoformat() if isinstance(value, datetime) else value
+                    for key, value in asdict(info).items()
+                },
+            }
+
+    def use_base(self, base: str) -> None:
+        """Set the diff base commit; drop base summaries of any other base."""
+        if base != self.base:
+            self.base = base
+            self.bases = {}
+
+    def merge(self, other: "ProvCache") -> None:
+        """Add the entries and base summaries of a copy used by a worker process."""
+        if other is self:
+            return
+        self.entries.update(other.entries)
+        if other.base is not None:
+            self.use_base(other.base)
+            self.bases.update(other.bases)
+
+    def save(self) -> None:
+        """Write the cache to disk.
+
+        Entries written meanwhile by another process for the same HEAD (and
+        base summaries for the same diff base) are kept. The file is replaced
+        atomically.
+        """
+        self.cache_file.parent.mkdir(exist_ok=True, parents=True)
+        entries, bases = self.entries, self.bases
+        if self.cache_file.exists():
+            try:
+                on_disk = json.loads(self.cache_file.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                on_disk = {}
+            if on_disk.get("version") == self.VERSION:
+                if on_disk.get("base") == self.base:
+                    bases = {**on_disk.get("bases", {}), **self.bases}
+                if on_disk.get("head") == self.head:
+                    entries = {**on_disk.get("entries", {}), **self.entries}
+        data = {
+            "version": self.VERSION,
+            "head": self.head,
+            "entries": entries,
+            "base": self.base,
+            "bases": bases,
+        }
+        tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}")
+        tmp_file.write_text(json.dumps(data, indent=1), encoding="utf-8")
+        tmp_file.replace(self.cache_file)
+
+
+def _get_tracked_blobs(directory: Path, repo_dir: Path) -> dict[str, str]:
+    """Return repo-relative paths of all tracked files in directory and their blob SHA."""
+    rel_directory = repo_relative_path(directory, repo_dir)
+    ls_cmd = ["git", "ls-files", "-s", "-z", "--", rel_directory]
+    ls_result = _run_git(ls_cmd, repo_dir)
+
+    blobs = {}
+    for line in ls_result.stdout.split("\x00"):
+        if not line:
+            continue
+        # "<mode> <sha> <stage>\t<path>"
+        meta, path = line.split("\t", 1)
+        blobs[path] = meta.split()[1]
+    return blobs
+
+
+def _get_files_git_info(
+    blobs: dict[str, str], repo_dir: Path, cache: ProvCache | None = None
+) -> dict[str, FileGitInfo]:
+    """Get git info for files, reusing cached results if a cache is given.
+
+    Args:
+        blobs: Dictionary mapping repo-relative paths to blob SHAs.
+        repo_dir: Git repository root directory.
+        cache: Optional provenance cache; it is updated but not saved.
+    """
+    if not blobs:
+        return {}
+    if cache is None:
+        return _get_files_git_info_batched(list(blobs), repo_dir)
+
+    result = cache.get(blobs)
+    missing = [path for path in blobs if path not in result]
+    if missing:
+        computed = _get_files_git_info_batched(missing, repo_dir)
+        cache.update(computed, blobs)
+        result.update(computed)
+    logger.debug(
+        "Provenance cache %s: %i hits, %i misses",
+        cache.cache_file,
+        cache.hits,
+        cache.misses,
     )
+    return result
 
 
 def get_directory_git_info(
-    directory: Path, repo_dir: Path | None = None
+    directory: Path, repo_dir: Path | None = None, cache: ProvCache | None = None
 ) -> dict[str, FileGitInfo]:
     """Get git info for all tracked files in a directory.
 
-    Uses git log --follow for each file to track history across renames.
+    The history of all files is read with a single git log pass; renames are
+    followed like ``git log --follow`` does for a single file.
 
     Args:
         directory: Directory containing files to get git info for.
         repo_dir: Git repository root directory. Defaults to current working directory.
+        cache: Optional provenance cache. History is only recomputed for files
+            that are not in the cache or whose blob or history changed. The
+            cache is updated but not saved.
 
     Returns:
         Dictionary mapping file paths (relative to repo_dir) to FileGitInfo objects.
@@ -133,58 +411,134 @@ def get_directory_git_info(
     directory = Path(directory)
 
     # Step 1: Get all tracked files in the directory (validate directory is within repo)
-    rel_directory = _repo_relative_path(directory, repo_dir)
-    ls_cmd = ["git", "ls-files", "--", rel_directory]
-    ls_result = _run_git(ls_cmd, repo_dir)
+    blobs = _get_tracked_blobs(directory, repo_dir)
 
-    filepaths = [f for f in ls_result.stdout.strip().split("\n") if f]
-    if not filepaths:
-        return {}
-
-    # Step 2: Get history for each file individually (to support --follow)
-    result = {}
-    for filepath in filepaths:
-        info = _get_file_git_info(filepath, repo_dir)
-        if info is not None:
-            result[filepath] = info
-
-    return result
+    # Step 2: Get history for all files from one git log pass (following renames)
+    return _get_files_git_info(blobs, repo_dir, cache)
 
 
-def _validate_git_ref(ref: str, repo_dir: Path) -> None:
+def validate_git_ref(ref: str, repo_dir: Path) -> str:
     """Validate that a git ref exists in the repository.
 
     Args:
         ref: Git ref (branch, tag, or commit) to validate.
         repo_dir: Git repository root directory.
 
+    Returns:
+        The object name (SHA) the ref resolves to.
+
     Raises:
         Voc4catError: If the ref is not valid.
     """
     try:
-        _run_git(["git", "rev-parse", "--verify", ref], repo_dir)
+        return _run_git(["git", "rev-parse", "--verify", ref], repo_dir).stdout.strip()
     except subprocess.CalledProcessError as exc:
         msg = f'"{ref}" is not a valid git ref in {repo_dir}'
         raise Voc4catError(msg) from exc
 
 
-def _get_file_at_ref(ref: str, rel_path: str, repo_dir: Path) -> str | None:
-    """Return file content at a git ref.
+def _get_changed_paths(ref: str, directory: Path, repo_dir: Path) -> set[str]:
+    """Return repo-relative paths in directory that differ from their version at ref.
+
+    Compares the working tree with the given git ref. Files that were added,
+    removed or renamed since ref are included.
 
     Args:
         ref: Git ref (branch, tag, or commit).
-        rel_path: Repo-relative POSIX path to the file.
+        directory: Directory to restrict the comparison to.
         repo_dir: Git repository root directory.
 
     Returns:
-        File content as string, or None if the file doesn't exist at that ref.
+        Set of repo-relative POSIX paths.
     """
-    try:
-        result = _run_git(["git", "show", f"{ref}:{rel_path}"], repo_dir)
-    except subprocess.CalledProcessError:
-        return None
-    else:
-        return result.stdout
+    rel_directory = repo_relative_path(directory, repo_dir)
+    diff_cmd = ["git", "diff", "--name-only", "--no-renames", "-z", ref]
+    result = _run_git([*diff_cmd, "--", rel_directory], repo_dir)
+    return {path for path in result.stdout.split("\x00") if path}
+
+
+def get_blobs_at_ref(ref: str, directory: Path, repo_dir: Path) -> dict[str, str]:
+    """Return repo-relative paths of all files in directory at ref and their blob SHA."""
+    rel_directory = repo_relative_path(directory, repo_dir)
+    ls_cmd = ["git", "ls-tree", "-r", "-z", ref, "--", rel_directory]
+    ls_result = _run_git(ls_cmd, repo_dir)
+
+    blobs = {}
+    for line in ls_result.stdout.split("\x00"):
+        if not line:
+            continue
+        # "<mode> <type> <sha>\t<path>"
+        meta, path = line.split("\t", 1)
+        blobs[path] = meta.split()[2]
+    return blobs
+
+
+class GitBlobReader:
+    """Read file contents at git refs through one ``git cat-file --batch`` process.
+
+    Spawning ``git show ref:path`` per file is slow for directories with
+    thousands of files. This reader keeps a single cat-file process running
+    and streams the blobs over its stdout pipe.
+
+    Use as context manager to make sure the git process is terminated::
+
+        with GitBlobReader(repo_dir) as reader:
+            content = reader.read("main", "vocab/concept_scheme.ttl")
+    """
+
+    def __init__(self, repo_dir: Path):
+        cmd = ["git", "cat-file", "--batch"]
+        _check_git_cmd(cmd)
+        self._proc = subprocess.Popen(  # noqa: S603
+            cmd,
+            cwd=repo_dir,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            shell=False,
+        )
+
+    def read(self, ref: str, rel_path: str) -> str | None:
+        """Return file content at a git ref.
+
+        Args:
+            ref: Git ref (branch, tag, or commit).
+            rel_path: Repo-relative POSIX path to the file.
+
+        Returns:
+            File content as string, or None if the file doesn't exist at that ref.
+        """
+        return self.read_object(f"{ref}:{rel_path}")
+
+    def read_object(self, obj: str) -> str | None:
+        """Return the content of a blob given by its SHA or as "ref:path".
+
+        Returns:
+            Blob content as string, or None if there is no such blob.
+        """
+        self._proc.stdin.write(f"{obj}\n".encode())
+        self._proc.stdin.flush()
+        header = self._proc.stdout.readline().split()
+        # header is "<sha> <type> <size>" or "<object> missing"
+        if len(header) != 3:  # noqa: PLR2004
+            return None
+        content = self._proc.stdout.read(int(header[2]))
+        self._proc.stdout.read(1)  # newline terminating the blob
+        if header[1] != b"blob":
+            return None
+        return content.decode("utf-8")
+
+    def close(self) -> None:
+        """Terminate the git cat-file process."""
+        if self._proc.poll() is None:
+            self._proc.stdin.close()
+            self._proc.wait()
+        self._proc.stdout.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
 
 def _find_main_iri(graph: Graph):
@@ -202,14 +556,44 @@ def _find_main_iri(graph: Graph):
     return None
 
 
-def _content_triples(graph: Graph) -> set:
-    """Return set of triples excluding date predicates.
+def _content_fingerprint(graph: Graph) -> str:
+    """Return a hash of all triples of a graph excluding date predicates.
 
     Used for semantic comparison: two graphs have the same content if their
-    non-date triples are identical.
+    non-date triples are identical. The hash is computed from the sorted
+    N-Triples lines. Graphs with blank nodes (e.g. the RDF list of an ordered
+    collection) are canonicalized first so that blank node labels match.
     """
-    return {
+    triples = [
         (s, p, o) for s, p, o in graph if p not in (DCTERMS.created, DCTERMS.modified)
+    ]
+    if any(isinstance(term, BNode) for triple in triples for term in triple):
+        content_graph = Graph()
+        for triple in triples:
+            content_graph.add(triple)
+        triples = list(to_canonical_graph(content_graph))
+    lines = sorted(f"{s.n3()} {p.n3()} {o.n3()} ." for s, p, o in triples)
+    return hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+
+
+def _summarize_base(base_content: str) -> dict | None:
+    """Summarize a file at the base ref by its content fingerprint and dates.
+
+    The summary depends only on the blob, so it can be cached by blob SHA.
+
+    Returns:
+        Dict with "fingerprint", "created" and "modified" (N3 string or None),
+        or None if the base version has no SKOS entity.
+    """
+    base_graph = Graph().parse(data=base_content, format="turtle")
+    base_iri = _find_main_iri(base_graph)
+    if base_iri is None:
+        return None
+    base_dates = _extract_prov_dates(base_graph, base_iri)
+    return {
+        "fingerprint": _content_fingerprint(base_graph),
+        "created": base_dates["created"].n3() if base_dates["created"] else None,
+        "modified": base_dates["modified"].n3() if base_dates["modified"] else None,
     }
 
 
@@ -244,35 +628,38 @@ def _restore_prov_dates(graph: Graph, main_iri, dates: dict) -> None:
 
 
 def _try_restore_from_base(
-    graph: Graph, main_iri, base_content: str | None, ttl_file: Path
+    graph: Graph, main_iri, base_summary: dict | None, ttl_file: Path
 ) -> bool:
     """Try to restore dates from a base version for an unchanged file.
 
-    Compares content triples (excluding dates) between current graph and base version.
-    If content is unchanged and base has dates, restores them.
+    Compares the content fingerprint (excluding dates) of the current graph with
+    the one of the base version. If content is unchanged and base has dates,
+    restores them.
 
     Args:
         graph: Current RDF graph (mutated in place if dates restored).
         main_iri: IRI of the main SKOS entity in the current graph.
-        base_content: Turtle content of the file at the base ref, or None if new file.
+        base_summary: Summary of the file at the base ref (see _summarize_base),
+            or None if new file or if the base has no SKOS entity.
         ttl_file: Path to the file (for serialization and logging).
 
     Returns:
         True if dates were restored (caller should skip git-history dates).
         False if file is changed/new or base has no dates (fall through needed).
     """
-    if base_content is None:
-        return False  # New file
+    if base_summary is None:
+        return False  # New file or no SKOS entity in base
 
-    base_graph = Graph().parse(data=base_content, format="turtle")
-    base_iri = _find_main_iri(base_graph)
-    if not base_iri or _content_triples(graph) != _content_triples(base_graph):
-        return False  # Changed file or no SKOS entity in base
+    if _content_fingerprint(graph) != base_summary["fingerprint"]:
+        return False  # Changed file
 
-    base_dates = _extract_prov_dates(base_graph, base_iri)
-    if not base_dates["created"] and not base_dates["modified"]:
+    if not base_summary["created"] and not base_summary["modified"]:
         return False  # Base has no dates -- fall through to git-history logic
 
+    base_dates = {
+        key: from_n3(base_summary[key]) if base_summary[key] else None
+        for key in ("created", "modified")
+    }
     _restore_prov_dates(graph, main_iri, base_dates)
     graph.serialize(destination=ttl_file, format="longturtle")
     logger.debug("Restored dates from base for %s", ttl_file.name)
@@ -333,11 +720,85 @@ def _apply_git_dates(graph: Graph, main_iri, info: FileGitInfo, ttl_file: Path)
     return modified
 
 
-def add_prov_from_git(
+def _has_prov_dates_text(turtle: str) -> bool:
+    """Return True if turtle text uses dct:created or dct:modified.
+
+    Checked on the text so that files identical to the diff base need not be
+    parsed. The split files contain a single entity.
+    """
+    names = [f"<{DCTERMS.created}>", f"<{DCTERMS.modified}>"]
+    for prefix in DCT_PREFIX_PATTERN.findall(turtle):
+        names += [f"{prefix}:created", f"{prefix}:modified"]
+    return any(name in turtle for name in names)
+
+
+def _add_prov_to_file(
+    ttl_file: Path, info: FileGitInfo | None, base: tuple | None
+) -> tuple[str, dict | None] | None:
+    """Add provenance dates from git to a single split turtle file.
+
+    Runs in a worker process if add_prov_from_git is called with jobs > 1.
+
+    Args:
+        ttl_file: The turtle file to modify.
+        info: Git info of the file or None if it is not tracked.
+        base: None if no diff base is used. Otherwise a tuple (changed,
+            base_sha, base_content, base_summary). changed tells if git
+            reports the file as changed compared to the diff base. base_sha is
+            the blob SHA at the base (None for new files). Either the summary
+            of the base blob is known already or the base content is given.
+
+    Returns:
+        (base_sha, base_summary) if the summary of a base blob was computed,
+        otherwise None.
+    """
+    computed = None
+    if (
+        base is not None
+        and not base[0]
+        and _has_prov_dates_text(ttl_file.read_text(encoding="utf-8"))
+    ):
+        # Identical to base: its dates are the base dates already.
+        logger.debug("Unchanged since base: %s", ttl_file.name)
+        return computed
+
+    # Parse the RDF graph
+    graph = Graph().parse(ttl_file, format="turtle")
+
+    # Find the main subject IRI (concept, collection, or concept scheme)
+    main_iri = _find_main_iri(graph)
+    if main_iri is None:
+        logger.warning("No SKOS entity found in %s, skipping.", ttl_file)
+        return computed
+
+    if base is not None:
+        changed, base_sha, base_content, base_summary = base
+        if base_content is not None:
+            base_summary = _summarize_base(base_content)
+            computed = (base_sha, base_summary)
+        # An unchanged file has no dates here (see above), like its base --
+        # fall through to git-history logic.
+        if changed and _try_restore_from_base(graph, main_iri, base_summary, ttl_file):
+            return computed
+        # CHANGED or NEW file -- use dates from git history
+
+    if info is None:
+        logger.info('File "%s" is not tracked in git. Skipping provenance.', ttl_file)
+        return computed
+
+    if _apply_git_dates(graph, main_iri, info, ttl_file):
+        graph.serialize(destination=ttl_file, format="longturtle")
+    return computed
+
+
+def add_prov_from_git(  # noqa: PLR0913
     vocab_dir: Path,
     repo_dir: Path | None = None,
     source_dir: Path | None = None,
     diff_base: str | None = None,
+    *,
+    cache: ProvCache | None = None,
+    jobs: int = 1,
 ) -> None:
     """Add dct:created and dct:modified to RDF files based on git history.
 
@@ -348,7 +809,8 @@ def add_prov_from_git(
     When diff_base is set, compares each file's RDF content (excluding date triples)
     against the version at the given git ref. Only files with actual content changes
     get their dates updated from git history; unchanged files have their dates
-    restored from the base version.
+    restored from the base version. Files that git reports as identical to the
+    base version are left as they are if they already have dates.
 
     Args:
         vocab_dir: Directory containing split turtle files to modify.
@@ -357,6 +819,9 @@ def add_prov_from_git(
             Used when files have been copied to a new location.
         diff_base: Git ref to compare against. When set, only changed files get
             updated dates.
+        cache: Optional provenance cache to reuse git history information
+            from previous runs. It is updated but not saved.
+        jobs: Number of worker processes to parse, update and write the files.
 
     Untracked .ttl files are skipped with an informational log message.
     """
@@ -370,14 +835,7 @@ def add_prov_from_git(
         logger.warning("No .ttl files found in %s", vocab_dir)
         return
 
-    if diff_base:
-        _validate_git_ref(diff_base, repo_dir)
-    else:
-        # Pre-fetch git info for all files (not needed with diff_base,
-        # where we lazily fetch only for changed files).
-        git_info = get_directory_git_info(git_lookup_dir, repo_dir)
-
-    # Process each .ttl file
+    rel_paths = []
     for ttl_file in ttl_files:
         # Preserve subdirectory structure when looking up in source directory
         rel_to_vocab = ttl_file.relative_to(vocab_dir)
@@ -386,35 +844,62 @@ def add_prov_from_git(
             rel_path = source_file.relative_to(repo_dir)
         except ValueError:
             rel_path = source_file
-        rel_path_str = str(rel_path).replace("\\", "/")
+        rel_paths.append(str(rel_path).replace("\\", "/"))
 
-        # Parse the RDF graph
-        graph = Graph().parse(ttl_file, format="turtle")
-
-        # Find the main subject IRI (concept, collection, or concept scheme)
-        main_iri = _find_main_iri(graph)
-        if main_iri is None:
-            logger.warning("No SKOS entity found in %s, skipping.", ttl_file)
-            continue
+    # Git info for all files is read in a single pass over the history.
+    git_info = get_directory_git_info(git_lookup_dir, repo_dir, cache)
 
-        if diff_base:
-            base_content = _get_file_at_ref(diff_base, rel_path_str, repo_dir)
-            if _try_restore_from_base(graph, main_iri, base_content, ttl_file):
-                continue
-            # CHANGED or NEW file -- get git info lazily
-            info = _get_file_git_info(rel_path_str, repo_dir)
-        else:
-            # ORIGINAL behavior (no diff_base)
-            info = git_info.get(rel_path_str)
-
-        if info is None:
-            logger.info(
-                'File "%s" is not tracked in git. Skipping provenance.', ttl_file
-            )
-            continue
+    if diff_base:
+        base_commit = validate_git_ref(diff_base, repo_dir)
+        base_summaries = {}
+        if cache:
+            cache.use_base(base_commit)
+            base_summaries = cache.bases
+        bases = _collect_bases(
+            diff_base, rel_paths, git_lookup_dir, repo_dir, base_summaries
+        )
+    else:
+        bases = [None] * len(ttl_files)
 
-        if _apply_git_dates(graph, main_iri, info, ttl_file):
-            graph.serialize(destination=ttl_file, format="longturtle")
+    tasks = [
+        (ttl_file, git_info.get(rel_path_str), base)
+        for ttl_file, rel_path_str, base in zip(ttl_files, rel_paths, bases)
+    ]
+    computed = [c for c in map_in_workers(_add_prov_to_file, tasks, jobs) if c]
+    if cache:
+        cache.bases.update(computed)
+
+
+def _collect_bases(
+    diff_base: str,
+    rel_paths: list[str],
+    git_lookup_dir: Path,
+    repo_dir: Path,
+    base_summaries: dict[str, dict | None],
+) -> list[tuple]:
+    """Return the diff-base information for each file (see _add_prov_to_file).
+
+    Changed files are listed with one git call. The base versions of changed
+    files whose blob summary is not known yet are read through a single git
+    process. Each blob is read only once, even if several files share it.
+    """
+    changed_paths = _get_changed_paths(diff_base, git_lookup_dir, repo_dir)
+    base_blobs = get_blobs_at_ref(diff_base, git_lookup_dir, repo_dir)
+    bases = []
+    contents = {}
+    with GitBlobReader(repo_dir) as base_reader:
+        for rel_path_str in rel_paths:
+            base_sha = base_blobs.get(rel_path_str)
+            if rel_path_str not in changed_paths or base_sha is None:
+                # unchanged (content not needed) or new file
+                bases.append((rel_path_str in changed_paths, base_sha, None, None))
+            elif base_sha in base_summaries:
+                bases.append((True, base_sha, None, base_summaries[base_sha]))
+            else:
+                if base_sha not in contents:
+                    contents[base_sha] = base_reader.read_object(base_sha)
+                bases.append((True, base_sha, contents[base_sha], None))
+    return bases
 
 
 # ===== Split/join utilities =====
@@ -624,6 +1109,7 @@ def _transform_rdf(file, args):
 
 def _handle_prov_from_git(args, diff_base):
     """Handle the --prov-from-git transform option."""
+    cache_file = getattr(args, "prov_cache", None)
     if not args.inplace and not args.outdir:
         msg = "--prov-from-git requires either --inplace or --outdir"
         logger.error(msg)
@@ -651,22 +1137,59 @@ def _handle_prov_from_git(args, diff_base):
             logger.error(msg)
             raise Voc4catError(msg)
 
-    for vocab_dir in vocab_dirs:
-        if args.outdir:
-            # Copy directory to outdir, then modify the copy
-            target_dir = args.outdir / vocab_dir.name
-            if target_dir.exists():
-                shutil.rmtree(target_dir)
-            shutil.copytree(vocab_dir, target_dir)
-            logger.debug("Copied %s to %s", vocab_dir, target_dir)
-            # Pass source_dir so git lookup uses original files
-            add_prov_from_git(target_dir, source_dir=vocab_dir, diff_base=diff_base)
-            logger.info("-> added provenance from git to: %s", target_dir)
-        else:
-            # --inplace: modify files in place
-            logger.debug("Adding provenance from git to %s", vocab_dir)
-            add_prov_from_git(vocab_dir, diff_base=diff_base)
-            logger.info("-> added provenance from git to: %s", vocab_dir)
+    # Only this process writes the cache; workers return their updated copy.
+    cache = ProvCache(cache_file, Path.cwd()) if cache_file else None
+    jobs = getattr(args, "jobs", 1)
+    tasks = [
+        (
+            vocab_dir,
+            args.outdir / vocab_dir.name if args.outdir else None,
+            diff_base,
+            cache,
+            # Use the workers for the directories if there are several of them.
+            jobs if len(vocab_dirs) == 1 else 1,
+        )
+        for vocab_dir in vocab_dirs
+    ]
+    worker_caches = map_in_workers(_prov_from_git_for_dir, tasks, jobs)
+    if cache:
+        for worker_cache in worker_caches:
+            cache.merge(worker_cache)
+        cache.save()
+
+
+def _prov_from_git_for_dir(
+    vocab_dir: Path,
+    target_dir: Path | None,
+    diff_base: str | None,
+    cache: ProvCache | None,
+    jobs: int,
+) -> ProvCache | None:
+    """Add provenance from git to vocab_dir or to a copy of it in target_dir.
+
+    Returns the updated provenance cache.
+    """
+    if target_dir is not None:
+        # Copy directory to outdir, then modify the copy
+        if target_dir.exists():
+            shutil.rmtree(target_dir)
+        shutil.copytree(vocab_dir, target_dir)
+        logger.debug("Copied %s to %s", vocab_dir, target_dir)
+        # Pass source_dir so git lookup uses original files
+        add_prov_from_git(
+            target_dir,
+            source_dir=vocab_dir,
+            diff_base=diff_base,
+            cache=cache,
+            jobs=jobs,
+        )
+        logger.info("-> added provenance from git to: %s", target_dir)
+    else:
+        # --inplace: modify files in place
+        logger.debug("Adding provenance from git to %s", vocab_dir)
+        add_prov_from_git(vocab_dir, diff_base=diff_base, cache=cache, jobs=jobs)
+        logger.info("-> added provenance from git to: %s", vocab_dir)
+    return cache
 
 
 def transform(args):
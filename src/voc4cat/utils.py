@@ -1,11 +1,13 @@
 import glob
 import logging
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from openpyxl import load_workbook
 
 from voc4cat.checks import Voc4catError
+from voc4cat.errors import ConversionError  # noqa: F401 (re-exported)
 from voc4cat.models_v1 import (
     COLLECTIONS_SHEET_NAME,
     CONCEPT_SCHEME_SHEET_NAME,
@@ -31,10 +33,6 @@ RDF_FILE_ENDINGS = {
 KNOWN_FILE_ENDINGS = [str(x) for x in RDF_FILE_ENDINGS] + EXCEL_FILE_ENDINGS
 
 
-class ConversionError(Exception):
-    pass
-
-
 def split_and_tidy(cell_value: str):
     # note this may not work in list of things that contain commas. Need to consider revising
     # to allow comma-separated values where it'll split in commas but not in things enclosed in quotes.
@@ -58,6 +56,67 @@ def has_file_in_multiple_formats(dir_):
     return [x for x in file_names if x in seen or seen.add(x)]
 
 
+class _RecordCollector(logging.Handler):
+    """Logging handler that keeps all records in a list."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        # Format the message now; args may not be picklable.
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        self.records.append(record)
+
+
+def _call_collecting_logs(func, loglevel, args):
+    """Call func(*args) in a worker and return (result, log records)."""
+    pkg_logger = logging.getLogger("voc4cat")
+    collector = _RecordCollector()
+    saved = (pkg_logger.level, pkg_logger.propagate)
+    pkg_logger.setLevel(loglevel)
+    pkg_logger.propagate = False
+    pkg_logger.addHandler(collector)
+    try:
+        result = func(*args)
+    finally:
+        pkg_logger.removeHandler(collector)
+        pkg_logger.setLevel(saved[0])
+        pkg_logger.propagate = saved[1]
+    return result, collector.records
+
+
+def map_in_workers(func, tasks: list[tuple], jobs: int = 1) -> list:
+    """Apply func to each task (a tuple of arguments), optionally in parallel.
+
+    With jobs > 1, the tasks are distributed to a pool of worker processes.
+    Log messages of the workers are collected and re-emitted in the main
+    process in task order, so the log is the same as for a sequential run.
+    func must be a picklable module-level function.
+
+    Returns:
+        List of results in task order.
+    """
+    if jobs <= 1 or len(tasks) <= 1:
+        return [func(*args) for args in tasks]
+
+    loglevel = logging.getLogger("voc4cat").getEffectiveLevel()
+    results = []
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as executor:
+        for result, records in executor.map(
+            _call_collecting_logs,
+            [func] * len(tasks),
+            [loglevel] * len(tasks),
+            tasks,
+        ):
+            for record in records:
+                logging.getLogger(record.name).handle(record)
+            results.append(result)
+    return results
+
+
 # =============================================================================
 # Shared Template Utilities
 # =============================================================================
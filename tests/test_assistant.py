@@ -0,0 +1,268 @@
+import random
+import sys
+import types
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+from Levenshtein import ratio
+from rdflib import RDF, SKOS, Graph, Literal, URIRef
+
+
+class FakeSentenceTransformer:
+    """Stand-in for a sentence_transformers model: bag of character counts."""
+
+    def __init__(self, model_name):
+        self.model_name = model_name
+
+    def encode(self, texts, batch_size, convert_to_numpy, normalize_embeddings):
+        embeddings = np.zeros((len(texts), 128), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for char in text.lower():
+                embeddings[row, ord(char) % 128] += 1
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.where(norms == 0, 1, norms)
+
+
+# The assistant imports sentence_transformers at module level.
+_stub = types.ModuleType("sentence_transformers")
+_stub.SentenceTransformer = FakeSentenceTransformer
+sys.modules.setdefault("sentence_transformers", _stub)
+
+from voc4cat import assistant  # noqa: E402
+from voc4cat.assistant import levenshtein_pairs  # noqa: E402
+from voc4cat.label_index import normalise_label  # noqa: E402
+
+CS_SIMPLE_TURTLE = "concept-scheme-simple.ttl"
+EX = "http://example.org/"
+
+
+@pytest.fixture(autouse=True)
+def fake_model(monkeypatch):
+    monkeypatch.setattr(assistant, "SentenceTransformer", FakeSentenceTransformer)
+
+
+def _random_labels(seed, n):
+    rnd = random.Random(seed)  # noqa: S311
+    return [
+        "".join(rnd.choice("abC d-") for _ in range(rnd.randint(0, 8)))
+        for _ in range(n)
+    ]
+
+
+def _brute_force_levenshtein(queries, choices, threshold):
+    """Return {(query index, choice index): ratio} for all pairs above threshold."""
+    queries = [normalise_label(query) for query in queries]
+    if choices is None:
+        pairs = [
+            (i, j) for i in range(len(queries)) for j in range(i + 1, len(queries))
+        ]
+        choices = queries
+    else:
+        choices = [normalise_label(choice) for choice in choices]
+        pairs = [(i, j) for i in range(len(queries)) for j in range(len(choices))]
+    scores = {(i, j): ratio(queries[i], choices[j]) for i, j in pairs}
+    return {pair: score for pair, score in scores.items() if score > threshold}
+
+
+def _as_dict(found):
+    pairs = {(i, j): score for i, j, score in found}
+    assert len(pairs) == len(found)  # no pair twice
+    return pairs
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 40, 41, 1000])
+@pytest.mark.parametrize("threshold", [0.0, 0.6, 0.9])
+def test_levenshtein_pairs_matches_brute_force(block_size, threshold):
+    queries = _random_labels(1, 41)
+    choices = _random_labels(2, 23)
+
+    found = _as_dict(list(levenshtein_pairs(queries, choices, threshold, block_size)))
+    expected = _brute_force_levenshtein(queries, choices, threshold)
+    assert found == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 40, 41, 1000])
+@pytest.mark.parametrize("threshold", [0.0, 0.6, 0.9])
+def test_levenshtein_pairs_within_queries(block_size, threshold):
+    queries = _random_labels(3, 41)
+
+    found = _as_dict(list(levenshtein_pairs(queries, None, threshold, block_size)))
+    # each pair once, in the upper triangle
+    assert all(qi < qj for qi, qj in found)
+    assert found == pytest.approx(_brute_force_levenshtein(queries, None, threshold))
+
+
+def test_levenshtein_pairs_empty():
+    assert list(levenshtein_pairs([], ["a"], 0.5)) == []
+    assert list(levenshtein_pairs(["a"], [], 0.5)) == []
+    assert list(levenshtein_pairs(["a"], None, 0.5)) == []
+    assert list(levenshtein_pairs(["same", " Same"], None, 0.99)) == [(0, 1, 1.0)]
+
+
+def test_levenshtein_pairs_scores_only_candidates(monkeypatch):
+    """Only the candidates from the label index are scored."""
+    scored = []
+    cdist = assistant.cdist
+
+    def recording_cdist(queries, choices, **kwargs):
+        scored.append(len(choices))
+        return cdist(queries, choices, **kwargs)
+
+    monkeypatch.setattr(assistant, "cdist", recording_cdist)
+    choices = ["heterogeneous catalysis", "homogeneous catalysis", "zeolite", "reactor"]
+    assert list(levenshtein_pairs(["Zeolites"], choices, 0.8)) == [
+        (0, 2, pytest.approx(ratio("zeolites", "zeolite")))
+    ]
+    assert scored == [1]
+
+
+def test_definition_similarity_from_one_batch(datadir, monkeypatch):
+    vocab = assistant.CompareVocabularies(datadir / CS_SIMPLE_TURTLE)
+    ids = list(vocab.vocab_new)
+    embeddings = FakeSentenceTransformer("test").encode(
+        [vocab.vocab_new[id_].definition for id_ in ids],
+        batch_size=len(ids),
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+    )
+
+    calls = []
+    encode = FakeSentenceTransformer.encode
+
+    def counting_encode(self, texts, **kwargs):
+        calls.append(len(texts))
+        return encode(self, texts, **kwargs)
+
+    monkeypatch.setattr(FakeSentenceTransformer, "encode", counting_encode)
+    for i, id_i in enumerate(ids):
+        for j, id_j in enumerate(ids):
+            assert vocab.get_definition_similarity(id_i, id_j) == pytest.approx(
+                float(embeddings[i] @ embeddings[j])
+            )
+    # all definitions were encoded in one call
+    assert calls == [len(ids)]
+
+
+def _random_embeddings(seed, n, dim=8):
+    rows = np.random.default_rng(seed).normal(size=(n, dim)).astype(np.float32)
+    return rows / np.linalg.norm(rows, axis=1, keepdims=True)
+
+
+def _brute_force_top_k(queries, choices, groups, k, threshold):
+    query_groups, choice_groups = groups
+    expected = {}
+    scores = queries @ choices.T
+    for qi, row in enumerate(scores):
+        matches = [
+            (float(score), cj)
+            for cj, score in enumerate(row)
+            if score > threshold and query_groups[qi] != choice_groups[cj]
+        ]
+        for score, cj in sorted(matches, reverse=True)[:k]:
+            expected[qi, cj] = score
+    return expected
+
+
+@pytest.mark.parametrize("tile_size", [1, 4, 29, 30, 31, 2048])
+@pytest.mark.parametrize("k", [1, 3, 50])
+@pytest.mark.parametrize("threshold", [-1.0, 0.3])
+def test_top_k_similar_matches_brute_force(tile_size, k, threshold):
+    queries = _random_embeddings(1, 30)
+    choices = _random_embeddings(2, 45)
+    query_groups = np.arange(30) % 7
+    choice_groups = np.arange(45) % 11
+
+    found = _as_dict(
+        list(
+            assistant.top_k_similar(
+                queries,
+                choices,
+                query_groups=query_groups,
+                choice_groups=choice_groups,
+                k=k,
+                threshold=threshold,
+                tile_size=tile_size,
+            )
+        )
+    )
+    expected = _brute_force_top_k(
+        queries, choices, (query_groups, choice_groups), k, threshold
+    )
+    assert found == pytest.approx(expected, abs=1e-5)
+
+
+@pytest.mark.parametrize(("k", "tile_size"), [(0, 10), (-1, 10), (1, 0)])
+def test_top_k_similar_rejects_invalid_sizes(k, tile_size):
+    embeddings = _random_embeddings(1, 3)
+    with pytest.raises(ValueError, match="must be at least 1"):
+        list(
+            assistant.top_k_similar(
+                embeddings,
+                embeddings,
+                query_groups=np.arange(3),
+                choice_groups=np.arange(3),
+                k=k,
+                tile_size=tile_size,
+            )
+        )
+
+
+def test_cli_rejects_invalid_top_k(datadir):
+    result = CliRunner().invoke(
+        assistant.cli, ["check", "--top-k", "0", str(datadir / CS_SIMPLE_TURTLE)]
+    )
+    assert result.exit_code == 2
+    assert "--top-k" in result.output
+
+
+@pytest.fixture
+def extended_vocab(datadir, tmp_path):
+    """Copy of the test vocabulary with two added concepts."""
+    graph = Graph().parse(datadir / CS_SIMPLE_TURTLE)
+    scheme = next(graph.subjects(RDF.type, SKOS.ConceptScheme))
+    for n in (7, 8):
+        concept = URIRef(f"{EX}test0{n}")
+        graph.add((concept, RDF.type, SKOS.Concept))
+        graph.add((concept, SKOS.prefLabel, Literal(f"term{n}", lang="en")))
+        graph.add((concept, SKOS.altLabel, Literal(f"AltLbl for term{n}", lang="en")))
+        graph.add((concept, SKOS.definition, Literal(f"def for term{n}", lang="en")))
+        graph.add((concept, SKOS.inScheme, scheme))
+        graph.add((concept, SKOS.broader, URIRef(f"{EX}test01")))
+    new_vocab = tmp_path / CS_SIMPLE_TURTLE
+    graph.serialize(new_vocab, format="turtle")
+    return datadir / CS_SIMPLE_TURTLE, new_vocab
+
+
+@pytest.mark.parametrize("method", ["sbert", "levenshtein"])
+@pytest.mark.parametrize("compare_all", [False, True])
+def test_compare_selects_added_concepts(extended_vocab, method, compare_all):
+    base_vocab, new_vocab = extended_vocab
+    vocab = assistant.CompareVocabularies(new_vocab, base_vocab)
+    added = {f"{EX}test07", f"{EX}test08"}
+    assert set(vocab.added_concepts) == added
+
+    results = vocab.compare_concept_labels(
+        method,
+        include_alt_labels=True,
+        threshold_labels=0.0,
+        threshold_definitions=-1.0,
+        compare_all=compare_all,
+        top_k=100,
+    )
+    found = [
+        frozenset((rec.sentence_key, rec.similar_sentence_key))
+        for rec in results["data"]
+    ]
+    assert len(found) == len(set(found))  # each pair of labels once
+
+    keys = [
+        (id_, kind) for id_ in vocab.vocab_new for kind in ("pref_label", "altLabel-0")
+    ]
+    expected = {
+        frozenset((key_a, key_b))
+        for key_a in keys
+        for key_b in keys
+        if key_a[0] != key_b[0] and (compare_all or {key_a[0], key_b[0]} & added)
+    }
+    assert set(found) == expected
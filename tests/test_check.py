@@ -3,11 +3,12 @@ import shutil
 from pathlib import Path
 
 import pytest
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
 
 from tests.test_cli import (
     CS_CYCLES,
 )
+from voc4cat.check import _find_duplicate_iris
 from voc4cat.checks import Voc4catError
 from voc4cat.cli import main_cli
 from voc4cat.convert import get_bundled_profiles
@@ -69,6 +70,73 @@ def test_check_xlsx_with_cell_coloring(tmp_path, caplog, cs_duplicates_xlsx):
     wb.close()
 
 
+def test_check_xlsx_collections_and_mappings(tmp_path, caplog, cs_cycles_xlsx):
+    """Duplicates in Collections and Mappings are found and colored."""
+    dst = tmp_path / CS_CYCLES
+    wb = load_workbook(cs_cycles_xlsx)
+    ws = wb["Collections"]
+    # Duplicate of the collection in row 6, separated by an empty row
+    for col_idx in range(1, ws.max_column + 1):
+        ws.cell(row=8, column=col_idx).value = ws.cell(row=6, column=col_idx).value
+    ws = wb["Mappings"]
+    ws["A6"] = ws["A8"] = "ex:test01"
+    ws["B7"] = "ex:other"
+    wb.save(dst)
+    wb.close()
+    orig_mtime = dst.stat().st_mtime_ns
+
+    with caplog.at_level(logging.ERROR):
+        main_cli(["check", "--inplace", str(dst)])
+
+    assert (
+        'Same Collection IRI "http://example.org/test/undirected-cycle" used more '
+        'than once for language "en"'
+    ) in caplog.text
+    assert (
+        'Same Concept IRI "ex:test01" used more than once in sheet "Mappings"'
+    ) in caplog.text
+    # The Concepts sheet has no duplicates.
+    assert len(caplog.records) == 2
+    assert dst.stat().st_mtime_ns != orig_mtime
+
+    wb = load_workbook(dst)
+    expected_color = "00FFCC00"
+    ws = wb["Collections"]
+    assert ws["A6"].fill.start_color.rgb == expected_color
+    assert ws["B8"].fill.start_color.rgb == expected_color
+    assert ws["A7"].fill.start_color.rgb != expected_color
+    ws = wb["Mappings"]
+    assert ws["A6"].fill.start_color.rgb == expected_color
+    assert ws["A8"].fill.start_color.rgb == expected_color
+    assert ws["B6"].fill.start_color.rgb != expected_color
+    wb.close()
+
+
+def test_find_duplicate_iris_non_string_language(caplog):
+    """A non-string language cell is reported without error."""
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["ex:1", 1])
+    ws.append(["ex:2", 1])
+    ws.append(["ex:1", 1])
+    with caplog.at_level(logging.ERROR):
+        assert _find_duplicate_iris(ws, 1, "Concept", 2) == {1, 3}
+    assert 'Same Concept IRI "ex:1" used more than once for language "1"' in (
+        caplog.text
+    )
+
+
+def test_check_xlsx_valid_file_not_written(tmp_path, caplog, cs_cycles_xlsx):
+    """A valid file is only read, not written."""
+    dst = tmp_path / CS_CYCLES
+    shutil.copy(cs_cycles_xlsx, dst)
+    orig_mtime = dst.stat().st_mtime_ns
+    with caplog.at_level(logging.INFO):
+        main_cli(["check", "--inplace", str(dst)])
+    assert "xlsx check passed" in caplog.text
+    assert dst.stat().st_mtime_ns == orig_mtime
+
+
 def test_check_skos_rdf(datadir, tmp_path, caplog):
     shutil.copy(datadir / CS_SIMPLE_TURTLE, tmp_path)
     with caplog.at_level(logging.INFO):
@@ -76,6 +144,41 @@ def test_check_skos_rdf(datadir, tmp_path, caplog):
     assert "The file is valid according to the vp4cat-5.2 profile." in caplog.text
 
 
+def test_check_broader_cycles(datadir, tmp_path, caplog):
+    shutil.copy(datadir / CS_SIMPLE_TURTLE, tmp_path)
+    with caplog.at_level(logging.INFO):
+        main_cli(["check", "--broader-cycles", str(tmp_path / CS_SIMPLE_TURTLE)])
+    assert "-> No cycles in skos:broader detected." in caplog.text
+
+    vocab = tmp_path / CS_SIMPLE_TURTLE
+    with vocab.open("a") as f:
+        f.write("ex:test01 skos:broader ex:test04 .\n")
+    caplog.clear()
+    with caplog.at_level(logging.INFO):
+        main_cli(["check", "--broader-cycles", str(vocab)])
+    assert (
+        "Cycle in skos:broader: ex:test01 -> ex:test04 -> ex:test03 -> ex:test01"
+        in caplog.text
+    )
+    assert "Total: 1 cycle(s) in skos:broader" in caplog.text
+
+
+def test_check_duplicate_labels(datadir, tmp_path, caplog):
+    shutil.copy(datadir / CS_SIMPLE_TURTLE, tmp_path)
+    vocab = tmp_path / CS_SIMPLE_TURTLE
+    with caplog.at_level(logging.INFO):
+        main_cli(["check", "--duplicate-labels", str(vocab)])
+    assert "-> No duplicate labels detected." in caplog.text
+
+    with vocab.open("a") as f:
+        f.write('ex:test02 skos:altLabel "term1"@en .\n')
+    caplog.clear()
+    with caplog.at_level(logging.INFO):
+        main_cli(["check", "--duplicate-labels", str(vocab)])
+    assert 'Label "term1"@en used by: ex:test01, ex:test02' in caplog.text
+    assert "Total: 1 label(s) used by more than one concept" in caplog.text
+
+
 def test_check_skos_badfile(monkeypatch, datadir, tmp_path, temp_config, caplog):
     """Check failing profile validation."""
     # Load/prepare an a config with required prefix definition
@@ -177,6 +280,33 @@ def test_check_ci_post_valid_directories(datadir, tmp_path, caplog):
     assert "ci-post passed" in caplog.text
 
 
+def test_check_ci_post_report_changes(datadir, tmp_path, caplog):
+    """Changed triples are only listed with --report-changes."""
+    prev_dir = tmp_path / "prev"
+    new_dir = tmp_path / "new"
+    prev_dir.mkdir()
+    new_dir.mkdir()
+    shutil.copy(datadir / "concept-scheme-simple.ttl", prev_dir)
+    shutil.copy(datadir / "concept-scheme-simple.ttl", new_dir)
+    vocab = new_dir / "concept-scheme-simple.ttl"
+    vocab.write_text(
+        vocab.read_text(encoding="utf-8").replace("def for term1", "term1 changed"),
+        encoding="utf-8",
+    )
+
+    cmd = ["check", "-v", "--ci-post", str(prev_dir), str(new_dir)]
+    with caplog.at_level(logging.DEBUG):
+        main_cli(cmd)
+    assert "ci-post passed" in caplog.text
+    assert "Added triple" not in caplog.text
+
+    caplog.clear()
+    with caplog.at_level(logging.DEBUG):
+        main_cli([*cmd[:2], "--report-changes", *cmd[2:]])
+    assert "-> Removed triple" in caplog.text
+    assert "term1 changed" in caplog.text
+
+
 def test_check_ci_post_prev_vocab_not_exists(datadir, tmp_path, caplog):
     """Test ci_post when previous version of vocab doesn't exist."""
     prev_dir = tmp_path / "prev"
@@ -11,6 +11,8 @@ from rdflib import RDF, SKOS, Graph, Literal, Namespace, URIRef
 
 from voc4cat.checks import (
     Voc4catError,
+    check_broader_cycles,
+    check_duplicate_labels,
     check_for_removed_iris,
     check_hierarchical_redundancy,
     check_number_of_files_in_inbox,
@@ -299,6 +301,29 @@ def test_check_for_removed_iris(  # noqa: PLR0913
     assert check_for_removed_iris(reduced, original) is None
 
 
+def test_check_for_removed_iris_report_changes(datadir, tmp_path, caplog):
+    original = datadir / "concept-scheme-with-cycles.ttl"
+    g = Graph()
+    g.parse(original, format="turtle")
+    concept = next(iter(g.subjects(RDF.type, SKOS.Concept)))
+    g.add((concept, SKOS.altLabel, Literal("new alt label", lang="en")))
+    changed = tmp_path / original.name
+    g.serialize(destination=changed, format="turtle")
+
+    with caplog.at_level(logging.DEBUG):
+        check_for_removed_iris(original, changed)
+    assert "Added triple" not in caplog.text
+    assert "No removals detected" in caplog.text
+
+    caplog.clear()
+    with caplog.at_level(logging.DEBUG):
+        check_for_removed_iris(original, changed, report_changes=True)
+    assert f'Added triple: <{concept}> {SKOS.altLabel.n3()} "new alt label"@en' in (
+        caplog.text
+    )
+    assert "Removed triple" not in caplog.text
+
+
 def test_check_hierarchical_redundancy_with_redundancy(tmp_path):
     """Test detection of redundant hierarchical relationships."""
     # Create a vocabulary with redundant hierarchy:
@@ -381,3 +406,31 @@ def test_check_hierarchical_redundancy_without_redundancy(tmp_path):
     redundancies = check_hierarchical_redundancy(vocab_file)
 
     assert len(redundancies) == 0
+
+
+def test_check_broader_cycles(datadir):
+    """Test detection of cycles in skos:broader from an already parsed graph."""
+    vocab_file = datadir / "concept-scheme-with-cycles.ttl"
+    graph = Graph().parse(vocab_file)
+    # a diamond (polyhierarchy) is not a cycle
+    assert check_broader_cycles(vocab_file, graph) == []
+
+    term = Namespace("http://example.org/test/")
+    graph.add((term.term1, SKOS.broader, term.term4))
+    assert check_broader_cycles(vocab_file, graph) == [
+        ["cs:/term1", "cs:/term4", "cs:/term2", "cs:/term1"]
+    ]
+
+
+def test_check_duplicate_labels(datadir):
+    """Test detection of labels used by more than one concept."""
+    vocab_file = datadir / "concept-scheme-with-cycles.ttl"
+    graph = Graph().parse(vocab_file)
+    assert check_duplicate_labels(vocab_file, graph) == []
+
+    term = Namespace("http://example.org/test/")
+    label = graph.value(term.term1, SKOS.prefLabel)
+    graph.add((term.term3, SKOS.altLabel, Literal(f" {label.upper()} ", lang="en")))
+    assert check_duplicate_labels(vocab_file, graph) == [
+        (str(label), "en", ["cs:/term1", "cs:/term3"])
+    ]
@@ -1,6 +1,8 @@
 import logging
 import os
 import shutil
+import subprocess
+import sys
 from unittest import mock
 
 import pytest
@@ -47,6 +49,53 @@ def test_main_subcmd_help(capsys):
     assert "usage: voc4cat transform" in captured.out
 
 
+# Modules that must not be imported by "voc4cat --help" (and by importing
+# voc4cat.cli) since they are only needed by the subcommands.
+HEAVY_MODULES = ("rdflib", "pyshacl", "openpyxl", "pydantic", "PIL", "curies")
+# Budget for the cumulative import time of voc4cat.cli in microseconds. It is
+# about 10 times the usual time, so only a real regression exceeds it.
+CLI_IMPORT_BUDGET_US = 1_000_000
+
+
+def test_cli_startup_imports():
+    """Subcommand modules are imported lazily to keep the CLI startup fast."""
+    code = (
+        "import sys\n"
+        "from voc4cat.cli import main_cli\n"
+        "main_cli([])\n"
+        "print(*sorted(sys.modules), sep='\\n', file=sys.stderr)"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert "usage: voc4cat" in result.stdout
+    lines = result.stderr.splitlines()
+    loaded = {
+        line.split(".")[0] for line in lines if not line.startswith("import time:")
+    }
+    assert loaded.isdisjoint(HEAVY_MODULES)
+
+    # "import time: self [us] | cumulative | imported package"
+    cumulative = {
+        line.split("|")[2].strip(): int(line.split("|")[1])
+        for line in lines
+        if line.startswith("import time:") and line.split("|")[1].strip().isdigit()
+    }
+    assert cumulative["voc4cat.cli"] < CLI_IMPORT_BUDGET_US
+
+
+def test_subcmd_imported_on_run(monkeypatch, tmp_path, capsys):
+    monkeypatch.delitem(sys.modules, "voc4cat.docs", raising=False)
+    with pytest.raises(SystemExit):
+        main_cli(["docs", "--help"])
+    assert "voc4cat.docs" not in sys.modules
+    main_cli(["docs", "--outdir", str(tmp_path / "out"), str(tmp_path)])
+    assert "voc4cat.docs" in sys.modules
+
+
 # ===== Tests for common options of all subcommands =====
 
 
@@ -58,6 +58,39 @@ def test_overlapping_idranges(datadir, temp_config):
         config.load_config(config=config.IDRANGES)
 
 
+def test_many_idranges(temp_config):
+    """Overlap detection and ID ownership for configs with many ID ranges"""
+    config = temp_config
+    id_range = [
+        {"first_id": first, "last_id": first + 999, "gh_name": f"user{first}"}
+        for first in range(1, 500_000, 1000)
+    ]
+    vocab = config.Vocab(
+        id_length=7,
+        permanent_iri_part="https://example.org",
+        checks={},
+        prefix_map={},
+        id_range=id_range,
+        vocabulary_iri="https://example.org/many/",
+        title="Many ID ranges",
+        description="A vocabulary with many ID ranges",
+        created_date="2025-01-01",
+        creator="Test Creator",
+        repository="https://github.com/test/many",
+    )
+    config.load_config(config=config.IDrangeConfig(vocabs={"many": vocab}))
+
+    assert config.id_range_owner("many", 123_456).gh_name == "user123001"
+    assert config.id_range_owner("many", 500_001) is None
+    assert config.id_range_owner("unknown", 1) is None
+
+    id_range.append({"first_id": 499_500, "last_id": 600_000, "gh_name": "late"})
+    with pytest.raises(
+        ValidationError, match=r"Overlapping ID ranges for IDs 499500-500000."
+    ):
+        config.Vocab(**{**vocab.model_dump(), "id_range": id_range})
+
+
 def test_single_vocab_consistency(datadir, temp_config):
     """Test consistency check for single_vocab=True."""
     config = temp_config
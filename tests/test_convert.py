@@ -1,11 +1,13 @@
 import contextlib
 import logging
+import os
 import shutil
 from pathlib import Path
 
 import pytest
 from openpyxl import Workbook, load_workbook
-from rdflib import SH
+from rdflib import SH, Graph
+from rdflib.compare import isomorphic
 
 from tests.test_cli import (
     CS_CYCLES,
@@ -13,9 +15,35 @@ from tests.test_cli import (
 )
 from voc4cat.checks import Voc4catError
 from voc4cat.cli import main_cli
-from voc4cat.convert import format_log_msg, resolve_profile, validate_with_profile
+from voc4cat.convert import (
+    PROFILE_DIR,
+    format_log_msg,
+    load_profile_graph,
+    resolve_profile,
+    validate_with_profile,
+)
 from voc4cat.utils import ConversionError
 
+CS_CYCLES_CONFIG = """
+config_version = "v1.0"
+single_vocab = true
+
+[vocabs.concept-scheme-with-cycles]
+id_length = 7
+permanent_iri_part = "http://example.org/test/"
+vocabulary_iri = "http://example.org/test/"
+title = "Test Vocabulary"
+description = "Test vocabulary"
+created_date = "2022-12-01"
+creator = "Test Author https://orcid.org/0000-0001-5000-0007"
+repository = "https://github.com/example/test"
+
+[vocabs.concept-scheme-with-cycles.checks]
+
+[vocabs.concept-scheme-with-cycles.prefix_map]
+ex = "http://example.org/"
+"""
+
 
 @pytest.mark.parametrize(
     ("outputdir", "testfile"),
@@ -309,6 +337,67 @@ ex = "http://example.org/"
         # Check output was created
         assert (tmp_path / "vocab-043-test.ttl").exists()
 
+    def test_from_043_streaming(self, datadir, tmp_path, monkeypatch, temp_config):
+        """Test that --from 043 --streaming writes the same graph."""
+        shutil.copy(datadir / "vocab-043-test.ttl", tmp_path)
+        config_content = """
+config_version = "v1.0"
+single_vocab = true
+
+[vocabs.vocab-043-test]
+id_length = 7
+permanent_iri_part = "http://example.org/test-vocab/"
+vocabulary_iri = "http://example.org/test-vocab/"
+title = "Test Vocabulary 043"
+description = "Test vocabulary"
+created_date = "2023-06-29"
+creator = "Test Author https://orcid.org/0000-0001-5000-0007"
+repository = "https://github.com/example/test"
+
+[vocabs.vocab-043-test.checks]
+
+[vocabs.vocab-043-test.prefix_map]
+ex = "http://example.org/"
+"""
+        config_file = tmp_path / "idranges.toml"
+        config_file.write_text(config_content)
+        monkeypatch.chdir(tmp_path)
+
+        with pytest.raises(Voc4catError, match="only supports --outputformat turtle"):
+            main_cli(
+                [
+                    "convert",
+                    "--config",
+                    str(config_file),
+                    "--from",
+                    "043",
+                    "--streaming",
+                    "--outputformat",
+                    "xml",
+                    str(tmp_path),
+                ]
+            )
+
+        for option, outdir in (([], "graph"), (["--streaming"], "streamed")):
+            (tmp_path / outdir).mkdir()
+            main_cli(
+                [
+                    "convert",
+                    "--config",
+                    str(config_file),
+                    "--from",
+                    "043",
+                    *option,
+                    "--outdir",
+                    str(tmp_path / outdir),
+                    str(tmp_path / "vocab-043-test.ttl"),
+                ]
+            )
+        assert isomorphic(
+            Graph().parse(tmp_path / "graph" / "vocab-043-test.ttl"),
+            Graph().parse(tmp_path / "streamed" / "vocab-043-test.ttl"),
+        )
+
 
 class TestFormatLogMsg:
     """Tests for format_log_msg function."""
@@ -389,6 +478,22 @@ class TestValidateWithProfile:
         with caplog.at_level(logging.ERROR), pytest.raises(ConversionError):
             validate_with_profile(str(ttl_file), profile="vp4cat-5.2", error_level=3)
 
+    def test_profile_graph_is_cached(self, datadir, tmp_path):
+        """Test that a profile is parsed once and reloaded when it changes."""
+        profile = tmp_path / "custom.ttl"
+        shutil.copy(PROFILE_DIR / "vp4cat-5.2.ttl", profile)
+        shapes = load_profile_graph(profile)
+        assert load_profile_graph(profile) is shapes
+
+        ttl_file = datadir / "concept-scheme-simple.ttl"
+        validate_with_profile(str(ttl_file), profile=str(profile))
+        validate_with_profile(str(ttl_file), profile=str(profile))
+        assert load_profile_graph(profile) is shapes
+
+        mtime = profile.stat().st_mtime_ns
+        os.utime(profile, ns=(mtime, mtime + 1_000_000_000))
+        assert load_profile_graph(profile) is not shapes
+
 
 class TestXlsxToRdfConversion:
     """Tests for xlsx to RDF conversion path."""
@@ -416,27 +521,8 @@ class TestXlsxToRdfConversion:
         config.CURIES_CONVERTER_MAP[vocab_name] = config.curies_converter
 
         # Create a v1.0 config file (creator is just the ORCID URL)
-        config_content = """
-config_version = "v1.0"
-single_vocab = true
-
-[vocabs.concept-scheme-with-cycles]
-id_length = 7
-permanent_iri_part = "http://example.org/test/"
-vocabulary_iri = "http://example.org/test/"
-title = "Test Vocabulary"
-description = "Test vocabulary"
-created_date = "2022-12-01"
-creator = "Test Author https://orcid.org/0000-0001-5000-0007"
-repository = "https://github.com/example/test"
-
-[vocabs.concept-scheme-with-cycles.checks]
-
-[vocabs.concept-scheme-with-cycles.prefix_map]
-ex = "http://example.org/"
-"""
         config_file = tmp_path / "idranges.toml"
-        config_file.write_text(config_content)
+        config_file.write_text(CS_CYCLES_CONFIG)
 
         monkeypatch.chdir(tmp_path)
 
@@ -444,3 +530,43 @@ ex = "http://example.org/"
 
         # Check output was created
         assert (vocab_dir / "concept-scheme-with-cycles.ttl").exists()
+
+    @pytest.mark.parametrize("permissive_profile", [False, True])
+    def test_xlsx_to_rdf_validate(
+        self, tmp_path, monkeypatch, cs_cycles_xlsx, temp_config, permissive_profile
+    ):
+        """Test that --validate gives the same result as check on the output."""
+        vocab_dir = tmp_path / "vocab"
+        vocab_dir.mkdir()
+        shutil.copy(cs_cycles_xlsx, vocab_dir / CS_CYCLES)
+        vocab_name = "concept-scheme-with-cycles"
+        temp_config.CURIES_CONVERTER_MAP[vocab_name] = temp_config.curies_converter
+        config_file = tmp_path / "idranges.toml"
+        config_file.write_text(CS_CYCLES_CONFIG)
+        monkeypatch.chdir(tmp_path)
+        profile = "vp4cat-5.2"
+        if permissive_profile:
+            profile = str(tmp_path / "no-shapes.ttl")
+            Path(profile).write_text("@prefix sh: <http://www.w3.org/ns/shacl#> .\n")
+
+        main_cli(["convert", "--config", str(config_file), str(vocab_dir)])
+        ttl_file = vocab_dir / "concept-scheme-with-cycles.ttl"
+        expected = ttl_file.read_text()
+        try:
+            validate_with_profile(str(ttl_file), profile=profile)
+        except ConversionError:
+            check_passes = False
+        else:
+            check_passes = True
+        assert check_passes == permissive_profile
+        ttl_file.unlink()
+
+        cmd = ["convert", "--config", str(config_file), "--validate"]
+        cmd += ["--profile", profile, str(vocab_dir)]
+        if check_passes:
+            main_cli(cmd)
+            assert ttl_file.read_text() == expected
+        else:
+            with pytest.raises(ConversionError, match="not valid according to"):
+                main_cli(cmd)
+            assert not ttl_file.exists()
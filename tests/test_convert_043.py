@@ -21,10 +21,16 @@ from rdflib import (
     Graph,
     Literal,
     Namespace,
+    URIRef,
 )
+from rdflib.compare import isomorphic
 
 from voc4cat.config import Vocab
-from voc4cat.convert_043 import convert_rdf_043_to_v1
+from voc4cat.convert_043 import (
+    _collect_subjects,
+    convert_rdf_043_to_v1,
+    stream_rdf_043_to_v1,
+)
 
 logger = logging.getLogger(__name__)
 EX = Namespace("http://example.org/")
@@ -888,3 +894,121 @@ class TestIdentifierTransformation:
         concept_id = list(converted.objects(EX.concept1, DCTERMS.identifier))
         assert len(concept_id) == 1
         assert str(concept_id[0]) == "concept1"
+
+
+class TestStreamingConvert043:
+    """Tests for the streaming 043 to v1.0 conversion."""
+
+    VOCAB_CONFIG = Vocab(
+        id_length=7,
+        permanent_iri_part="http://example.org/test-vocab/",
+        checks={},
+        prefix_map={"ex": "http://example.org/"},
+        vocabulary_iri="http://example.org/test-vocab/",
+        title="Config Title",
+        description="Description from config",
+        created_date="2023-06-29",
+        creator="Test Author https://orcid.org/0000-0001-5000-0007",
+        publisher="Publisher https://example.org/publisher",
+        repository="https://github.com/test/repo",
+    )
+
+    @pytest.mark.parametrize("input_format", ["turtle", "nt"])
+    @pytest.mark.parametrize("vocab_config", [None, VOCAB_CONFIG])
+    def test_same_result_as_graph_conversion(
+        self, tmp_path, input_format, vocab_config
+    ):
+        """Test that streaming creates the same graph as the graph conversion."""
+        suffix = ".ttl" if input_format == "turtle" else ".nt"
+        input_path = tmp_path / f"vocab-043-test{suffix}"
+        Graph().parse(VOCAB_043_TTL).serialize(
+            input_path, format=input_format, encoding="utf-8"
+        )
+
+        expected_path = convert_rdf_043_to_v1(
+            input_path, tmp_path / "expected.ttl", vocab_config=vocab_config
+        )
+        stats = stream_rdf_043_to_v1(
+            input_path, tmp_path / "streamed.ttl", vocab_config=vocab_config
+        )
+
+        expected = Graph().parse(expected_path)
+        streamed = Graph().parse(stats.output_path)
+        assert isomorphic(expected, streamed)
+        assert stats.triples_in == len(Graph().parse(input_path))
+        assert stats.triples_out == len(streamed)
+        if vocab_config is not None:
+            text = stats.output_path.read_text(encoding="utf-8")
+            assert "@prefix ex: <http://example.org/> ." in text
+
+    def test_dropped_predicates_counted(self, tmp_path, caplog):
+        """Test that triples of unknown predicates are counted per predicate."""
+        CUSTOM = Namespace("http://custom.org/")  # noqa: N806
+        g = Graph()
+        g.add((EX.scheme, RDF.type, SKOS.ConceptScheme))
+        g.add((EX.concept1, RDF.type, SKOS.Concept))
+        g.add((EX.concept1, CUSTOM.one, Literal("a")))
+        g.add((EX.concept1, CUSTOM.one, Literal("b")))
+        g.add((EX.concept1, CUSTOM.two, Literal("c")))
+        g.add((EX.scheme, DCTERMS.hasPart, EX.concept1))
+        input_path = tmp_path / "test_043.nt"
+        g.serialize(destination=str(input_path), format="nt", encoding="utf-8")
+
+        with caplog.at_level(logging.WARNING):
+            stats = stream_rdf_043_to_v1(input_path, output_format="nt")
+
+        assert stats.output_path == tmp_path / "test_043_v1.nt"
+        assert stats.dropped_predicates == {CUSTOM.one: 2, CUSTOM.two: 1}
+        assert stats.triples_in == 6
+        assert stats.triples_out == 2
+        assert "http://custom.org/one (2 triples)" in caplog.text
+        assert len(Graph().parse(stats.output_path, format="nt")) == 2
+
+    def test_unsupported_output_format(self, tmp_path):
+        """Test that only line-based output formats can be streamed."""
+        with pytest.raises(ValueError, match="Unsupported output format"):
+            stream_rdf_043_to_v1(VOCAB_043_TTL, tmp_path / "out.rdf", "xml")
+
+    def test_duplicates_written_once(self, tmp_path):
+        """Test that each distinct triple is written once in N-Triples syntax."""
+        g = Graph()
+        g.add((EX.scheme, RDF.type, SKOS.ConceptScheme))
+        g.add((EX.concept1, RDF.type, SKOS.Concept))
+        note = Literal('Line one\nwith "quotes" and \\ backslash', lang="en")
+        g.add((EX.concept1, SKOS.definition, note))
+        input_path = tmp_path / "test_043.nt"
+        g.serialize(destination=str(input_path), format="nt", encoding="utf-8")
+        lines = input_path.read_text(encoding="utf-8")
+        input_path.write_text(lines + lines, encoding="utf-8")
+
+        stats = stream_rdf_043_to_v1(input_path, output_format="nt")
+
+        out_lines = stats.output_path.read_text(encoding="utf-8").splitlines()
+        assert stats.triples_in == 6
+        assert stats.triples_out == len(out_lines) == len(set(out_lines)) == 3
+        streamed = Graph().parse(stats.output_path, format="nt")
+        assert (EX.concept1, SKOS.definition, note) in streamed
+
+    def test_only_scheme_metadata_kept_in_memory(self):
+        """Test that schema.org triples of other subjects are streamed."""
+        sdo = Namespace("https://schema.org/")
+        g = Graph()
+        g.add((EX.scheme, RDF.type, SKOS.ConceptScheme))
+        g.add((EX.scheme, DCTERMS.creator, EX.creator))
+        g.add((EX.creator, sdo.name, Literal("Creator")))
+        g.add((EX.concept1, RDF.type, SKOS.Concept))
+        g.add((EX.concept1, DCTERMS.creator, EX.other))
+        g.add((EX.concept1, sdo.name, Literal("Concept")))
+
+        subjects = _collect_subjects(g, self.VOCAB_CONFIG)
+
+        assert subjects.concepts == {EX.concept1}
+        assert subjects.scheme_entities == {
+            EX.creator,
+            URIRef("https://orcid.org/0000-0001-5000-0007"),
+            URIRef("https://example.org/publisher"),
+        }
+        assert subjects.is_scheme_metadata((EX.scheme, SKOS.prefLabel, Literal("S")))
+        assert subjects.is_scheme_metadata((EX.creator, sdo.name, Literal("C")))
+        assert not subjects.is_scheme_metadata((EX.concept1, sdo.name, Literal("C")))
+        assert not subjects.is_scheme_metadata((EX.other, RDF.type, sdo.Person))
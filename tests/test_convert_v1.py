@@ -2874,7 +2874,8 @@ class TestDeriveContributors:
         # Only user1's range has used IDs
         used_ids = {1, 2, 3}
 
-        result = derive_contributors(vocab, used_ids)
+        config.load_config(config=config.IDrangeConfig(vocabs={"test": vocab}))
+        result = derive_contributors(vocab, used_ids, "test")
         assert "User One" in result
         assert "0000-0001-2345-6789" in result
         assert "user2" not in result
@@ -2906,7 +2907,8 @@ class TestDeriveContributors:
 
         used_ids = {1, 2, 3}
 
-        result = derive_contributors(vocab, used_ids)
+        config.load_config(config=config.IDrangeConfig(vocabs={"test": vocab}))
+        result = derive_contributors(vocab, used_ids, "test")
         # User One is excluded because they're the creator
         assert result == ""
 
@@ -2931,7 +2933,8 @@ class TestDeriveContributors:
 
         used_ids = {1, 2, 3}
 
-        result = derive_contributors(vocab, used_ids)
+        config.load_config(config=config.IDrangeConfig(vocabs={"test": vocab}))
+        result = derive_contributors(vocab, used_ids, "test")
         # user1 is excluded because they're the creator
         assert result == ""
 
@@ -2968,7 +2971,8 @@ class TestDeriveContributors:
         # IDs used from both ranges
         used_ids = {5, 15}
 
-        result = derive_contributors(vocab, used_ids)
+        config.load_config(config=config.IDrangeConfig(vocabs={"test": vocab}))
+        result = derive_contributors(vocab, used_ids, "test")
         # Should only have one entry for user1
         assert result.count("0000-0001-2345-6789") == 1
 
@@ -2994,7 +2998,8 @@ class TestDeriveContributors:
         # No IDs used
         used_ids = set()
 
-        result = derive_contributors(vocab, used_ids)
+        config.load_config(config=config.IDrangeConfig(vocabs={"test": vocab}))
+        result = derive_contributors(vocab, used_ids, "test")
         assert result == ""
 
     def test_multiple_contributors(self, temp_config):
@@ -3037,7 +3042,8 @@ class TestDeriveContributors:
         # IDs used from alice's and charlie's ranges only
         used_ids = {5, 25}
 
-        result = derive_contributors(vocab, used_ids)
+        config.load_config(config=config.IDrangeConfig(vocabs={"test": vocab}))
+        result = derive_contributors(vocab, used_ids, "test")
         # Should have Alice and Charlie, but not Bob
         assert "Alice Smith" in result
         assert "0000-0001-2345-6789" in result
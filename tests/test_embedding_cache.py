@@ -0,0 +1,71 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from voc4cat.embedding_cache import EmbeddingCache  # noqa: E402
+
+MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+class FakeEncoder:
+    """Encoder that records which texts it was asked to encode."""
+
+    def __init__(self):
+        self.encoded = []
+
+    def __call__(self, texts):
+        self.encoded.extend(texts)
+        return np.array([[len(t), t.count("a"), 1.0] for t in texts], dtype=np.float32)
+
+
+def test_only_missing_texts_are_encoded(tmp_path):
+    encoder = FakeEncoder()
+    cache = EmbeddingCache(tmp_path, MODEL)
+    first = cache.encode(["alpha", "beta", "alpha"], encoder)
+    assert encoder.encoded == ["alpha", "beta"]
+    assert first.shape == (3, 3)
+    assert (first[0] == first[2]).all()
+    cache.save()
+    assert (tmp_path / "sentence-transformers_all-MiniLM-L6-v2").is_dir()
+
+    encoder = FakeEncoder()
+    cache = EmbeddingCache(tmp_path, MODEL)
+    second = cache.encode(["beta", "gamma", "alpha"], encoder)
+    assert encoder.encoded == ["gamma"]
+    assert (second[0] == first[1]).all()
+    assert (second[2] == first[0]).all()
+    cache.save()
+
+    # New entries were persisted as well.
+    encoder = FakeEncoder()
+    cache = EmbeddingCache(tmp_path, MODEL)
+    cache.encode(["gamma"], encoder)
+    assert encoder.encoded == []
+
+
+def test_stale_entries_are_evicted(tmp_path):
+    cache = EmbeddingCache(tmp_path, MODEL, max_unused_runs=2)
+    cache.encode(["alpha", "beta"], FakeEncoder())
+    cache.save()
+    for _ in range(2):
+        cache = EmbeddingCache(tmp_path, MODEL, max_unused_runs=2)
+        cache.encode(["alpha"], FakeEncoder())
+        cache.save()
+
+    encoder = FakeEncoder()
+    cache = EmbeddingCache(tmp_path, MODEL, max_unused_runs=2)
+    cache.encode(["alpha", "beta"], encoder)
+    assert encoder.encoded == ["beta"]
+
+
+def test_cache_of_other_model_is_ignored(tmp_path):
+    cache = EmbeddingCache(tmp_path, "model-a")
+    cache.encode(["alpha"], FakeEncoder())
+    cache.save()
+    # Same directory name after sanitising, but a different model
+    (tmp_path / "model-a").rename(tmp_path / "model_a")
+
+    encoder = FakeEncoder()
+    cache = EmbeddingCache(tmp_path, "model/a")
+    cache.encode(["alpha"], encoder)
+    assert encoder.encoded == ["alpha"]
@@ -0,0 +1,57 @@
+import random
+
+from rdflib import SKOS, Graph, Namespace
+
+from voc4cat.hierarchy import HierarchyIndex
+
+EX = Namespace("http://example.org/")
+
+
+def _graph(edges):
+    g = Graph()
+    for child, parent in edges:
+        g.add((EX[child], SKOS.broader, EX[parent]))
+    return g
+
+
+def test_ancestors_match_transitive_objects():
+    rnd = random.Random(42)  # noqa: S311
+    edges = [(f"c{i}", f"c{rnd.randrange(i)}") for i in range(1, 300) for _ in range(2)]
+    g = _graph(edges)
+    index = HierarchyIndex(g)
+    for node in index.nodes:
+        expected = set(g.transitive_objects(node, SKOS.broader)) - {node}
+        assert index.ancestors(node) == expected
+    assert index.cycles() == []
+
+
+def test_deep_hierarchy():
+    depth = 5000
+    g = _graph([(f"c{i + 1}", f"c{i}") for i in range(depth)])
+    index = HierarchyIndex(g)
+    assert len(index.ancestors(EX[f"c{depth}"])) == depth
+    assert index.is_ancestor(EX.c0, EX[f"c{depth}"])
+    assert not index.is_ancestor(EX[f"c{depth}"], EX.c0)
+
+
+def test_redundancies():
+    g = _graph([("C", "B"), ("B", "A"), ("C", "A"), ("D", "A"), ("D", "E")])
+    assert HierarchyIndex(g).redundancies() == [(EX.C, EX.A, EX.B)]
+
+
+def test_cycles():
+    g = _graph(
+        [
+            ("A", "B"),
+            ("B", "C"),
+            ("C", "A"),
+            ("D", "A"),  # leads into the cycle but is not part of it
+            ("E", "E"),
+            ("F", "G"),
+        ]
+    )
+    index = HierarchyIndex(g)
+    assert index.cycles() == [[EX.A, EX.B, EX.C, EX.A], [EX.E, EX.E]]
+    # all members of a cycle are ancestors of each other
+    assert index.ancestors(EX.B) == {EX.A, EX.B, EX.C}
+    assert index.ancestors(EX.D) == {EX.A, EX.B, EX.C}
@@ -0,0 +1,132 @@
+import logging
+import os
+import random
+
+import pytest
+
+from voc4cat.cli import main_cli
+from voc4cat.config import IDrangeConfig, Vocab
+from voc4cat.errors import Voc4catError
+from voc4cat.id_alloc import UsedIdBitmap, allocate_ids, load_used_ids
+
+
+def _make_split_dir(vocab_dir, ids):
+    for id_ in ids:
+        partition = vocab_dir / f"IDs{id_ // 1000:04d}xxx"
+        partition.mkdir(parents=True, exist_ok=True)
+        (partition / f"{id_:07d}.ttl").write_text("")
+    (vocab_dir / "concept_scheme.ttl").write_text("")
+
+
+def test_bitmap_from_directory(tmp_path):
+    used = {1, 2, 3, 7, 8, 999, 1000, 2500}
+    _make_split_dir(tmp_path, used)
+    bitmap = UsedIdBitmap.from_directory(tmp_path)
+
+    assert {i for i in range(3000) if bitmap.is_used(i)} == used
+    assert bitmap.count_used(1, 8) == 5
+    assert bitmap.count_used(4, 6) == 0
+    assert bitmap.count_used(900, 10_000) == 3
+    assert bitmap.free_ids(1, 20, 4) == [4, 5, 6, 9]
+    assert bitmap.free_ids(998, 1002) == [998, 1001, 1002]
+    assert bitmap.free_ids(2499, 2503, 3) == [2499, 2501, 2502]
+    assert bitmap.free_ids(1, 3) == []
+
+
+def test_free_ids_matches_brute_force():
+    rnd = random.Random(7)  # noqa: S311
+    bitmap = UsedIdBitmap()
+    # Runs of free and used bytes and bytes with both
+    bitmap.bits = bytearray(
+        rnd.choice([0, 0xFF, rnd.randrange(256)]) for _ in range(64)
+    )
+    used = {i for i in range(64 * 8) if bitmap.bits[i >> 3] & (1 << (i & 7))}
+
+    for first, last in [(0, 600), (3, 13), (17, 17), (100, 511), (509, 530), (5, 4)]:
+        expected = [i for i in range(first, last + 1) if i not in used]
+        assert bitmap.free_ids(first, last) == expected
+        for count in (0, 1, 5, 50):
+            assert bitmap.free_ids(first, last, count) == expected[:count]
+
+
+def test_cache_is_updated_incrementally(tmp_path):
+    vocab_dir = tmp_path / "voc"
+    cache = tmp_path / "ids.bin"
+    _make_split_dir(vocab_dir, [1, 2, 1001])
+    assert load_used_ids(vocab_dir, cache).free_ids(1, 5, 1) == [3]
+    assert cache.exists()
+
+    # Unchanged partitions are not scanned again.
+    bitmap = UsedIdBitmap.load(cache)
+    assert bitmap.update(vocab_dir) == 0
+
+    # Add an ID to one partition and remove another partition
+    _make_split_dir(vocab_dir, [3])
+    partition = vocab_dir / "IDs0000xxx"
+    mtime = partition.stat().st_mtime_ns + 1_000_000
+    os.utime(partition, ns=(mtime, mtime))
+    (vocab_dir / "IDs0001xxx" / "0001001.ttl").unlink()
+    (vocab_dir / "IDs0001xxx").rmdir()
+
+    bitmap = load_used_ids(vocab_dir, cache)
+    assert bitmap.free_ids(1, 5, 1) == [4]
+    assert not bitmap.is_used(1001)
+    assert UsedIdBitmap.load(cache).partitions == bitmap.partitions
+
+
+def test_allocate_ids_for_actor(tmp_path, mandatory_fields, temp_config):
+    _make_split_dir(tmp_path, [1, 2, 11])
+    vocab_config = Vocab(
+        id_length=7,
+        permanent_iri_part="https://example.org/",
+        checks={},
+        prefix_map={},
+        id_range=[
+            {"first_id": 1, "last_id": 10, "gh_name": "alice"},
+            {
+                "first_id": 11,
+                "last_id": 20,
+                "orcid": "https://orcid.org/0000-0001-2345-6789",
+            },
+            {"first_id": 21, "last_id": 30, "gh_name": "Alice"},
+        ],
+        **mandatory_fields,
+    )
+    temp_config.load_config(config=IDrangeConfig(vocabs={"voc": vocab_config}))
+
+    result = allocate_ids(tmp_path, "voc", "ALICE", count=9)
+    assert [(idr.first_id, unused, free) for idr, unused, free in result] == [
+        (1, 8, [3, 4, 5, 6, 7, 8, 9, 10]),
+        (21, 10, [21]),
+    ]
+    ((_, unused, free),) = allocate_ids(
+        tmp_path, "voc", "0000-0001-2345-6789", count=2
+    )
+    assert (unused, free) == (9, [12, 13])
+    assert len(allocate_ids(tmp_path, "voc")) == 3
+    with pytest.raises(Voc4catError, match="at least 1, not 0"):
+        allocate_ids(tmp_path, "voc", count=0)
+
+
+def test_ids_cli(datadir, tmp_path, temp_config, caplog):
+    vocab_dir = tmp_path / "myvocab"
+    _make_split_dir(vocab_dir, [1, 2, 5])
+    config_file = datadir / "valid_idranges.toml"
+
+    with caplog.at_level(logging.INFO):
+        main_cli(
+            [
+                "ids",
+                "--config",
+                str(config_file),
+                "-a",
+                "sofia-garcia",
+                "-n",
+                "3",
+                str(vocab_dir),
+            ]
+        )
+    assert "free: 0000003, 0000004, 0000006" in caplog.text
+
+    with pytest.raises(Voc4catError, match="No ID range found"):
+        main_cli(["ids", "--config", str(config_file), "-a", "nobody", str(vocab_dir)])
@@ -0,0 +1,71 @@
+import random
+
+import pytest
+
+from voc4cat.id_space import IdRangeIndex, IdSpace
+
+
+def test_queries_match_set_arithmetic():
+    rnd = random.Random(7)  # noqa: S311
+    used = {rnd.randint(1, 300) for _ in range(150)}
+    space = IdSpace(used)
+    assert len(space) == len(used)
+    for _ in range(300):
+        first = rnd.randint(0, 310)
+        last = first + rnd.randint(-1, 60)
+        range_ids = set(range(first, last + 1))
+        unused = sorted(range_ids - used)
+        assert space.count_used(first, last) == len(range_ids & used)
+        assert space.count_unused(first, last) == len(unused)
+        assert space.any_used(first, last) == bool(range_ids & used)
+        assert space.next_unused(first, last) == (unused[0] if unused else None)
+        assert list(space.unused(first, last)) == unused
+
+
+@pytest.mark.parametrize(
+    ("used", "expected"),
+    [((), 10), ((10, 11, 12), 13), ((10, 12), 11), (range(10, 21), None)],
+)
+def test_next_unused(used, expected):
+    assert IdSpace(used).next_unused(10, 20) == expected
+
+
+def test_large_ranges_are_not_materialized():
+    space = IdSpace([5, 1_000_000])
+    assert 5 in space
+    assert 6 not in space
+    assert space.count_unused(1, 10**9) == 10**9 - 2
+    assert space.next_unused(5, 10**9) == 6
+    assert not space.any_used(6, 999_999)
+
+
+def test_id_range_index():
+    index = IdRangeIndex([(20, 29, "b"), (1, 9, "a"), (100, 199, "c")])
+    assert len(index) == 3
+    assert index.owner(1) == "a"
+    assert index.owner(25) == "b"
+    assert index.owner(10) is None
+    assert 199 in index
+    assert 200 not in index
+    assert index.overlap(10, 19) is None
+    assert index.overlap(5, 25) == (5, 25)
+    assert index.overlap(150, 300) == (150, 199)
+
+    index.add(10, 19, "d")
+    assert index.owner(15) == "d"
+    with pytest.raises(ValueError, match=r"Overlapping ID ranges for IDs 28-29."):
+        index.add(28, 40, "e")
+    with pytest.raises(ValueError, match=r"Overlapping ID ranges for IDs 5-9."):
+        IdRangeIndex([(1, 9, "a"), (5, 12, "b")])
+
+
+def test_owners_in_use():
+    rnd = random.Random(3)  # noqa: S311
+    ranges = [(first, first + 9, first) for first in range(1, 1000, 20)]
+    index = IdRangeIndex(ranges)
+    for _ in range(50):
+        space = IdSpace(rnd.randint(1, 1100) for _ in range(rnd.randint(0, 40)))
+        expected = [
+            owner for first, last, owner in ranges if space.any_used(first, last)
+        ]
+        assert index.owners_in_use(space) == expected
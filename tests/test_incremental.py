@@ -0,0 +1,173 @@
+import logging
+import shutil
+
+import pytest
+from rdflib import Graph, Literal, URIRef
+from rdflib.namespace import SKOS
+from rdflib.util import guess_format
+
+from voc4cat.cli import main_cli
+from voc4cat.convert import validate_with_profile
+from voc4cat.errors import Voc4catError
+from voc4cat.incremental import (
+    build_focus_subgraph,
+    changed_subjects,
+    get_focus_nodes,
+    load_base_graph,
+)
+from voc4cat.transform import _run_git
+from voc4cat.utils import ConversionError
+
+CS_SIMPLE_TURTLE = "concept-scheme-simple.ttl"
+EX = "http://example.org/"
+
+
+def _remove_pref_label(graph):
+    graph.remove((URIRef(EX + "test02"), SKOS.prefLabel, None))
+
+
+def _add_dangling_broader(graph):
+    graph.add((URIRef(EX + "test04"), SKOS.broader, URIRef(EX + "missing")))
+
+
+def _remove_concept(graph):
+    # test01 and test04 still refer to the removed concept
+    graph.remove((URIRef(EX + "test03"), None, None))
+
+
+def _add_second_definition(graph):
+    graph.add((URIRef(EX + "test06"), SKOS.definition, Literal("other", lang="en")))
+
+
+def _validation_results(graph, caplog, focus_nodes=None):
+    """Return the logged validation results (as in the report of check)."""
+    caplog.clear()
+    with caplog.at_level(logging.INFO), pytest.raises(ConversionError):
+        validate_with_profile(graph, focus_nodes=focus_nodes)
+    return sorted(
+        r.getMessage() for r in caplog.records if "Validation Result" in r.getMessage()
+    )
+
+
+def test_changed_subjects(datadir):
+    old = Graph().parse(datadir / CS_SIMPLE_TURTLE)
+    new = Graph().parse(datadir / CS_SIMPLE_TURTLE)
+    assert changed_subjects(old, new) == set()
+
+    _remove_pref_label(new)
+    _remove_concept(new)
+    assert changed_subjects(old, new) == {URIRef(EX + "test02"), URIRef(EX + "test03")}
+
+
+def test_focus_nodes_include_skos_neighbours(datadir):
+    old = Graph().parse(datadir / CS_SIMPLE_TURTLE)
+    new = Graph().parse(datadir / CS_SIMPLE_TURTLE)
+    _remove_concept(new)
+
+    focus = get_focus_nodes(old, new)
+    # broader/narrower concepts, the collection and the scheme of test03
+    assert {URIRef(EX + "test01"), URIRef(EX + "test04")} <= focus
+    assert URIRef(EX + "test10") in focus
+    assert URIRef(EX + "test/") in focus
+    # removed and unrelated concepts are not validated
+    assert URIRef(EX + "test03") not in focus
+    assert URIRef(EX + "test05") not in focus
+
+    subgraph, context = build_focus_subgraph(new, focus)
+    assert all((node, None, None) in subgraph for node in focus)
+    assert not focus & context
+    # top concept of the scheme is only needed as context
+    assert URIRef(EX + "test05") in context
+
+
+@pytest.mark.parametrize(
+    "seed",
+    [
+        [_remove_pref_label],
+        [_add_dangling_broader],
+        [_remove_concept],
+        [_add_second_definition],
+        [
+            _remove_pref_label,
+            _add_dangling_broader,
+            _remove_concept,
+            _add_second_definition,
+        ],
+    ],
+    ids=["prefLabel", "broader", "removed", "definition", "all"],
+)
+def test_incremental_agrees_with_full_validation(datadir, caplog, seed):
+    """Incremental and full validation report the same seeded violations."""
+    old = Graph().parse(datadir / CS_SIMPLE_TURTLE)
+    # The base version must be valid.
+    validate_with_profile(old)
+
+    new = Graph().parse(datadir / CS_SIMPLE_TURTLE)
+    for func in seed:
+        func(new)
+
+    full = _validation_results(new, caplog)
+    incremental = _validation_results(new, caplog, get_focus_nodes(old, new))
+    assert full
+    assert incremental == full
+
+
+def test_check_incremental_from_dir(datadir, tmp_path, caplog):
+    base_dir = tmp_path / "base"
+    base_dir.mkdir()
+    shutil.copy(datadir / CS_SIMPLE_TURTLE, base_dir)
+    new_dir = tmp_path / "new"
+    new_dir.mkdir()
+    new = Graph().parse(datadir / CS_SIMPLE_TURTLE)
+    _remove_pref_label(new)
+    new.serialize(new_dir / CS_SIMPLE_TURTLE, format="turtle")
+
+    with (
+        caplog.at_level(logging.INFO),
+        pytest.raises(ConversionError, match="not valid according to"),
+    ):
+        main_cli(["check", "--incremental-from", str(base_dir), str(new_dir)])
+    assert "changed or related node(s)" in caplog.text
+    assert "Focus Node: <http://example.org/test02>" in caplog.text
+
+    # Without previous version the whole file is validated.
+    caplog.clear()
+    with caplog.at_level(logging.INFO), pytest.raises(ConversionError):
+        main_cli(["check", "--incremental-from", str(tmp_path), str(new_dir)])
+    assert "validating all" in caplog.text
+
+
+def test_load_base_graph_from_git_ref(datadir, tmp_path):
+    _run_git(["git", "init"], tmp_path)
+    _run_git(["git", "config", "user.email", "test@example.com"], tmp_path)
+    _run_git(["git", "config", "user.name", "Test User"], tmp_path)
+    vocab = tmp_path / "vocab"
+    vocab.mkdir()
+    shutil.copy(datadir / CS_SIMPLE_TURTLE, vocab)
+    _run_git(["git", "add", "."], tmp_path)
+    _run_git(["git", "commit", "-m", "initial"], tmp_path)
+
+    new = Graph().parse(vocab / CS_SIMPLE_TURTLE)
+    _remove_pref_label(new)
+    new.serialize(vocab / CS_SIMPLE_TURTLE, format="turtle")
+
+    base = load_base_graph(vocab / CS_SIMPLE_TURTLE, "HEAD")
+    assert changed_subjects(base, new) == {URIRef(EX + "test02")}
+    assert load_base_graph(vocab / "other.ttl", "HEAD") is None
+    with pytest.raises(Voc4catError, match="not a valid git ref"):
+        load_base_graph(vocab / CS_SIMPLE_TURTLE, "no-such-ref")
+
+
+@pytest.mark.parametrize("suffix", [".xml", ".jsonld", ".nt"])
+def test_load_base_graph_from_git_ref_format(datadir, tmp_path, suffix):
+    _run_git(["git", "init"], tmp_path)
+    _run_git(["git", "config", "user.email", "test@example.com"], tmp_path)
+    _run_git(["git", "config", "user.name", "Test User"], tmp_path)
+    graph = Graph().parse(datadir / CS_SIMPLE_TURTLE)
+    vocab_file = (tmp_path / CS_SIMPLE_TURTLE).with_suffix(suffix)
+    graph.serialize(vocab_file, format=guess_format(vocab_file.name))
+    _run_git(["git", "add", "."], tmp_path)
+    _run_git(["git", "commit", "-m", "initial"], tmp_path)
+
+    base = load_base_graph(vocab_file, "HEAD")
+    assert changed_subjects(base, graph) == set()
@@ -0,0 +1,140 @@
+import random
+
+import pytest
+from rdflib import Graph, Literal, URIRef
+from rdflib.namespace import RDF, SKOS
+
+from voc4cat.convert_v1 import rdf_to_excel_v1, read_concepts_v1
+from voc4cat.label_index import LabelIndex, normalise_label
+from voc4cat.models_v1 import ConceptV1
+
+CS_SIMPLE_TURTLE = "concept-scheme-simple.ttl"
+EX = "http://example.org/"
+
+
+def _ratio(a: str, b: str) -> float:
+    """Normalised Indel similarity (as Levenshtein.ratio) via the LCS."""
+    if not a and not b:
+        return 1.0
+    lcs = [0] * (len(b) + 1)
+    for char_a in a:
+        prev = 0
+        for j, char_b in enumerate(b, start=1):
+            prev, lcs[j] = (
+                lcs[j],
+                prev + 1 if char_a == char_b else max(lcs[j], lcs[j - 1]),
+            )
+    return 2 * lcs[-1] / (len(a) + len(b))
+
+
+@pytest.mark.parametrize("threshold", [0.0, 0.5, 0.7, 0.9])
+def test_candidates_contain_all_similar_labels(threshold):
+    rnd = random.Random(42)  # noqa: S311
+    labels = [
+        "".join(rnd.choice("abcd -") for _ in range(rnd.randint(0, 12)))
+        for _ in range(200)
+    ]
+    index = LabelIndex()
+    for i, label in enumerate(labels):
+        index.add(f"{EX}c{i}", label)
+
+    for query in labels[:40]:
+        text = normalise_label(query)
+        expected = {
+            entry
+            for entry, other in enumerate(index.texts)
+            if _ratio(text, other) > threshold
+        }
+        assert expected <= set(index.candidates(query, threshold))
+
+
+def test_candidates_prune_dissimilar_labels():
+    index = LabelIndex()
+    for i, label in enumerate(
+        ["heterogeneous catalysis", "homogeneous catalysis", "zeolite", "reactor"]
+    ):
+        index.add(f"{EX}c{i}", label)
+    assert index.candidates("Heterogeneous-Catalysis", 0.9) == [0, 1]
+    assert index.candidates("Zeolites", 0.8) == [2]
+    assert index.token_candidates("catalysis of zeolite") == {0, 1, 2}
+
+
+def test_from_graph_and_duplicates(datadir):
+    graph = Graph().parse(datadir / CS_SIMPLE_TURTLE)
+    index = LabelIndex.from_graph(graph)
+    concepts = set(graph.subjects(RDF.type, SKOS.Concept))
+    assert len(index) == sum(
+        1 for s, p, _ in graph if s in concepts and p in (SKOS.prefLabel, SKOS.altLabel)
+    )
+    assert index.duplicates() == []
+
+    label = graph.value(URIRef(EX + "test01"), SKOS.prefLabel)
+    graph.add((URIRef(EX + "test02"), SKOS.altLabel, Literal(label.upper(), "en")))
+    # Same label in another language is no duplicate
+    graph.add((URIRef(EX + "test03"), SKOS.altLabel, Literal(str(label), "de")))
+    index = LabelIndex.from_graph(graph)
+    (duplicate,) = index.duplicates()
+    assert {index.iris[e] for e in duplicate} == {EX + "test01", EX + "test02"}
+    assert {index.kinds[e] for e in duplicate} == {"pref", "alt"}
+
+
+def test_from_concepts():
+    rows = [
+        ConceptV1(
+            concept_iri="ex:1",
+            language_code="en",
+            preferred_label="Catalyst",
+            definition="A substance.",
+            alternate_labels="cat | catalyser",
+        ),
+        ConceptV1(
+            concept_iri="ex:2",
+            language_code="en",
+            preferred_label="catalyser",
+            definition="Other substance.",
+        ),
+    ]
+    index = LabelIndex.from_concepts(rows)
+    assert index.labels == ["Catalyst", "cat", "catalyser", "catalyser"]
+    assert index.duplicates() == [[2, 3]]
+
+
+def _entries(index, entries):
+    return {
+        (index.iris[e], index.labels[e], index.langs[e], index.kinds[e])
+        for e in entries
+    }
+
+
+def test_from_concepts_same_as_from_graph(datadir, tmp_path, temp_config):
+    xlsx = rdf_to_excel_v1(datadir / CS_SIMPLE_TURTLE, tmp_path / "cs.xlsx")
+    from_rows = LabelIndex.from_concepts(
+        read_concepts_v1(xlsx), converter=temp_config.curies_converter
+    )
+    from_graph = LabelIndex.from_graph(Graph().parse(datadir / CS_SIMPLE_TURTLE))
+
+    assert _entries(from_rows, range(len(from_rows))) == _entries(
+        from_graph, range(len(from_graph))
+    )
+    for query in ("term1", "AltLbl for term", "term 12", "xyz"):
+        for threshold in (0.3, 0.6, 0.9):
+            assert _entries(
+                from_rows, from_rows.candidates(query, threshold)
+            ) == _entries(from_graph, from_graph.candidates(query, threshold))
+
+
+def test_save_and_load(datadir, tmp_path):
+    graph = Graph().parse(datadir / CS_SIMPLE_TURTLE)
+    index = LabelIndex.from_graph(graph)
+    index.save(tmp_path / "labels.json")
+    loaded = LabelIndex.load(tmp_path / "labels.json")
+
+    assert loaded.texts == index.texts
+    assert loaded.grams == index.grams
+    for label in index.labels:
+        assert loaded.candidates(label, 0.8) == index.candidates(label, 0.8)
+
+    data = index.to_dict()
+    data["version"] = 0
+    with pytest.raises(ValueError, match="Unsupported label index version"):
+        LabelIndex.from_dict(data)
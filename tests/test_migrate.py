@@ -0,0 +1,163 @@
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+from rdflib import Graph
+from rdflib.compare import isomorphic
+
+from voc4cat.cli import main_cli
+from voc4cat.convert_043 import convert_rdf_043_to_v1
+from voc4cat.errors import Voc4catError
+from voc4cat.migrate import migrate_043
+from voc4cat.transform import _run_git
+
+VOCAB_043 = "vocab-043-test.ttl"
+CONFIG = """
+config_version = "v1.0"
+single_vocab = false
+
+[vocabs.vocab-043-test]
+id_length = 7
+permanent_iri_part = "http://example.org/test-vocab/"
+vocabulary_iri = "http://example.org/test-vocab/"
+title = "Test Vocabulary 043"
+description = "Test vocabulary"
+created_date = "2023-06-29"
+creator = "Test Author https://orcid.org/0000-0001-5000-0007"
+repository = "https://github.com/example/test"
+
+[vocabs.vocab-043-test.checks]
+
+[vocabs.vocab-043-test.prefix_map]
+ex = "http://example.org/"
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path, temp_config):
+    config_file = tmp_path / "idranges.toml"
+    config_file.write_text(CONFIG)
+    return config_file
+
+
+def test_migrate_tree(datadir, tmp_path, config_file):
+    tree = tmp_path / "tree"
+    (tree / "sub").mkdir(parents=True)
+    shutil.copy(datadir / VOCAB_043, tree)
+    Graph().parse(datadir / VOCAB_043).serialize(
+        tree / "sub" / "other.nt", format="nt", encoding="utf-8"
+    )
+    (tree / "README.md").write_text("not a vocabulary")
+    summary = tmp_path / "summary.json"
+
+    main_cli(
+        [
+            "migrate",
+            "--config",
+            str(config_file),
+            "--jobs",
+            "2",
+            "--summary",
+            str(summary),
+            "--outdir",
+            str(tmp_path / "out"),
+            str(tree),
+        ]
+    )
+
+    expected = Graph().parse(
+        convert_rdf_043_to_v1(tree / VOCAB_043, tmp_path / "expected.ttl")
+    )
+    assert isomorphic(Graph().parse(tmp_path / "out" / "sub" / "other.ttl"), expected)
+
+    data = json.loads(summary.read_text())
+    assert [f["source"] for f in data["files"]] == [
+        str(tree / "sub" / "other.nt"),
+        str(tree / VOCAB_043),
+    ]
+    assert data["totals"]["files"] == 2
+    assert data["totals"]["triples_in"] == 2 * len(Graph().parse(tree / VOCAB_043))
+    assert data["totals"]["triples_out"] == sum(f["triples_out"] for f in data["files"])
+    assert data["totals"]["dropped_predicates"] == {}
+
+
+def test_migrate_git_refs(datadir, tmp_path, config_file):
+    repo = tmp_path / "repo"
+    vocabs = repo / "vocabularies"
+    vocabs.mkdir(parents=True)
+    _run_git(["git", "init"], repo)
+    _run_git(["git", "config", "user.email", "test@example.com"], repo)
+    _run_git(["git", "config", "user.name", "Test User"], repo)
+    shutil.copy(datadir / VOCAB_043, vocabs)
+    _run_git(["git", "add", "."], repo)
+    _run_git(["git", "commit", "-m", "initial"], repo)
+    _run_git(["git", "tag", "v0.1"], repo)
+    (vocabs / VOCAB_043).unlink()
+    _run_git(["git", "commit", "-am", "remove"], repo)
+
+    with pytest.raises(Voc4catError, match="output directory"):
+        migrate_043(vocabs, refs=["v0.1"])
+
+    files = migrate_043(
+        vocabs, tmp_path / "out", refs=["v0.1", "HEAD"], output_format="nt"
+    )
+    assert [f["source"] for f in files] == [f"v0.1:{VOCAB_043}"]
+    output = tmp_path / "out" / "v0.1" / "vocab-043-test.nt"
+    assert files[0]["output"] == str(output)
+    assert len(Graph().parse(output, format="nt")) == files[0]["triples_out"]
+
+    with pytest.raises(Voc4catError, match="not a valid git ref"):
+        migrate_043(vocabs, tmp_path / "out", refs=["no-such-ref"])
+
+
+def test_migrate_tree_without_outdir(datadir, tmp_path, config_file):
+    tree = tmp_path / "tree"
+    tree.mkdir()
+    shutil.copy(datadir / VOCAB_043, tree)
+    Graph().parse(datadir / VOCAB_043).serialize(
+        tree / "other.rdf", format="xml", encoding="utf-8"
+    )
+    input_text = (tree / VOCAB_043).read_text()
+
+    files = migrate_043(tree)
+
+    # The input files are kept; the output gets a "_v1" name like convert.
+    assert (tree / VOCAB_043).read_text() == input_text
+    assert [f["output"] for f in files] == [
+        str(tree / "other_v1.ttl"),
+        str(tree / "vocab-043-test_v1.ttl"),
+    ]
+    assert not (tree / "other.ttl").exists()
+
+    # Running again in place skips the outputs of the first run.
+    assert migrate_043(tree) == files
+    assert sorted(path.name for path in tree.iterdir()) == [
+        "other.rdf",
+        "other_v1.ttl",
+        "vocab-043-test.ttl",
+        "vocab-043-test_v1.ttl",
+    ]
+
+    shutil.copy(datadir / VOCAB_043, tree / "vocab-043-test.nt")
+    with pytest.raises(Voc4catError, match="would both be migrated"):
+        migrate_043(tree, output_format="nt", jobs=1)
+
+
+def test_migrate_git_ref_single_file(datadir, tmp_path, config_file, monkeypatch):
+    repo = tmp_path / "repo"
+    vocabs = repo / "vocabularies"
+    vocabs.mkdir(parents=True)
+    _run_git(["git", "init"], repo)
+    _run_git(["git", "config", "user.email", "test@example.com"], repo)
+    _run_git(["git", "config", "user.name", "Test User"], repo)
+    shutil.copy(datadir / VOCAB_043, vocabs)
+    _run_git(["git", "add", "."], repo)
+    _run_git(["git", "commit", "-m", "initial"], repo)
+
+    # A relative path to a single file, resolved against the working directory
+    monkeypatch.chdir(vocabs)
+    files = migrate_043(Path(VOCAB_043), tmp_path / "out", refs=["HEAD"])
+    assert [f["output"] for f in files] == [
+        str(tmp_path / "out" / "HEAD" / "vocab-043-test.ttl")
+    ]
@@ -0,0 +1,136 @@
+import logging
+import shutil
+from unittest import mock
+
+import pyshacl
+import pytest
+from rdflib import SH, Graph, Literal, URIRef
+from rdflib.namespace import SKOS
+
+from voc4cat.cli import main_cli
+from voc4cat.convert import PROFILE_DIR, _results_from_report, load_profile_graph
+from voc4cat.quick_check import VP4CAT, quick_validate
+from voc4cat.utils import ConversionError
+
+CS_SIMPLE_TURTLE = "concept-scheme-simple.ttl"
+EX = "http://example.org/"
+
+
+def _seed_violations(graph):
+    graph.remove((URIRef(EX + "test02"), SKOS.prefLabel, None))
+    graph.add((URIRef(EX + "test04"), SKOS.prefLabel, Literal("second", lang="de")))
+    graph.remove((URIRef(EX + "test05"), SKOS.definition, None))
+    graph.add((URIRef(EX + "test06"), SKOS.definition, Literal("other", lang="en")))
+    graph.remove((URIRef(EX + "test01"), SKOS.inScheme, None))
+    graph.add((URIRef(EX + "test04"), SKOS.broader, URIRef(EX + "missing")))
+
+
+def test_quick_validate_valid_vocabulary(datadir):
+    graph = Graph().parse(datadir / CS_SIMPLE_TURTLE)
+    assert quick_validate(graph) == []
+
+
+def test_quick_validate_matches_shacl(datadir):
+    """The quick checks find the same problems as pyshacl."""
+    graph = Graph().parse(datadir / CS_SIMPLE_TURTLE)
+    _seed_violations(graph)
+
+    quick = {
+        (r["focusNode"], r["sourceConstraintComponent"]) for r in quick_validate(graph)
+    }
+    assert quick == {
+        (EX + "test02", str(SH.MinCountConstraintComponent)),
+        (EX + "test04", str(SH.MaxCountConstraintComponent)),
+        (EX + "test05", str(SH.MinCountConstraintComponent)),
+        (EX + "test06", str(SH.UniqueLangConstraintComponent)),
+        (EX + "test01", str(SH.MinCountConstraintComponent)),
+        (EX + "test04", str(SH.ClassConstraintComponent)),
+    }
+
+    _conforms, results_graph, _text = pyshacl.validate(
+        graph, shacl_graph=load_profile_graph(PROFILE_DIR / "vp4cat-5.2.ttl")
+    )
+    full = {
+        (r["focusNode"], r["sourceConstraintComponent"])
+        for r in _results_from_report(results_graph)
+    }
+    assert quick <= full
+
+
+def test_quick_validate_not_in_hierarchy(datadir):
+    """Like the profile, the quick checks do not require topConceptOf/broader."""
+    graph = Graph().parse(datadir / CS_SIMPLE_TURTLE)
+    concept = URIRef(EX + "test06")
+    graph.remove((concept, SKOS.topConceptOf, None))
+    graph.remove((None, SKOS.hasTopConcept, concept))
+    assert quick_validate(graph) == []
+    conforms, _results_graph, _text = pyshacl.validate(
+        graph, shacl_graph=load_profile_graph(PROFILE_DIR / "vp4cat-5.2.ttl")
+    )
+    assert conforms
+
+
+def test_quick_validate_profile_messages(datadir):
+    """With the profile, the results use its sh:message and sh:severity."""
+    shapes_graph = load_profile_graph(PROFILE_DIR / "vp4cat-5.2.ttl")
+    graph = Graph().parse(datadir / CS_SIMPLE_TURTLE)
+    _seed_violations(graph)
+
+    messages = {
+        (r["focusNode"], r["resultMessage"], r["resultSeverity"])
+        for r in quick_validate(graph, shapes_graph)
+    }
+    assert (
+        EX + "test02",
+        str(shapes_graph.value(URIRef(VP4CAT + "prefLabel"), SH.message)),
+        str(SH.Violation),
+    ) in messages
+    assert any(
+        focus == EX + "test01" and message.startswith("Requirement 2.1.8")
+        for focus, message, _severity in messages
+    )
+    # Shapes without sh:message keep the message of the quick check.
+    assert (
+        EX + "test04",
+        f"Value of skos:broader must be a {SKOS.Concept.n3()}.",
+        str(SH.Violation),
+    ) in messages
+
+
+def test_check_quick(datadir, tmp_path, caplog):
+    graph = Graph().parse(datadir / CS_SIMPLE_TURTLE)
+    _seed_violations(graph)
+    vocab = tmp_path / CS_SIMPLE_TURTLE
+    graph.serialize(vocab, format="turtle")
+
+    with (
+        caplog.at_level(logging.INFO),
+        pytest.raises(ConversionError, match="not valid according to"),
+    ):
+        main_cli(["check", "--quick", str(vocab)])
+    assert "Validation Result in MinCountConstraintComponent" in caplog.text
+    assert "Focus Node: <http://example.org/test02>" in caplog.text
+    assert "Validation summary: 0 info, 0 warnings, 6 violations" in caplog.text
+
+    caplog.clear()
+    shutil.copy(datadir / CS_SIMPLE_TURTLE, vocab)
+    with caplog.at_level(logging.INFO):
+        main_cli(["check", "--quick", str(vocab)])
+    assert "-> The file is valid according to the vp4cat-5.2 profile." in caplog.text
+
+
+def test_check_runs_full_shacl_without_quick(datadir, tmp_path, caplog):
+    """Without --quick, problems found by the quick checks do not skip SHACL."""
+    graph = Graph().parse(datadir / CS_SIMPLE_TURTLE)
+    _seed_violations(graph)
+    vocab = tmp_path / CS_SIMPLE_TURTLE
+    graph.serialize(vocab, format="turtle")
+
+    with (
+        mock.patch("voc4cat.convert.quick_validate") as quick,
+        mock.patch("voc4cat.convert.pyshacl.validate", wraps=pyshacl.validate) as full,
+        pytest.raises(ConversionError, match="not valid according to"),
+    ):
+        main_cli(["check", str(vocab)])
+    quick.assert_not_called()
+    full.assert_called_once()
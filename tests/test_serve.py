@@ -0,0 +1,64 @@
+import logging
+import shutil
+import threading
+
+import pytest
+
+from voc4cat import convert
+from voc4cat.cli import run_cli_app
+from voc4cat.errors import Voc4catError
+from voc4cat.serve import SOCKET_ENV, create_server, run_in_daemon, warm_up
+
+CS_SIMPLE_TURTLE = "concept-scheme-simple.ttl"
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch, temp_config):
+    monkeypatch.setattr(convert, "VOCAB_GRAPH_CACHE_SIZE", 0)
+    monkeypatch.setattr(convert, "_VOCAB_GRAPHS", convert.OrderedDict())
+    socket_path = tmp_path / "voc4cat.sock"
+    server = create_server(socket_path)
+    warm_up(graph_cache_size=2)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    monkeypatch.setenv(SOCKET_ENV, str(socket_path))
+    yield socket_path
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_check_in_daemon(daemon, datadir, tmp_path, monkeypatch, capsys):
+    shutil.copy(datadir / CS_SIMPLE_TURTLE, tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    run_cli_app(["check", CS_SIMPLE_TURTLE])
+    captured = capsys.readouterr()
+    assert "-> The file is valid according to the vp4cat-5.2 profile." in captured.err
+    # The vocabulary was parsed by the daemon and is kept for the next job.
+    assert (tmp_path / CS_SIMPLE_TURTLE).resolve() in convert._VOCAB_GRAPHS
+
+    run_cli_app(["check", "-v", CS_SIMPLE_TURTLE])
+    assert "Using cached graph" in capsys.readouterr().err
+
+    with pytest.raises(SystemExit) as exc_info:
+        run_cli_app(["check", "missing.ttl"])
+    assert exc_info.value.code == 1
+    assert "File/dir not found: missing.ttl" in capsys.readouterr().err
+
+
+def test_daemon_already_running(daemon):
+    with pytest.raises(Voc4catError, match="already listening"):
+        create_server(daemon)
+
+
+def test_fallback_without_daemon(datadir, tmp_path, monkeypatch, caplog):
+    shutil.copy(datadir / CS_SIMPLE_TURTLE, tmp_path)
+    monkeypatch.chdir(tmp_path)
+    socket_path = tmp_path / "no-daemon.sock"
+    monkeypatch.setenv(SOCKET_ENV, str(socket_path))
+
+    assert run_in_daemon(["check", CS_SIMPLE_TURTLE], socket_path) is None
+    with caplog.at_level(logging.INFO):
+        run_cli_app(["check", CS_SIMPLE_TURTLE])
+    assert "-> The file is valid according to the vp4cat-5.2 profile." in caplog.text
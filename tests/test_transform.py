@@ -1,6 +1,8 @@
+import json
 import logging
 import os
 import shutil
+import subprocess
 from unittest import mock
 
 import pytest
@@ -9,7 +11,20 @@ from rdflib import DCTERMS, OWL, SKOS, XSD, Graph, Literal
 from tests.test_cli import CS_CYCLES
 from voc4cat.checks import Voc4catError
 from voc4cat.cli import main_cli
-from voc4cat.transform import _run_git, get_partition_dir_name
+from voc4cat.transform import (
+    FileGitInfo,
+    GitBlobReader,
+    ProvCache,
+    _content_fingerprint,
+    _get_changed_paths,
+    _has_prov_dates_text,
+    _parse_commit,
+    _prov_from_git_for_dir,
+    _run_git,
+    get_directory_git_info,
+    get_partition_dir_name,
+)
+from voc4cat.utils import map_in_workers
 
 CS_SIMPLE_TURTLE = "concept-scheme-simple.ttl"
 
@@ -492,6 +507,138 @@ def test_prov_from_git_follows_renames(tmp_path, datadir, monkeypatch, caplog):
     assert modified == "2025-06-15"
 
 
+def _per_file_git_info(filepath: str, repo_dir) -> FileGitInfo | None:
+    """Test oracle: git info of one file from ``git log --follow``."""
+    log = _run_git(
+        ["git", "log", "--follow", "--format=%an%x00%ae%x00%aI", "--", filepath],
+        repo_dir,
+    )
+    lines = [line for line in log.stdout.split("\n") if line.strip()]
+    if not lines:
+        return None
+    modified = _parse_commit(*lines[0].split("\x00"))
+    created = _parse_commit(*lines[-1].split("\x00"))
+    return FileGitInfo(
+        created_by=created[0],
+        created_email=created[1],
+        created_at=created[2],
+        modified_by=modified[0],
+        modified_email=modified[1],
+        modified_at=modified[2],
+    )
+
+
+def test_directory_git_info_matches_per_file_log(tmp_path, datadir):
+    """The single git-log pass gives the same results as git log --follow per file."""
+    _run_git(["git", "init"], tmp_path)
+    _run_git(["git", "config", "user.email", "creator@example.com"], tmp_path)
+    _run_git(["git", "config", "user.name", "Original Creator"], tmp_path)
+    shutil.copy(datadir / CS_SIMPLE_TURTLE, tmp_path)
+    main_cli(["transform", "--split", "--inplace", str(tmp_path)])
+    vocdir = (tmp_path / CS_SIMPLE_TURTLE).with_suffix("")
+    _run_git(["git", "add", "."], tmp_path)
+    _run_git(
+        ["git", "commit", "-m", "Initial", "--date", "2020-01-15T10:00:00"], tmp_path
+    )
+
+    concept_files = sorted((vocdir / "IDs0000xxx").glob("*.ttl"))
+    # rename one file, move another one to a new directory, edit a third one
+    _run_git(["git", "config", "user.name", "Second Editor"], tmp_path)
+    _run_git(
+        [
+            "git",
+            "mv",
+            concept_files[0].relative_to(tmp_path).as_posix(),
+            concept_files[0].with_name("renamed.ttl").relative_to(tmp_path).as_posix(),
+        ],
+        tmp_path,
+    )
+    (vocdir / "moved").mkdir()
+    _run_git(
+        [
+            "git",
+            "mv",
+            concept_files[1].relative_to(tmp_path).as_posix(),
+            (vocdir / "moved" / "moved.ttl").relative_to(tmp_path).as_posix(),
+        ],
+        tmp_path,
+    )
+    _run_git(
+        ["git", "commit", "-m", "Rename", "--date", "2022-03-01T10:00:00"], tmp_path
+    )
+    _run_git(["git", "config", "user.name", "Third Editor"], tmp_path)
+    with concept_files[2].open("a", encoding="utf-8") as f:
+        f.write("\n# edited\n")
+    (vocdir / "new.ttl").write_text("# new file\n", encoding="utf-8")
+    _run_git(["git", "add", "."], tmp_path)
+    _run_git(["git", "commit", "-m", "Edit", "--date", "2024-07-01T10:00:00"], tmp_path)
+
+    batched = get_directory_git_info(vocdir, tmp_path)
+    tracked = _run_git(["git", "ls-files"], tmp_path).stdout.split()
+    per_file = {path: _per_file_git_info(path, tmp_path) for path in tracked}
+
+    assert batched == {k: v for k, v in per_file.items() if k in batched}
+    assert len(batched) == len(list(vocdir.rglob("*.ttl")))
+    renamed = vocdir.relative_to(tmp_path).as_posix() + "/IDs0000xxx/renamed.ttl"
+    assert batched[renamed].created_by == "Original Creator"
+    assert batched[renamed].modified_by == "Second Editor"
+
+
+def test_directory_git_info_with_merges(tmp_path):
+    """Merge histories give the same results as git log --follow per file."""
+
+    def commit(author, date):
+        _run_git(["git", "config", "user.name", author], tmp_path)
+        _run_git(["git", "add", "-A"], tmp_path)
+        _run_git(["git", "commit", "-m", author, "--date", date], tmp_path)
+
+    def write(name, text):
+        path = tmp_path / "voc" / name
+        path.write_text(text, encoding="utf-8")
+
+    _run_git(["git", "init", "-b", "main"], tmp_path)
+    _run_git(["git", "config", "user.email", "editor@example.com"], tmp_path)
+    (tmp_path / "voc").mkdir()
+    for name in ("kept.ttl", "discarded.ttl", "conflict.ttl", "renamed.ttl"):
+        write(name, f"# {name}\n")
+    commit("Creator", "2020-01-01T10:00:00")
+
+    _run_git(["git", "checkout", "-b", "side"], tmp_path)
+    write("kept.ttl", "# kept, changed on side\n")
+    write("discarded.ttl", "# changed on side, discarded by merge\n")
+    write("conflict.ttl", "# side version\n")
+    _run_git(["git", "mv", "voc/renamed.ttl", "voc/moved.ttl"], tmp_path)
+    commit("Side Editor", "2021-01-01T10:00:00")
+
+    _run_git(["git", "checkout", "main"], tmp_path)
+    write("conflict.ttl", "# main version\n")
+    commit("Main Editor", "2022-01-01T10:00:00")
+
+    # Merge without committing, then resolve: keep the side version of
+    # kept.ttl, discard the side change of discarded.ttl and write a new
+    # version of conflict.ttl.
+    subprocess.run(
+        ["git", "merge", "--no-commit", "--no-ff", "side"],  # noqa: S607
+        cwd=tmp_path,
+        capture_output=True,
+        check=False,
+    )
+    _run_git(["git", "checkout", "main", "--", "voc/discarded.ttl"], tmp_path)
+    write("conflict.ttl", "# resolved version\n")
+    commit("Merger", "2023-01-01T10:00:00")
+
+    batched = get_directory_git_info(tmp_path / "voc", tmp_path)
+    tracked = _run_git(["git", "ls-files"], tmp_path).stdout.split()
+    per_file = {path: _per_file_git_info(path, tmp_path) for path in tracked}
+
+    assert batched == per_file
+    assert batched["voc/kept.ttl"].modified_by == "Side Editor"
+    # git log --follow does not simplify history and does not list merges.
+    assert batched["voc/discarded.ttl"].modified_by == "Side Editor"
+    assert batched["voc/conflict.ttl"].modified_by == "Main Editor"
+    assert batched["voc/moved.ttl"].created_by == "Creator"
+
+
 # ===== Tests for partitioned split structure =====
 
 
@@ -894,6 +1041,53 @@ def test_diff_base_base_no_dates_falls_through(git_repo_with_split_files, monkey
     assert len(modified) == 1
 
 
+def test_diff_base_unchanged_not_parsed(git_repo_with_split_files, monkeypatch):
+    """Files identical to the base that have dates are not parsed."""
+    repo_path, vocdir = git_repo_with_split_files
+    monkeypatch.chdir(repo_path)
+    main_cli(["transform", "--prov-from-git", "--inplace", str(vocdir)])
+    _run_git(["git", "add", "."], repo_path)
+    _run_git(["git", "commit", "-m", "Add provenance"], repo_path)
+
+    parsed = []
+    original_parse = Graph.parse
+
+    def recording_parse(self, source=None, **kwargs):
+        parsed.append(source)
+        return original_parse(self, source, **kwargs)
+
+    monkeypatch.setattr(Graph, "parse", recording_parse)
+    main_cli(
+        [
+            "transform",
+            "--prov-from-git",
+            "--diff-base",
+            "HEAD",
+            "--inplace",
+            str(vocdir),
+        ]
+    )
+    assert not [src for src in parsed if str(src).endswith(".ttl")]
+
+
+def test_has_prov_dates_text():
+    assert _has_prov_dates_text(
+        "@prefix dcterms: <http://purl.org/dc/terms/> .\n"
+        "<x> dcterms:modified '2024-01-01' ."
+    )
+    assert _has_prov_dates_text(
+        "PREFIX : <http://purl.org/dc/terms/>\n<x> :created '2024-01-01' ."
+    )
+    assert _has_prov_dates_text("<x> <http://purl.org/dc/terms/created> 'x' .")
+    assert not _has_prov_dates_text(
+        "@prefix dcterms: <http://purl.org/dc/terms/> .\n<x> dcterms:title 'x' ."
+    )
+    # "created" in another namespace does not count
+    assert not _has_prov_dates_text(
+        "@prefix ex: <https://example.org/> .\n<x> ex:created 'x' ."
+    )
+
+
 def test_diff_base_with_outdir(git_repo_with_split_files, monkeypatch):
     """Works correctly with --outdir (source paths used for git lookups)."""
     repo_path, vocdir = git_repo_with_split_files
@@ -990,3 +1184,277 @@ def test_diff_base_concept_scheme(git_repo_with_split_files, monkeypatch):
     assert (
         str(next(iter(graph2.objects(cs_iri, DCTERMS.modified)))) == original_modified
     )
+
+
+def test_git_blob_reader(git_repo_with_split_files):
+    """Blobs are streamed from one cat-file process; missing paths give None."""
+    repo_path, vocdir = git_repo_with_split_files
+    rel_vocdir = vocdir.relative_to(repo_path).as_posix()
+    cs_file = vocdir / "concept_scheme.ttl"
+    cs_file.write_text("# changed in working tree\n", encoding="utf-8")
+
+    with GitBlobReader(repo_path) as reader:
+        content = reader.read("HEAD", f"{rel_vocdir}/concept_scheme.ttl")
+        assert "ConceptScheme" in content
+        assert reader.read("HEAD", f"{rel_vocdir}/missing.ttl") is None
+        # a tree is not a file
+        assert reader.read("HEAD", rel_vocdir) is None
+        # the reader can be used again after a miss
+        assert reader.read("HEAD", f"{rel_vocdir}/concept_scheme.ttl") == content
+
+    assert _get_changed_paths("HEAD", vocdir, repo_path) == {
+        f"{rel_vocdir}/concept_scheme.ttl"
+    }
+
+
+def test_prov_from_git_cache(git_repo_with_split_files, monkeypatch, caplog):
+    """Provenance cache is reused and only changed files are recomputed."""
+    repo_path, vocdir = git_repo_with_split_files
+    monkeypatch.chdir(repo_path)
+    cache_file = repo_path / ".cache" / "prov.json"
+    n_files = len(list(vocdir.rglob("*.ttl")))
+    expected = get_directory_git_info(vocdir, repo_path)
+
+    cmd = ["transform", "-v", "--prov-from-git", "--prov-cache", str(cache_file)]
+    cmd += ["--inplace", str(vocdir)]
+    with caplog.at_level(logging.DEBUG):
+        main_cli(cmd)
+    assert f"0 hits, {n_files} misses" in caplog.text
+    assert cache_file.exists()
+
+    # Same HEAD: everything comes from the cache, which is read only once
+    caplog.clear()
+    with (
+        caplog.at_level(logging.DEBUG),
+        mock.patch.object(
+            ProvCache, "_load", autospec=True, side_effect=ProvCache._load
+        ) as load,
+    ):
+        main_cli(cmd)
+    assert load.call_count == 1
+    assert f"{n_files} hits, 0 misses" in caplog.text
+    assert (
+        get_directory_git_info(vocdir, repo_path, ProvCache(cache_file, repo_path))
+        == expected
+    )
+
+    # New commit touching all files (dates added): all entries are invalidated
+    _run_git(["git", "add", "."], repo_path)
+    _run_git(["git", "commit", "-m", "Add provenance"], repo_path)
+    caplog.clear()
+    with caplog.at_level(logging.DEBUG):
+        main_cli(cmd)
+    assert f"0 hits, {n_files} misses" in caplog.text
+
+    # New commit touching one file: only that file is recomputed
+    changed_file = next(vocdir.rglob("*.ttl"))
+    with changed_file.open("a", encoding="utf-8") as f:
+        f.write("\n# edited\n")
+    _run_git(["git", "add", "."], repo_path)
+    _run_git(["git", "commit", "-m", "Edit one file"], repo_path)
+    caplog.clear()
+    with caplog.at_level(logging.DEBUG):
+        main_cli(cmd)
+    assert f"{n_files - 1} hits, 1 misses" in caplog.text
+    assert get_directory_git_info(
+        vocdir, repo_path, ProvCache(cache_file, repo_path)
+    ) == (get_directory_git_info(vocdir, repo_path))
+
+
+def test_prov_from_git_parallel(git_repo_with_split_files, monkeypatch, caplog):
+    """Worker processes give the same files and the same log as a sequential run."""
+    repo_path, vocdir = git_repo_with_split_files
+    monkeypatch.chdir(repo_path)
+    cache_file = repo_path / "prov-cache.json"
+    vocabs = repo_path / "vocabularies"
+    vocabs.mkdir()
+    shutil.copytree(vocdir, vocabs / "voc1")
+    shutil.copytree(vocdir, vocabs / "voc2")
+    _run_git(["git", "add", "."], repo_path)
+    _run_git(["git", "commit", "-m", "Add vocabularies"], repo_path)
+
+    results = {}
+    for jobs, vocab in [("1", vocabs), ("2", vocabs), ("3", vocabs / "voc1")]:
+        outdir = repo_path / f"out{jobs}"
+        caplog.clear()
+        with caplog.at_level(logging.DEBUG):
+            main_cli(
+                [
+                    "transform",
+                    "-v",
+                    "--prov-from-git",
+                    "--jobs",
+                    jobs,
+                    "--prov-cache",
+                    str(cache_file),
+                    "--outdir",
+                    str(outdir),
+                    str(vocab),
+                ]
+            )
+        files = {
+            f.relative_to(outdir / vocab.name).as_posix(): f.read_text(encoding="utf-8")
+            for f in sorted(outdir.rglob("*.ttl"))
+        }
+        messages = [
+            r.getMessage().replace(str(outdir), "OUT")
+            for r in caplog.records
+            if r.name.startswith("voc4cat.transform")
+            and not r.getMessage().startswith("Provenance cache")
+        ]
+        results[jobs] = (files, messages)
+
+    assert sorted({f.split("/")[0] for f in results["1"][0]}) == ["voc1", "voc2"]
+    assert results["1"] == results["2"]
+    # one directory processed with parallel files
+    assert results["3"][0] == {
+        k.removeprefix("voc1/"): v
+        for k, v in results["1"][0].items()
+        if k.startswith("voc1/")
+    }
+    entries = json.loads(cache_file.read_text(encoding="utf-8"))["entries"]
+    assert len(entries) == len(list(vocabs.rglob("*.ttl")))
+    assert any("Added dct:created" in m for m in results["3"][1])
+
+
+def test_map_in_workers_keeps_log_order(caplog):
+    tasks = [(n,) for n in range(6)]
+    with caplog.at_level(logging.INFO):
+        assert map_in_workers(_square_and_log, tasks, jobs=3) == [
+            n * n for n in range(6)
+        ]
+    assert [r.getMessage() for r in caplog.records] == [
+        f"squared {n}" for n in range(6)
+    ]
+
+
+def _square_and_log(n):
+    logging.getLogger("voc4cat.test").info("squared %s", n)
+    return n * n
+
+
+ORDERED_COLLECTION_TTL = """\
+@prefix dcterms: <http://purl.org/dc/terms/> .
+@prefix ex: <http://example.org/> .
+@prefix skos: <http://www.w3.org/2004/02/skos/core#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+ex:coll a skos:OrderedCollection, skos:Collection ;
+    skos:prefLabel "ordered"@en ;
+    skos:memberList ( ex:c2 ex:c1 ex:c3 ) ;
+    dcterms:created "2020-01-01"^^xsd:date ;
+    dcterms:modified "2021-02-02"^^xsd:date .
+"""
+
+
+def test_content_fingerprint():
+    """Fingerprint ignores dates and blank node labels but not the content."""
+    graph1 = Graph().parse(data=ORDERED_COLLECTION_TTL, format="turtle")
+    graph2 = Graph().parse(data=ORDERED_COLLECTION_TTL, format="turtle")
+    assert set(graph1) != set(graph2)  # different blank node labels
+    assert _content_fingerprint(graph1) == _content_fingerprint(graph2)
+
+    graph2.remove((None, DCTERMS.created, None))
+    graph2.remove((None, DCTERMS.modified, None))
+    assert _content_fingerprint(graph1) == _content_fingerprint(graph2)
+
+    reordered = Graph().parse(
+        data=ORDERED_COLLECTION_TTL.replace("ex:c2 ex:c1", "ex:c1 ex:c2"),
+        format="turtle",
+    )
+    assert _content_fingerprint(graph1) != _content_fingerprint(reordered)
+
+
+def test_prov_cache_merged_from_workers(git_repo_with_split_files, monkeypatch):
+    """Caches updated in worker processes are merged and saved by the parent."""
+    repo_path, vocdir = git_repo_with_split_files
+    monkeypatch.chdir(repo_path)
+    vocabs = repo_path / "vocabularies"
+    vocabs.mkdir()
+    shutil.copytree(vocdir, vocabs / "voc1")
+    shutil.copytree(vocdir, vocabs / "voc2")
+    _run_git(["git", "add", "."], repo_path)
+    _run_git(["git", "commit", "-m", "Add vocabularies"], repo_path)
+
+    cache_file = repo_path / "prov-cache.json"
+    cache = ProvCache(cache_file, repo_path)
+    tasks = [
+        (vocabs / name, repo_path / "out" / name, None, cache, 1)
+        for name in ("voc1", "voc2")
+    ]
+    for worker_cache in map_in_workers(_prov_from_git_for_dir, tasks, jobs=2):
+        assert worker_cache is not cache
+        cache.merge(worker_cache)
+    assert not cache_file.exists()
+    cache.save()
+    entries = json.loads(cache_file.read_text(encoding="utf-8"))["entries"]
+    assert len(entries) == len(list(vocabs.rglob("*.ttl")))
+
+
+def test_diff_base_ordered_collection_keeps_dates(
+    git_repo_with_split_files, monkeypatch
+):
+    """Unchanged files with blank nodes keep their dates from the base version."""
+    repo_path, vocdir = git_repo_with_split_files
+    monkeypatch.chdir(repo_path)
+    coll_file = vocdir / "IDs0000xxx" / "coll.ttl"
+    coll_file.write_text(ORDERED_COLLECTION_TTL, encoding="utf-8")
+    _run_git(["git", "add", "."], repo_path)
+    _run_git(["git", "commit", "-m", "Add ordered collection"], repo_path)
+
+    # Strip dates and re-serialize (new blank node labels), then commit
+    graph = Graph().parse(coll_file, format="turtle")
+    graph.remove((None, DCTERMS.created, None))
+    graph.remove((None, DCTERMS.modified, None))
+    graph.serialize(destination=coll_file, format="longturtle")
+    _run_git(["git", "add", "."], repo_path)
+    _run_git(
+        ["git", "commit", "-m", "Strip dates", "--date", "2030-06-15T10:00:00"],
+        repo_path,
+    )
+
+    cache_file = repo_path / "prov-cache.json"
+    for _ in range(2):  # second run takes the base summaries from the cache
+        main_cli(
+            [
+                "transform",
+                "--prov-from-git",
+                "--diff-base",
+                "HEAD~1",
+                "--prov-cache",
+                str(cache_file),
+                "--inplace",
+                str(vocdir),
+            ]
+        )
+        graph = Graph().parse(coll_file, format="turtle")
+        coll_iri = next(iter(graph.subjects(SKOS.prefLabel, None)))
+        assert str(next(graph.objects(coll_iri, DCTERMS.created))) == "2020-01-01"
+        assert str(next(graph.objects(coll_iri, DCTERMS.modified))) == "2021-02-02"
+    data = json.loads(cache_file.read_text(encoding="utf-8"))
+    old_base = _run_git(["git", "rev-parse", "HEAD~1"], repo_path).stdout.strip()
+    assert data["base"] == old_base
+    rel_coll = coll_file.relative_to(repo_path).as_posix()
+    old_coll_blob = _run_git(
+        ["git", "rev-parse", f"HEAD~1:{rel_coll}"], repo_path
+    ).stdout.strip()
+    assert old_coll_blob in data["bases"]
+
+    # Summaries of another diff base are dropped.
+    _run_git(["git", "commit", "-am", "Restore dates"], repo_path)
+    main_cli(
+        [
+            "transform",
+            "--prov-from-git",
+            "--diff-base",
+            "HEAD~1",
+            "--prov-cache",
+            str(cache_file),
+            "--inplace",
+            str(vocdir),
+        ]
+    )
+    data = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert data["base"] != old_base
+    assert data["bases"]
+    assert old_coll_blob not in data["bases"]